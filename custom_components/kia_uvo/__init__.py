@@ -13,6 +13,7 @@ from homeassistant.const import (
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
 from homeassistant.helpers.device_registry import DeviceEntry
+from homeassistant.helpers.storage import Store
 
 from .const import (
     BRANDS,
@@ -26,8 +27,15 @@ from .const import (
     DOMAIN,
     REGIONS,
 )
-from .coordinator import HyundaiKiaConnectDataUpdateCoordinator
+from .coordinator import (
+    REQUEST_LEDGER_STORAGE_VERSION,
+    HyundaiKiaConnectDataUpdateCoordinator,
+    request_ledger_storage_key,
+    snapshot_storage_key,
+)
+from .http_pool import async_close_http_pool
 from .services import async_setup_services, async_unload_services
+from .snapshot import SNAPSHOT_STORAGE_VERSION
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -52,16 +60,25 @@ async def async_setup(hass: HomeAssistant, config_entry: ConfigEntry):
 async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     """Set up Hyundai / Kia Connect from a config entry."""
     coordinator = HyundaiKiaConnectDataUpdateCoordinator(hass, config_entry)
-    try:
-        await coordinator.async_config_entry_first_refresh()
-    except ConfigEntryAuthFailed as AuthError:
-        raise ConfigEntryAuthFailed(AuthError) from AuthError
-    except Exception as ex:
-        raise ConfigEntryNotReady(f"Config Not Ready: {ex}")
+    await coordinator.async_load_request_ledger()
+    # With a snapshot from the last run, entities come up with that state and
+    # the first refresh runs in the background instead of blocking setup.
+    warm_start = await coordinator.async_restore_snapshot()
+    if not warm_start:
+        try:
+            await coordinator.async_config_entry_first_refresh()
+        except ConfigEntryAuthFailed as AuthError:
+            raise ConfigEntryAuthFailed(AuthError) from AuthError
+        except Exception as ex:
+            raise ConfigEntryNotReady(f"Config Not Ready: {ex}")
 
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][config_entry.unique_id] = coordinator
     await hass.config_entries.async_forward_entry_setups(config_entry, PLATFORMS)
+    if warm_start:
+        config_entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} first refresh"
+        )
     async_setup_services(hass)
     return True
 
@@ -71,12 +88,24 @@ async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
     if unload_ok := await hass.config_entries.async_unload_platforms(
         config_entry, PLATFORMS
     ):
-        del hass.data[DOMAIN][config_entry.unique_id]
+        coordinator = hass.data[DOMAIN].pop(config_entry.unique_id)
+        await coordinator.async_shutdown()
     if not hass.data[DOMAIN]:
         async_unload_services(hass)
+        async_close_http_pool(hass)
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+    """Remove the entry's stored request ledger and vehicle snapshot."""
+    await Store(
+        hass, REQUEST_LEDGER_STORAGE_VERSION, request_ledger_storage_key(config_entry)
+    ).async_remove()
+    await Store(
+        hass, SNAPSHOT_STORAGE_VERSION, snapshot_storage_key(config_entry)
+    ).async_remove()
+
+
 async def async_migrate_entry(hass, config_entry: ConfigEntry):
     if config_entry.version == 1:
         _LOGGER.debug(f"{DOMAIN} - config data- {config_entry}")
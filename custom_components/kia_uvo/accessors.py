@@ -0,0 +1,80 @@
+"""Accessors compiled once per entity description.
+
+Vehicle entities used to resolve their state on every write: ``getattr``
+with the description key, a chain of key comparisons for the values that
+need a transform, and ``key + "_unit"`` built again for dynamic units. Here
+each description is compiled at setup into value, unit and attribute
+callables, so a state write is a couple of attribute lookups and nothing
+else.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import cache
+from operator import attrgetter
+from typing import Any, Final
+
+from hyundai_kia_connect_api import Vehicle
+
+from .const import CHARGING_CURRENTS, DYNAMIC_UNIT
+
+
+def _join_days(value: Any) -> Any:
+    if isinstance(value, list):
+        return ", ".join(str(day) for day in value)
+    return value
+
+
+# Transforms applied to the raw vehicle value, by description key.
+VALUE_TRANSFORMS: Final[dict[str, Callable[[Any], Any]]] = {
+    "ev_charging_current": CHARGING_CURRENTS.get,
+    "ev_first_departure_days": _join_days,
+    "ev_second_departure_days": _join_days,
+}
+
+# Extra state attributes, by description key.
+ATTRIBUTE_ACCESSORS: Final[dict[str, Callable[[Vehicle], dict[str, Any]]]] = {
+    "_geocode_name": lambda vehicle: {"address": vehicle._geocode_address},
+    "dtc_count": lambda vehicle: {"DTC Text": vehicle.dtc_descriptions},
+}
+
+
+def _none(vehicle: Vehicle) -> None:
+    return None
+
+
+def _constant(value: Any) -> Callable[[Vehicle], Any]:
+    return lambda vehicle: value
+
+
+@dataclass(frozen=True, slots=True)
+class Accessors:
+    """How an entity reads its value, unit and attributes from a vehicle."""
+
+    value: Callable[[Vehicle], Any]
+    unit: Callable[[Vehicle], str | None]
+    attributes: Callable[[Vehicle], dict[str, Any] | None]
+
+
+@cache
+def compile_accessors(key: str, unit: str | None = None) -> Accessors:
+    """Build the accessors for a description with ``key`` and native ``unit``.
+
+    Cached, so every vehicle's entity for the same description shares them.
+    """
+    getter = attrgetter(key)
+    transform = VALUE_TRANSFORMS.get(key)
+    if transform is None:
+        value = getter
+    else:
+
+        def value(vehicle: Vehicle) -> Any:
+            return transform(getter(vehicle))
+
+    return Accessors(
+        value=value,
+        unit=attrgetter(f"{key}_unit") if unit == DYNAMIC_UNIT else _constant(unit),
+        attributes=ATTRIBUTE_ACCESSORS.get(key, _none),
+    )
@@ -18,6 +18,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from hyundai_kia_connect_api import Vehicle
 
+from .changes import watched_fields
 from .const import DOMAIN
 from .coordinator import HyundaiKiaConnectDataUpdateCoordinator
 from .entity import HyundaiKiaConnectEntity
@@ -32,6 +33,8 @@ class HyundaiKiaBinarySensorEntityDescription(BinarySensorEntityDescription):
     is_on: Callable[[Vehicle], bool] | None = None
     on_icon: str | None = None
     off_icon: str | None = None
+    # Vehicle field is_on reads, when it is not the key itself.
+    field: str | None = None
 
 
 SENSOR_DESCRIPTIONS: Final[tuple[HyundaiKiaBinarySensorEntityDescription, ...]] = (
@@ -441,6 +444,7 @@ SENSOR_DESCRIPTIONS: Final[tuple[HyundaiKiaBinarySensorEntityDescription, ...]]
         key="front_left_seat_heater_on",
         translation_key="front_left_seat_heater_on",
         is_on=lambda vehicle: vehicle.front_left_seat_status,
+        field="front_left_seat_status",
         on_icon="mdi:seat-heater",
         off_icon="mdi:seat-outline",
         entity_category=EntityCategory.DIAGNOSTIC,
@@ -449,6 +453,7 @@ SENSOR_DESCRIPTIONS: Final[tuple[HyundaiKiaBinarySensorEntityDescription, ...]]
         key="front_right_seat_heater_on",
         translation_key="front_right_seat_heater_on",
         is_on=lambda vehicle: vehicle.front_right_seat_status,
+        field="front_right_seat_status",
         on_icon="mdi:seat-heater",
         off_icon="mdi:seat-outline",
         entity_category=EntityCategory.DIAGNOSTIC,
@@ -457,6 +462,7 @@ SENSOR_DESCRIPTIONS: Final[tuple[HyundaiKiaBinarySensorEntityDescription, ...]]
         key="rear_left_seat_heater_on",
         translation_key="rear_left_seat_heater_on",
         is_on=lambda vehicle: vehicle.rear_left_seat_status,
+        field="rear_left_seat_status",
         on_icon="mdi:seat-heater",
         off_icon="mdi:seat-outline",
         entity_category=EntityCategory.DIAGNOSTIC,
@@ -465,6 +471,7 @@ SENSOR_DESCRIPTIONS: Final[tuple[HyundaiKiaBinarySensorEntityDescription, ...]]
         key="rear_right_seat_heater_on",
         translation_key="rear_right_seat_heater_on",
         is_on=lambda vehicle: vehicle.rear_right_seat_status,
+        field="rear_right_seat_status",
         on_icon="mdi:seat-heater",
         off_icon="mdi:seat-outline",
         entity_category=EntityCategory.DIAGNOSTIC,
@@ -565,15 +572,22 @@ async def async_setup_entry(
 ) -> None:
     """Set up binary_sensor platform."""
     coordinator = hass.data[DOMAIN][config_entry.unique_id]
-    entities: list[HyundaiKiaConnectBinarySensor] = []
-    for vehicle_id in coordinator.vehicle_manager.vehicles:
-        vehicle: Vehicle = coordinator.vehicle_manager.vehicles[vehicle_id]
-        for description in SENSOR_DESCRIPTIONS:
-            if getattr(vehicle, description.key, None) is not None:
-                entities.append(
-                    HyundaiKiaConnectBinarySensor(coordinator, description, vehicle)
-                )
-    async_add_entities(entities)
+
+    def vehicle_entities(vehicle: Vehicle) -> list[HyundaiKiaConnectBinarySensor]:
+        capabilities = coordinator.capabilities.get(vehicle)
+        return [
+            HyundaiKiaConnectBinarySensor(coordinator, description, vehicle)
+            for description in SENSOR_DESCRIPTIONS
+            if capabilities.has(description.key)
+        ]
+
+    config_entry.async_on_unload(
+        coordinator.entity_factories.register(
+            vehicle_entities,
+            async_add_entities,
+            coordinator.vehicle_manager.vehicles.values(),
+        )
+    )
     return True
 
 
@@ -593,14 +607,16 @@ class HyundaiKiaConnectBinarySensor(BinarySensorEntity, HyundaiKiaConnectEntity)
         super().__init__(coordinator, vehicle)
         self.entity_description: HyundaiKiaBinarySensorEntityDescription = description
         self._attr_unique_id = f"{DOMAIN}_{vehicle.id}_{description.key}"
+        self._watched_fields = watched_fields(description.field or description.key)
+        self._is_on = description.is_on
         if description.entity_category:
             self._attr_entity_category = description.entity_category
 
     @property
     def is_on(self) -> bool | None:
         """Return true if the binary sensor is on."""
-        if self.entity_description.is_on is not None:
-            return self.entity_description.is_on(self.vehicle)
+        if self._is_on is not None:
+            return self._is_on(self.vehicle)
         return None
 
     @property
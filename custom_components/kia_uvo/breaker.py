@@ -0,0 +1,99 @@
+"""Circuit breaker with back-off for a failing backend.
+
+Polling calls report their outcome here. Consecutive failures grow a
+back-off multiplicatively (doubling from ``BACKOFF_STEP`` up to
+``MAX_BACKOFF``) and, past ``FAILURE_THRESHOLD`` failures, open the circuit:
+no polling call is made until the back-off has passed. The next cycle then
+runs half-open, as a probe; if it fails the circuit opens again for twice as
+long, if it succeeds the circuit closes. While closed, each success takes
+a fixed recovery step (``MAX_BACKOFF / RECOVERY_STEPS``, at least one
+step) off the back-off, which the coordinator adds to every vehicle's
+interval: multiplicative increase, additive decrease. So the normal cadence
+comes back over a few polls rather than in one burst against a backend that
+just recovered, and within ``RECOVERY_STEPS`` successes even after the
+longest back-off.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+from enum import StrEnum
+from typing import Any
+
+FAILURE_THRESHOLD = 3
+BACKOFF_STEP = dt.timedelta(minutes=1)
+MAX_BACKOFF = dt.timedelta(hours=2)
+# Successes it takes to work off the longest back-off.
+RECOVERY_STEPS = 8
+
+
+class BreakerState(StrEnum):
+    """Circuit states."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Failure tracking and back-off for one account's polling."""
+
+    def __init__(
+        self,
+        failure_threshold: int = FAILURE_THRESHOLD,
+        step: dt.timedelta = BACKOFF_STEP,
+        max_backoff: dt.timedelta = MAX_BACKOFF,
+    ) -> None:
+        """Initialize closed, with no back-off."""
+        self.failure_threshold = failure_threshold
+        self.step = step
+        self.max_backoff = max_backoff
+        self.recovery_step = max(step, max_backoff / RECOVERY_STEPS)
+        self.state = BreakerState.CLOSED
+        self.failures = 0
+        self.backoff = dt.timedelta(0)
+        self.retry_at: dt.datetime | None = None
+        self.last_error: str | None = None
+        self.times_opened = 0
+
+    def allow(self, now: dt.datetime) -> bool:
+        """Return whether a polling call may be made now; an open circuit
+        whose back-off has passed goes half-open and allows a probe."""
+        if self.state is BreakerState.OPEN:
+            if self.retry_at is not None and now < self.retry_at:
+                return False
+            self.state = BreakerState.HALF_OPEN
+        return True
+
+    def record_success(self) -> None:
+        """Close the circuit and take one recovery step off the back-off."""
+        self.state = BreakerState.CLOSED
+        self.failures = 0
+        self.retry_at = None
+        self.backoff = max(self.backoff - self.recovery_step, dt.timedelta(0))
+
+    def record_failure(self, now: dt.datetime, error: BaseException) -> None:
+        """Double the back-off and open the circuit once failures reach the
+        threshold, or straight away when the half-open probe failed."""
+        self.failures += 1
+        self.last_error = type(error).__name__
+        self.backoff = min(max(self.backoff * 2, self.step), self.max_backoff)
+        if (
+            self.state is BreakerState.HALF_OPEN
+            or self.failures >= self.failure_threshold
+        ):
+            if self.state is not BreakerState.OPEN:
+                self.times_opened += 1
+            self.state = BreakerState.OPEN
+            self.retry_at = now + self.backoff
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-friendly view for diagnostics."""
+        return {
+            "state": self.state.value,
+            "consecutive_failures": self.failures,
+            "backoff_seconds": self.backoff.total_seconds(),
+            "retry_at": self.retry_at.isoformat() if self.retry_at else None,
+            "last_error": self.last_error,
+            "times_opened": self.times_opened,
+        }
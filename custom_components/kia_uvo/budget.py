@@ -0,0 +1,127 @@
+"""API request budget for Hyundai / Kia Connect.
+
+The EU backends enforce a daily request quota per account; once it is spent,
+remote commands fail until midnight. The ledger counts every HTTP request
+the account's library calls send (one library call can send several),
+split by endpoint family, for the current local day and is persisted so a
+restart does not forget what was already spent. Logins made outside the
+account's sessions, such as the config flow's, are not counted.
+
+With a daily budget configured, polling is paced so the polls left after the
+command reserve are spread over the rest of the day, and polling stops once
+only the reserve is left. Commands are never held back by the budget; the
+reserve exists so they still have quota when the user needs them.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+from dataclasses import dataclass, field
+from enum import StrEnum
+from typing import Any
+
+
+class RequestFamily(StrEnum):
+    """Endpoint family a call is counted against."""
+
+    CACHED = "cached"  # cmm/gvi: server-side cached status
+    FORCED = "forced"  # rems/rvs: wakes the car for fresh status
+    CONTROL = "control"  # commands and their status checks
+    AUTH = "auth"  # logins and token checks
+
+
+@dataclass
+class RequestLedger:
+    """HTTP requests made per family on one local day."""
+
+    day: dt.date
+    counts: dict[RequestFamily, int] = field(
+        default_factory=lambda: dict.fromkeys(RequestFamily, 0)
+    )
+
+    @property
+    def total(self) -> int:
+        """Requests made today across all families."""
+        return sum(self.counts.values())
+
+    def rollover(self, today: dt.date) -> None:
+        """Start a fresh count when the local day has changed."""
+        if today != self.day:
+            self.day = today
+            self.counts = dict.fromkeys(RequestFamily, 0)
+
+    def record(self, family: RequestFamily, today: dt.date, calls: int = 1) -> None:
+        """Count requests against a family for today."""
+        self.rollover(today)
+        self.counts[family] += calls
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the JSON form kept in storage."""
+        return {"day": self.day.isoformat(), "counts": dict(self.counts)}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any] | None, today: dt.date) -> RequestLedger:
+        """Restore a stored ledger, or start today's if none or unreadable."""
+        ledger = cls(day=today)
+        if not data:
+            return ledger
+        try:
+            ledger.day = dt.date.fromisoformat(data["day"])
+            for family in RequestFamily:
+                ledger.counts[family] = int(data["counts"].get(family, 0))
+        except (KeyError, TypeError, ValueError):
+            return cls(day=today)
+        ledger.rollover(today)
+        return ledger
+
+
+@dataclass(frozen=True)
+class RequestBudget:
+    """Daily budget (0 = unlimited) and the part reserved for commands."""
+
+    daily_budget: int
+    command_reserve: int
+
+    @property
+    def enabled(self) -> bool:
+        """Return True when a daily budget is configured."""
+        return self.daily_budget > 0
+
+    def remaining(self, ledger: RequestLedger) -> int | None:
+        """Requests left today, or None without a budget."""
+        if not self.enabled:
+            return None
+        return max(self.daily_budget - ledger.total, 0)
+
+    def polls_remaining(self, ledger: RequestLedger) -> int | None:
+        """Requests left for polling once the command reserve is set aside."""
+        remaining = self.remaining(ledger)
+        if remaining is None:
+            return None
+        return max(remaining - self.command_reserve, 0)
+
+    def allows_poll(self, ledger: RequestLedger) -> bool:
+        """Return True while polling has budget left today."""
+        polls_remaining = self.polls_remaining(ledger)
+        return polls_remaining is None or polls_remaining > 0
+
+    def pacing_interval(
+        self, ledger: RequestLedger, now: dt.datetime, vehicle_count: int
+    ) -> int:
+        """Shortest per-vehicle poll interval (seconds) that makes the
+        polling budget last until midnight; 0 without a budget."""
+        polls_remaining = self.polls_remaining(ledger)
+        if polls_remaining is None:
+            return 0
+        seconds_left = (next_midnight(now) - now).total_seconds()
+        per_vehicle = polls_remaining / max(vehicle_count, 1)
+        if per_vehicle < 1:
+            return int(seconds_left)
+        return int(seconds_left / per_vehicle)
+
+
+def next_midnight(now: dt.datetime) -> dt.datetime:
+    """Return the start of the next day in ``now``'s timezone."""
+    return dt.datetime.combine(
+        now.date() + dt.timedelta(days=1), dt.time(), tzinfo=now.tzinfo
+    )
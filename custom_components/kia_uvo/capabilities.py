@@ -0,0 +1,175 @@
+"""Per-vehicle capability index for platform setup.
+
+Each platform used to walk every vehicle and probe each of its descriptions
+on the vehicle, with the sensor platform layering its own special cases on
+top. The coordinator now keeps one ``VehicleCapabilities`` per vehicle that
+memoizes those answers, so a field or control is probed once per vehicle
+whichever platforms ask about it, and the special cases live here.
+
+A vehicle's answers are dropped only when its feature set changes: the set
+of fields that hold a value. Fields that changed value but stayed set keep
+the memo.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from dataclasses import fields
+from typing import Any
+
+from hyundai_kia_connect_api import Vehicle
+from hyundai_kia_connect_api.const import ENGINE_TYPES
+
+from .changes import normalize_field
+
+
+def _present(value: Any) -> bool:
+    if isinstance(value, (list, dict)):
+        return bool(value)
+    return value is not None
+
+
+def feature_set(vehicle: Vehicle) -> frozenset[str]:
+    """Return the normalized names of the vehicle's fields that hold a value
+    (empty lists and dicts count as no value)."""
+    return frozenset(
+        normalize_field(field.name)
+        for field in fields(vehicle)
+        if _present(getattr(vehicle, field.name))
+    )
+
+
+def _has_field(key: str) -> Callable[[Vehicle], bool]:
+    return lambda vehicle: getattr(vehicle, key, None) is not None
+
+
+def _air_temperature(vehicle: Vehicle) -> bool:
+    # The setpoint is transient — it is None while climate is off (USA
+    # returns airTemp.value "OFF"), so don't gate on it. Gate on climate
+    # presence (air_control_is_on, the same signal the climate entity uses)
+    # to avoid creating an unusable sensor on vehicles that report no
+    # climate. A None setpoint -> HA `unknown`; the real setpoint arrives on
+    # the next poll.
+    return vehicle.air_control_is_on is not None or vehicle._air_temperature is not None
+
+
+def _car_battery_percentage(vehicle: Vehicle) -> bool:
+    # The 12V SoC is transient — None while the telematics unit is asleep,
+    # after a 12V reset, or when the status payload omits it. Don't gate
+    # creation on it: a None at setup (e.g. a version-update reload) means
+    # the entity isn't yielded and HA marks it "no longer provided", with no
+    # return until the next reload. Always create; None -> HA `unknown`, the
+    # real SoC arrives on the next poll. See #1803.
+    return True
+
+
+def _ev_charging_power(vehicle: Vehicle) -> bool:
+    # Charging power is transient and usually None at setup while the
+    # vehicle is unplugged. Create the sensor for electrified vehicles so a
+    # later coordinator poll can publish the value without requiring an
+    # integration reload.
+    return (
+        vehicle.engine_type in (ENGINE_TYPES.EV, ENGINE_TYPES.PHEV)
+        or vehicle.ev_charging_power is not None
+    )
+
+
+def _tire_pressure(key: str) -> Callable[[Vehicle], bool]:
+    # Transient like _air_temperature above: some backends (AU/NZ) report
+    # the TPMS no-data sentinel whenever the car is parked — nearly always
+    # the case at setup — so don't gate on the value. The parsed unit is the
+    # capability signal: non-None exactly for direct-TPMS vehicles (known
+    # PressureUnit), None for indirect TPMS (PressureUnit 3, e.g. KONA —
+    # #1786) and old-protocol vehicles, which never report a numeric
+    # pressure. A None pressure -> HA `unknown` until a poll catches the car
+    # driving.
+    return lambda vehicle: (
+        getattr(vehicle, key, None) is not None
+        or vehicle.tire_pressure_unit is not None
+    )
+
+
+# Sensors whose creation does not follow the presence of their value.
+SENSOR_CAPABILITIES: dict[str, Callable[[Vehicle], bool]] = {
+    "_air_temperature": _air_temperature,
+    "car_battery_percentage": _car_battery_percentage,
+    "ev_charging_power": _ev_charging_power,
+}
+
+
+def _sensor_capability(key: str) -> Callable[[Vehicle], bool]:
+    if key in SENSOR_CAPABILITIES:
+        return SENSOR_CAPABILITIES[key]
+    if key.startswith("tire_pressure_"):
+        return _tire_pressure(key)
+    return _has_field(key)
+
+
+class VehicleCapabilities:
+    """Memoized answers to what one vehicle supports."""
+
+    def __init__(self, vehicle: Vehicle) -> None:
+        """Initialize for ``vehicle`` with nothing probed yet."""
+        self.vehicle = vehicle
+        self.features = feature_set(vehicle)
+        self._answers: dict[str, bool] = {}
+
+    def supports(self, name: str, predicate: Callable[[Vehicle], Any]) -> bool:
+        """Return ``predicate(vehicle)``, memoized under ``name``."""
+        answer = self._answers.get(name)
+        if answer is None:
+            answer = self._answers[name] = bool(predicate(self.vehicle))
+        return answer
+
+    def has(self, key: str) -> bool:
+        """Return whether the vehicle reports a value for ``key``."""
+        return self.supports(key, _has_field(key))
+
+    def has_sensor(self, key: str) -> bool:
+        """Return whether the vehicle gets the sensor keyed on ``key``."""
+        return self.supports(f"sensor.{key}", _sensor_capability(key))
+
+    def refresh(self) -> bool:
+        """Drop the memo if the feature set changed; return whether it did."""
+        features = feature_set(self.vehicle)
+        if features == self.features:
+            return False
+        self.features = features
+        self._answers.clear()
+        return True
+
+
+class CapabilityIndex:
+    """Capabilities of all vehicles of an account."""
+
+    def __init__(self) -> None:
+        """Initialize with no vehicles indexed."""
+        self._vehicles: dict[str, VehicleCapabilities] = {}
+
+    def get(self, vehicle: Vehicle) -> VehicleCapabilities:
+        """Return the vehicle's capabilities, creating them on first use."""
+        capabilities = self._vehicles.get(vehicle.id)
+        if capabilities is None or capabilities.vehicle is not vehicle:
+            capabilities = self._vehicles[vehicle.id] = VehicleCapabilities(vehicle)
+        return capabilities
+
+    def update(
+        self,
+        vehicles: Mapping[str, Vehicle],
+        changed_fields: Mapping[str, frozenset[str] | None],
+    ) -> set[str]:
+        """Re-check the feature sets of vehicles that changed; return the ids
+        of those whose feature set changed."""
+        changed_ids: set[str] = set()
+        for vehicle_id, vehicle in vehicles.items():
+            capabilities = self._vehicles.get(vehicle_id)
+            if capabilities is None or changed_fields.get(vehicle_id) == frozenset():
+                continue
+            if capabilities.vehicle is not vehicle:
+                self._vehicles[vehicle_id] = VehicleCapabilities(vehicle)
+                changed_ids.add(vehicle_id)
+            elif capabilities.refresh():
+                changed_ids.add(vehicle_id)
+        for vehicle_id in self._vehicles.keys() - vehicles.keys():
+            del self._vehicles[vehicle_id]
+        return changed_ids
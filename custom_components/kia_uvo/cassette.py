@@ -0,0 +1,262 @@
+"""Record the raw HTTP traffic behind the library calls.
+
+Parsing and entity creation bugs often depend on one region's payloads. A
+recording captures every request/response pair the coordinator's library
+calls make, for the next cycles (listener fan-outs after an update, or
+finished commands), into a gzipped JSON cassette. Request and response
+bodies, query strings and the few kept headers go through ``redact.redact``,
+keeping the payloads' shape so they still parse; cookies and all other
+headers are dropped. The account's vehicle ids are swapped for stable
+placeholders (``vehicle-1``, ...) everywhere, URL paths included, so a
+replay still finds each vehicle's endpoints. Bodies that are not JSON or a
+form (such as EU login pages) are kept verbatim.
+
+A recording hooks only the adapters mounted on the account's API sessions
+(normally the shared adapter of ``http_pool``), and only captures calls made
+on threads running a function wrapped by ``CassetteRecorder.wrap``, so other
+accounts' and integrations' traffic is left out. Cassettes are replayed by
+the test harness (``tests/benchmarks/cassette_replay.py``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import threading
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from requests import PreparedRequest, Response, Session
+from requests.adapters import HTTPAdapter
+
+from .redact import redact
+
+CASSETTE_VERSION = 1
+
+_KEPT_HEADERS = ("content-type", "location")
+# Redacted in recordings only; diagnostics keep vehicle ids readable.
+_RECORDED_SENSITIVE = ("vehicleid", "vehiclekey")
+
+_local = threading.local()
+_hook_lock = threading.Lock()
+# Adapters hooked for recording and how many recorders use each.
+_recorded_adapters: dict[HTTPAdapter, int] = {}
+
+
+def _substitute(text: str, placeholders: dict[str, str]) -> str:
+    for secret, placeholder in placeholders.items():
+        text = text.replace(secret, placeholder)
+    return text
+
+
+def _redact_url(url: str, placeholders: dict[str, str]) -> str:
+    url = _substitute(url, placeholders)
+    parts = urlsplit(url)
+    if not parts.query:
+        return url
+    query = redact(
+        dict(parse_qsl(parts.query, keep_blank_values=True)),
+        extra=_RECORDED_SENSITIVE,
+        keep=frozenset(placeholders.values()),
+    )
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+def _redact_body(
+    body: bytes | str | None, content_type: str, placeholders: dict[str, str]
+) -> Any:
+    """Parse a JSON or form body and redact it; other text is kept as-is."""
+    if not body:
+        return None
+    if isinstance(body, bytes):
+        body = body.decode("utf-8", errors="replace")
+    body = _substitute(body, placeholders)
+    options = {
+        "keep_structure": True,
+        "extra": _RECORDED_SENSITIVE,
+        "keep": frozenset(placeholders.values()),
+    }
+    try:
+        return redact(json.loads(body), **options)
+    except ValueError:
+        pass
+    if "application/x-www-form-urlencoded" in content_type:
+        return redact(dict(parse_qsl(body, keep_blank_values=True)), **options)
+    return body
+
+
+@dataclass
+class Interaction:
+    """One request and the response it got, redacted."""
+
+    method: str
+    url: str
+    request: Any
+    status: int
+    headers: dict[str, str]
+    response: Any
+
+    @classmethod
+    def capture(
+        cls,
+        request: PreparedRequest,
+        response: Response,
+        placeholders: dict[str, str] | None = None,
+    ) -> Interaction:
+        """Build a redacted interaction from a sent request and its response,
+        replacing each key of ``placeholders`` found in it by its value."""
+        placeholders = placeholders or {}
+        headers = {
+            name: _redact_url(value, placeholders)
+            if name.lower() == "location"
+            else value
+            for name, value in response.headers.items()
+            if name.lower() in _KEPT_HEADERS
+        }
+        return cls(
+            method=(request.method or "GET").upper(),
+            url=_redact_url(request.url or "", placeholders),
+            request=_redact_body(
+                request.body, request.headers.get("Content-Type", ""), placeholders
+            ),
+            status=response.status_code,
+            headers=redact(headers),
+            response=_redact_body(
+                response.content,
+                response.headers.get("Content-Type", ""),
+                placeholders,
+            ),
+        )
+
+
+@dataclass
+class Cassette:
+    """Recorded interactions plus what is needed to replay them."""
+
+    metadata: dict[str, Any] = field(default_factory=dict)
+    interactions: list[Interaction] = field(default_factory=list)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-friendly dict."""
+        return {
+            "version": CASSETTE_VERSION,
+            "metadata": self.metadata,
+            "interactions": [asdict(item) for item in self.interactions],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Cassette:
+        """Build a cassette from ``as_dict`` output."""
+        if data.get("version") != CASSETTE_VERSION:
+            raise ValueError(f"Unsupported cassette version {data.get('version')}")
+        return cls(
+            metadata=data.get("metadata", {}),
+            interactions=[Interaction(**item) for item in data["interactions"]],
+        )
+
+    def dump(self, path: str | Path) -> None:
+        """Write the cassette as compact, gzipped JSON. Blocking."""
+        payload = json.dumps(self.as_dict(), separators=(",", ":"), default=str)
+        with gzip.open(path, "wt", encoding="utf-8") as file:
+            file.write(payload)
+
+    @classmethod
+    def load(cls, path: str | Path) -> Cassette:
+        """Read a cassette written by ``dump``. Blocking."""
+        with gzip.open(path, "rt", encoding="utf-8") as file:
+            return cls.from_dict(json.load(file))
+
+
+def _record_send(
+    send: Callable[..., Response], request: PreparedRequest, **kwargs: Any
+) -> Response:
+    response = send(request, **kwargs)
+    recorder: CassetteRecorder | None = getattr(_local, "recorder", None)
+    if recorder is not None:
+        recorder.add(Interaction.capture(request, response, recorder.placeholders))
+    return response
+
+
+def _hook_adapter(adapter: HTTPAdapter) -> None:
+    with _hook_lock:
+        users = _recorded_adapters.get(adapter, 0)
+        if users == 0:
+            adapter.send = partial(_record_send, adapter.send)
+        _recorded_adapters[adapter] = users + 1
+
+
+def _unhook_adapter(adapter: HTTPAdapter) -> None:
+    with _hook_lock:
+        users = _recorded_adapters.pop(adapter) - 1
+        if users:
+            _recorded_adapters[adapter] = users
+        else:
+            del adapter.send
+
+
+class CassetteRecorder:
+    """One recording session over the next ``cycles`` cycles."""
+
+    def __init__(
+        self,
+        cycles: int,
+        done: asyncio.Future,
+        metadata: dict[str, Any] | None = None,
+        vehicle_ids: Iterable[str] = (),
+    ) -> None:
+        """Initialize; ``done`` resolves once enough cycles have run and
+        ``vehicle_ids`` are replaced by placeholders in what is recorded."""
+        self.placeholders = {
+            vehicle_id: f"vehicle-{index}"
+            for index, vehicle_id in enumerate(vehicle_ids, start=1)
+        }
+        self.target = cycles
+        self.cycles = 0
+        self.done = done
+        self.cassette = Cassette(metadata=dict(metadata or {}))
+        self._lock = threading.Lock()
+        self._adapters: set[HTTPAdapter] = set()
+
+    def start(self, sessions: Iterable[Session]) -> None:
+        """Start capturing calls made through ``wrap`` on ``sessions``."""
+        self._adapters = {
+            adapter for session in sessions for adapter in session.adapters.values()
+        }
+        for adapter in self._adapters:
+            _hook_adapter(adapter)
+
+    def wrap(self, fn: Callable[..., Any]) -> Callable[..., Any]:
+        """Return ``fn`` with its HTTP traffic recorded on whichever worker
+        thread runs it."""
+
+        def run(*args: Any) -> Any:
+            _local.recorder = self
+            try:
+                return fn(*args)
+            finally:
+                _local.recorder = None
+
+        return run
+
+    def add(self, interaction: Interaction) -> None:
+        """Append one captured interaction."""
+        with self._lock:
+            self.cassette.interactions.append(interaction)
+
+    def cycle_done(self) -> None:
+        """Count one finished cycle and resolve ``done`` at the target."""
+        self.cycles += 1
+        if self.cycles >= self.target and not self.done.done():
+            self.done.set_result(None)
+
+    def stop(self) -> Cassette:
+        """Stop capturing and return the recorded cassette."""
+        for adapter in self._adapters:
+            _unhook_adapter(adapter)
+        self._adapters = set()
+        return self.cassette
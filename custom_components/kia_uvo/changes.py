@@ -0,0 +1,122 @@
+"""Per-vehicle change tracking for entity updates.
+
+After each coordinator update the tracker snapshots every vehicle's fields
+and diffs them against the previous snapshot. Entities compare the changed
+field names with the fields they read and skip their state write when none
+of them moved, so an unchanged poll no longer rewrites every entity.
+
+Field names are normalized by stripping the leading underscore, so an
+entity keyed on the ``odometer`` property and one keyed on the
+``_air_temperature`` backing field both match the dataclass field.
+
+Besides the vehicle fields, the snapshot holds the vehicle's polling
+schedule under ``SCHEDULE_FIELD``, so entities showing the scheduler's
+state are woken when it moves without any vehicle field changing.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from copy import deepcopy
+from dataclasses import fields
+from typing import Any
+
+from hyundai_kia_connect_api import Vehicle
+
+# Snapshot key of the polling schedule passed to VehicleChangeTracker.update.
+SCHEDULE_FIELD = "polling_schedule"
+
+# Fields that move on every poll without any entity-visible change, and the
+# schedule. They only wake entities that watch them explicitly (the raw data
+# blob, the last-scanned and the polling interval sensors).
+NOISY_FIELDS = frozenset({"data", "last_scanned_at", SCHEDULE_FIELD})
+
+
+def normalize_field(name: str) -> str:
+    """Map a property or backing field name to its snapshot key."""
+    return name.lstrip("_")
+
+
+def watched_fields(key: str, *extra: str) -> frozenset[str]:
+    """Fields an entity keyed on ``key`` reads: the value, its unit and any
+    extra fields it shows in attributes."""
+    key = normalize_field(key)
+    return frozenset({key, f"{key}_unit", *(normalize_field(name) for name in extra)})
+
+
+def _copy(value: Any) -> Any:
+    # Some backends update containers in place (the CA API writes into
+    # vehicle.data), so the snapshot keeps its own copy of mutable values and
+    # compares them by value on the next poll.
+    if isinstance(value, (dict, list, set)):
+        return deepcopy(value)
+    return value
+
+
+def snapshot(vehicle: Vehicle) -> dict[str, Any]:
+    """Return the vehicle's current field values keyed by normalized name."""
+    return {
+        normalize_field(field.name): _copy(getattr(vehicle, field.name))
+        for field in fields(vehicle)
+    }
+
+
+def has_changed(changed: frozenset[str] | None, watched: frozenset[str] | None) -> bool:
+    """Return True when an entity watching ``watched`` must write its state.
+
+    ``changed`` is None when there is no previous snapshot to diff against;
+    ``watched`` is None for entities that read the whole vehicle.
+    """
+    if changed is None:
+        return True
+    if watched is None:
+        return not changed <= NOISY_FIELDS
+    return not changed.isdisjoint(watched)
+
+
+class VehicleChangeTracker:
+    """Hold the last snapshot per vehicle and report what changed."""
+
+    def __init__(self) -> None:
+        """Initialize with no snapshots."""
+        self._snapshots: dict[str, dict[str, Any]] = {}
+
+    def update(
+        self,
+        vehicles: Mapping[str, Vehicle],
+        schedules: Mapping[str, Any] | None = None,
+    ) -> dict[str, frozenset[str] | None]:
+        """Snapshot all vehicles and their ``schedules``; return the changed
+        fields per vehicle id, or None for a vehicle seen for the first time."""
+        changes: dict[str, frozenset[str] | None] = {}
+        for vehicle_id, vehicle in vehicles.items():
+            current = snapshot(vehicle)
+            if schedules is not None:
+                current[SCHEDULE_FIELD] = schedules.get(vehicle_id)
+            previous = self._snapshots.get(vehicle_id)
+            self._snapshots[vehicle_id] = current
+            if previous is None:
+                changes[vehicle_id] = None
+                continue
+            changes[vehicle_id] = frozenset(
+                name
+                for name, value in current.items()
+                if _differs(previous.get(name), value)
+            )
+        self._forget(vehicles.keys())
+        return changes
+
+    def _forget(self, vehicle_ids: Iterable[str]) -> None:
+        for vehicle_id in self._snapshots.keys() - set(vehicle_ids):
+            del self._snapshots[vehicle_id]
+
+
+def _differs(old: Any, new: Any) -> bool:
+    # Immutable values the library did not replace are the same object;
+    # mutable ones are snapshot copies and always compared by value.
+    if old is new:
+        return False
+    try:
+        return bool(old != new)
+    except Exception:
+        return True
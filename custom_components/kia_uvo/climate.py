@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from time import sleep
 from typing import ClassVar
 
 from homeassistant.components.climate import ClimateEntity, ClimateEntityDescription
@@ -15,10 +15,8 @@ from homeassistant.components.climate.const import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
 from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from hyundai_kia_connect_api import ClimateRequestOptions, Vehicle, VehicleManager
-from hyundai_kia_connect_api.exceptions import UnsupportedControlError
 
 from .const import DOMAIN
 from .coordinator import HyundaiKiaConnectDataUpdateCoordinator
@@ -34,14 +32,25 @@ async def async_setup_entry(
 ) -> None:
     """Set up climate platform."""
     coordinator = hass.data[DOMAIN][config_entry.unique_id]
-    entities = []
-    for vehicle in coordinator.vehicle_manager.vehicles.values():
-        if vehicle.air_control_is_on is not None:
-            entities.append(HyundaiKiaCarClimateControlSwitch(coordinator, vehicle))
-    async_add_entities(entities, True)
+
+    def vehicle_entities(vehicle: Vehicle) -> list[HyundaiKiaCarClimateControlSwitch]:
+        if not coordinator.capabilities.get(vehicle).has("air_control_is_on"):
+            return []
+        return [HyundaiKiaCarClimateControlSwitch(coordinator, vehicle)]
+
+    config_entry.async_on_unload(
+        coordinator.entity_factories.register(
+            vehicle_entities,
+            async_add_entities,
+            coordinator.vehicle_manager.vehicles.values(),
+            update_before_add=True,
+        )
+    )
 
 
 PARALLEL_UPDATES = 1
+# Seconds between stopping and restarting climate to change the temperature.
+CLIMATE_RESTART_DELAY = 5.0
 
 
 class HyundaiKiaCarClimateControlSwitch(HyundaiKiaConnectEntity, ClimateEntity):
@@ -216,24 +225,12 @@ class HyundaiKiaCarClimateControlSwitch(HyundaiKiaConnectEntity, ClimateEntity):
 
     async def async_set_hvac_mode(self, hvac_mode):
         """Set the operation mode of the in-car climate control."""
-
-        try:
-            if hvac_mode == HVACMode.OFF:
-                await self.hass.async_add_executor_job(
-                    self.vehicle_manager.stop_climate,
-                    self.vehicle.id,
-                )
-            else:
-                await self.hass.async_add_executor_job(
-                    self.vehicle_manager.start_climate,
-                    self.vehicle.id,
-                    self.climate_config,
-                )
-        except UnsupportedControlError as ex:
-            raise HomeAssistantError(
-                f"Climate control not supported by this vehicle: {ex}"
-            ) from ex
-        self.coordinator.async_request_refresh()
+        if hvac_mode == HVACMode.OFF:
+            await self.coordinator.async_stop_climate(self.vehicle.id)
+        else:
+            await self.coordinator.async_start_climate(
+                self.vehicle.id, self.climate_config
+            )
         self.async_write_ha_state()
 
     async def async_set_temperature(self, **kwargs):
@@ -244,23 +241,12 @@ class HyundaiKiaCarClimateControlSwitch(HyundaiKiaConnectEntity, ClimateEntity):
         # activation is controlled separately, but if system is turned on
         # and temp has changed, send update to car
         if self.hvac_mode != HVACMode.OFF and old_temp != self.climate_config.set_temp:
-            try:
-                # Car does not accept changing the temp after starting the heating. So we have to turn off first
-                await self.hass.async_add_executor_job(
-                    self.vehicle_manager.stop_climate,
-                    self.vehicle.id,
-                )
-                # Wait, because the car ignores the start_climate command if it comes too fast after stopping
-                # TODO: replace with some more event driven method
-                await self.hass.async_add_executor_job(sleep, 5.0)
-                await self.hass.async_add_executor_job(
-                    self.vehicle_manager.start_climate,
-                    self.vehicle.id,
-                    self.climate_config,
-                )
-            except UnsupportedControlError as ex:
-                raise HomeAssistantError(
-                    f"Climate control not supported by this vehicle: {ex}"
-                ) from ex
-        self.coordinator.async_request_refresh()
+            # Car does not accept changing the temp after starting the heating. So we have to turn off first
+            await self.coordinator.async_stop_climate(self.vehicle.id)
+            # Wait, because the car ignores the start_climate command if it comes too fast after stopping
+            # TODO: replace with some more event driven method
+            await asyncio.sleep(CLIMATE_RESTART_DELAY)
+            await self.coordinator.async_start_climate(
+                self.vehicle.id, self.climate_config
+            )
         self.async_write_ha_state()
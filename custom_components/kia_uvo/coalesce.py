@@ -0,0 +1,155 @@
+"""Single-flight coalescing of on-demand refreshes.
+
+The update and force_update services and the force refresh button each ask
+for a refresh. Fired in a burst (automations, repeated dashboard clicks)
+they used to run one token check and one full library call each. Here one
+refresh runs at a time and callers share it:
+
+- a request the in-flight refresh already covers (same or weaker kind, same
+  or fewer vehicles) joins it;
+- otherwise it becomes, or merges into, the single pending refresh that runs
+  next: the pending refresh takes the strongest kind asked for (a forced
+  request upgrades a cached one) and the union of the vehicles.
+
+Every caller awaits the result, or the error, of the refresh that covers it.
+The refreshes run in a task owned by the coalescer, so a caller that is
+cancelled stops waiting without cancelling the refresh for the others.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Coroutine, Iterable
+from contextlib import suppress
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Any
+
+
+class RefreshKind(IntEnum):
+    """How fresh the data must be; a stronger kind satisfies a weaker one."""
+
+    CACHED = 1
+    FORCED = 2
+
+
+@dataclass(frozen=True)
+class RefreshRequest:
+    """What a refresh fetches; ``vehicle_ids`` None means every vehicle."""
+
+    kind: RefreshKind
+    vehicle_ids: frozenset[str] | None = None
+
+    def covers(self, other: RefreshRequest) -> bool:
+        """Whether running this refresh also satisfies ``other``."""
+        if self.kind < other.kind:
+            return False
+        if self.vehicle_ids is None:
+            return True
+        return other.vehicle_ids is not None and other.vehicle_ids <= self.vehicle_ids
+
+    def merge(self, other: RefreshRequest) -> RefreshRequest:
+        """The smallest refresh covering both."""
+        vehicle_ids = (
+            None
+            if self.vehicle_ids is None or other.vehicle_ids is None
+            else self.vehicle_ids | other.vehicle_ids
+        )
+        return RefreshRequest(max(self.kind, other.kind), vehicle_ids)
+
+
+@dataclass
+class _Refresh:
+    request: RefreshRequest
+    future: asyncio.Future
+
+
+def _retrieve(future: asyncio.Future) -> None:
+    # Callers that joined read the outcome; without any, an error is not
+    # reported again as "never retrieved".
+    if not future.cancelled():
+        future.exception()
+
+
+class RefreshCoalescer:
+    """Runs refreshes one at a time, folding concurrent requests together."""
+
+    def __init__(
+        self,
+        run: Callable[[RefreshRequest], Awaitable[Any]],
+        create_task: Callable[[Coroutine[Any, Any, None]], asyncio.Task],
+    ) -> None:
+        """Initialize with the coroutine function that performs a refresh
+        and how to start the task running them."""
+        self._run = run
+        self._create_task = create_task
+        self._inflight: _Refresh | None = None
+        self._pending: _Refresh | None = None
+        self._worker: asyncio.Task | None = None
+        self.runs = 0
+        self.joined = 0
+
+    async def async_request(
+        self, kind: RefreshKind, vehicle_ids: Iterable[str] | None = None
+    ) -> None:
+        """Refresh, or wait for a refresh that covers this request."""
+        request = RefreshRequest(
+            kind, frozenset(vehicle_ids) if vehicle_ids is not None else None
+        )
+        inflight = self._inflight
+        if inflight is not None and inflight.request.covers(request):
+            self.joined += 1
+            refresh = inflight
+        elif self._pending is not None:
+            self._pending.request = self._pending.request.merge(request)
+            self.joined += 1
+            refresh = self._pending
+        else:
+            refresh = self._pending = _Refresh(
+                request, asyncio.get_running_loop().create_future()
+            )
+            refresh.future.add_done_callback(_retrieve)
+            if self._worker is None:
+                self._worker = self._create_task(self._async_work())
+        await asyncio.shield(refresh.future)
+
+    async def _async_work(self) -> None:
+        try:
+            while (refresh := self._pending) is not None:
+                self._pending = None
+                self._inflight = refresh
+                self.runs += 1
+                try:
+                    await self._run(refresh.request)
+                except asyncio.CancelledError:
+                    refresh.future.cancel()
+                    raise
+                except Exception as err:
+                    refresh.future.set_exception(err)
+                else:
+                    refresh.future.set_result(None)
+                finally:
+                    self._inflight = None
+        finally:
+            self._worker = None
+
+    async def async_shutdown(self) -> None:
+        """Stop the running refresh; callers still waiting are cancelled."""
+        worker, self._worker = self._worker, None
+        refreshes = [r for r in (self._inflight, self._pending) if r is not None]
+        self._pending = None
+        if worker is not None:
+            worker.cancel()
+            with suppress(asyncio.CancelledError):
+                await worker
+        for refresh in refreshes:
+            refresh.future.cancel()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-friendly view for diagnostics."""
+        return {
+            "runs": self.runs,
+            "joined": self.joined,
+            "in_flight": self._inflight is not None,
+            "pending": self._pending is not None,
+        }
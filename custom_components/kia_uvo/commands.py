@@ -0,0 +1,187 @@
+"""Per-vehicle command queue for Hyundai / Kia Connect.
+
+The API rejects overlapping commands to the same vehicle, so commands for a
+vehicle run one at a time. Instead of refusing a command while another is in
+flight, the queue accepts it and runs it next, folding it into a command that
+is still waiting where that makes the earlier one redundant:
+
+- commands sharing a ``key`` coalesce: the later one replaces the queued one,
+  or is combined with it by ``merge`` (e.g. two window requests become one);
+- a command's ``cancels`` keys drop still-queued commands, so a stop cancels a
+  start that has not been sent yet.
+
+Callers of a folded or cancelled command are resolved together with the
+command that absorbed it. The in-flight command is never changed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import deque
+from collections.abc import Awaitable, Callable, Coroutine
+from dataclasses import dataclass, field, fields, replace
+from typing import Any
+
+from homeassistant.exceptions import HomeAssistantError
+from hyundai_kia_connect_api import WindowRequestOptions
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+MAX_PENDING_COMMANDS = 10
+
+
+@dataclass
+class VehicleCommand:
+    """A queued vehicle command.
+
+    ``send`` is the blocking library call; it receives ``payload`` and
+    returns the action id to wait for.
+    """
+
+    label: str
+    send: Callable[[Any], Any]
+    payload: Any = None
+    key: str | None = None
+    merge: Callable[[Any, Any], Any] | None = None
+    cancels: frozenset[str] = frozenset()
+    force_refresh: bool = False
+    waiters: list[asyncio.Future] = field(default_factory=list)
+
+
+def merge_window_options(
+    queued: WindowRequestOptions, later: WindowRequestOptions
+) -> WindowRequestOptions:
+    """Combine two window requests; windows set in the later one win."""
+    return replace(
+        queued,
+        **{
+            option.name: getattr(later, option.name)
+            for option in fields(later)
+            if getattr(later, option.name) is not None
+        },
+    )
+
+
+def chain_payloads(queued: list, later: list) -> list:
+    """Combine two lists of updates to apply in order."""
+    return [*queued, *later]
+
+
+class VehicleCommandQueue:
+    """Run one vehicle's commands in order, coalescing queued ones."""
+
+    def __init__(
+        self,
+        vehicle_id: str,
+        run: Callable[[VehicleCommand], Awaitable[None]],
+        create_task: Callable[[Coroutine[Any, Any, None]], asyncio.Task],
+    ) -> None:
+        """Initialize; ``run`` sends one command and waits for it."""
+        self.vehicle_id = vehicle_id
+        self._run = run
+        self._create_task = create_task
+        self._pending: deque[VehicleCommand] = deque()
+        self._worker: asyncio.Task | None = None
+        self.in_flight: VehicleCommand | None = None
+
+    @property
+    def pending(self) -> list[VehicleCommand]:
+        """Commands waiting behind the in-flight one, in run order."""
+        return list(self._pending)
+
+    async def async_submit(self, command: VehicleCommand) -> None:
+        """Queue a command and wait until it (or what absorbed it) ran."""
+        waiter = asyncio.get_running_loop().create_future()
+        self.enqueue(command, waiter)
+        if self._worker is None:
+            self._worker = self._create_task(self._async_work())
+        await waiter
+
+    def enqueue(self, command: VehicleCommand, waiter: asyncio.Future) -> None:
+        """Add a command to the queue, applying cancels and coalescing."""
+        for queued in [c for c in self._pending if c.key in command.cancels]:
+            self._pending.remove(queued)
+            _LOGGER.debug(
+                "%s - Vehicle %s: '%s' cancels queued '%s'",
+                DOMAIN,
+                self.vehicle_id,
+                command.label,
+                queued.label,
+            )
+            for queued_waiter in queued.waiters:
+                if not queued_waiter.done():
+                    queued_waiter.set_result(None)
+
+        if command.key is not None:
+            for queued in self._pending:
+                if queued.key != command.key:
+                    continue
+                _LOGGER.debug(
+                    "%s - Vehicle %s: '%s' folded into queued '%s'",
+                    DOMAIN,
+                    self.vehicle_id,
+                    command.label,
+                    queued.label,
+                )
+                queued.payload = (
+                    command.merge(queued.payload, command.payload)
+                    if command.merge is not None
+                    else command.payload
+                )
+                queued.send = command.send
+                queued.label = command.label
+                queued.force_refresh |= command.force_refresh
+                queued.waiters.append(waiter)
+                return
+
+        if len(self._pending) >= MAX_PENDING_COMMANDS:
+            raise HomeAssistantError(
+                f"Too many commands queued for this vehicle; '{command.label}' "
+                "was not accepted."
+            )
+        command.waiters.append(waiter)
+        self._pending.append(command)
+
+    async def _async_work(self) -> None:
+        try:
+            while self._pending:
+                command = self.in_flight = self._pending.popleft()
+                try:
+                    await self._run(command)
+                except Exception as err:
+                    for waiter in command.waiters:
+                        if not waiter.done():
+                            waiter.set_exception(err)
+                else:
+                    for waiter in command.waiters:
+                        if not waiter.done():
+                            waiter.set_result(None)
+                finally:
+                    self.in_flight = None
+        finally:
+            self._worker = None
+
+    async def async_shutdown(self) -> None:
+        """Stop the worker and fail everything that has not run."""
+        worker, self._worker = self._worker, None
+        commands = list(self._pending)
+        if self.in_flight is not None:
+            commands.append(self.in_flight)
+        self._pending.clear()
+        if worker is not None:
+            worker.cancel()
+            try:
+                await worker
+            except asyncio.CancelledError:
+                pass
+        for command in commands:
+            for waiter in command.waiters:
+                if not waiter.done():
+                    waiter.set_exception(
+                        HomeAssistantError(
+                            f"'{command.label}' was cancelled: integration unloading"
+                        )
+                    )
@@ -27,18 +27,34 @@ from hyundai_kia_connect_api.exceptions import AuthenticationError
 
 from .const import (
     BRANDS,
+    CONF_ACTION_CONFIRMATION_TIMEOUT,
+    CONF_ACTIVE_SCAN_INTERVAL,
     CONF_BRAND,
+    CONF_COMMAND_REQUEST_RESERVE,
+    CONF_DAILY_REQUEST_BUDGET,
     CONF_ENABLE_GEOLOCATION_ENTITY,
+    CONF_EXECUTOR_THREADS,
     CONF_FORCE_REFRESH_INTERVAL,
+    CONF_IDLE_SCAN_INTERVAL,
+    CONF_MAX_CONCURRENT_ACTIONS,
     CONF_NO_FORCE_REFRESH_HOUR_FINISH,
     CONF_NO_FORCE_REFRESH_HOUR_START,
+    CONF_RAW_DATA_ON_DEMAND,
     CONF_TOKEN,
     CONF_USE_EMAIL_WITH_GEOCODE_API,
+    DEFAULT_ACTION_CONFIRMATION_TIMEOUT,
+    DEFAULT_ACTIVE_SCAN_INTERVAL,
+    DEFAULT_COMMAND_REQUEST_RESERVE,
+    DEFAULT_DAILY_REQUEST_BUDGET,
     DEFAULT_ENABLE_GEOLOCATION_ENTITY,
+    DEFAULT_EXECUTOR_THREADS,
     DEFAULT_FORCE_REFRESH_INTERVAL,
+    DEFAULT_IDLE_SCAN_INTERVAL,
+    DEFAULT_MAX_CONCURRENT_ACTIONS,
     DEFAULT_NO_FORCE_REFRESH_HOUR_FINISH,
     DEFAULT_NO_FORCE_REFRESH_HOUR_START,
     DEFAULT_PIN,
+    DEFAULT_RAW_DATA_ON_DEMAND,
     DEFAULT_SCAN_INTERVAL,
     DEFAULT_USE_EMAIL_WITH_GEOCODE_API,
     DOMAIN,
@@ -111,6 +127,28 @@ OPTIONS_SCHEMA = vol.Schema(
             CONF_FORCE_REFRESH_INTERVAL,
             default=DEFAULT_FORCE_REFRESH_INTERVAL,
         ): vol.All(vol.Coerce(int), vol.Range(min=90, max=9999)),
+        vol.Required(
+            CONF_ACTIVE_SCAN_INTERVAL, default=DEFAULT_ACTIVE_SCAN_INTERVAL
+        ): vol.All(vol.Coerce(int), vol.Any(0, vol.Range(min=2, max=999))),
+        vol.Required(
+            CONF_IDLE_SCAN_INTERVAL, default=DEFAULT_IDLE_SCAN_INTERVAL
+        ): vol.All(vol.Coerce(int), vol.Range(min=15, max=9999)),
+        vol.Required(
+            CONF_MAX_CONCURRENT_ACTIONS, default=DEFAULT_MAX_CONCURRENT_ACTIONS
+        ): vol.All(vol.Coerce(int), vol.Range(min=0, max=10)),
+        vol.Required(CONF_EXECUTOR_THREADS, default=DEFAULT_EXECUTOR_THREADS): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=32)
+        ),
+        vol.Required(
+            CONF_ACTION_CONFIRMATION_TIMEOUT,
+            default=DEFAULT_ACTION_CONFIRMATION_TIMEOUT,
+        ): vol.All(vol.Coerce(int), vol.Range(min=10, max=300)),
+        vol.Required(
+            CONF_DAILY_REQUEST_BUDGET, default=DEFAULT_DAILY_REQUEST_BUDGET
+        ): vol.All(vol.Coerce(int), vol.Range(min=0, max=10000)),
+        vol.Required(
+            CONF_COMMAND_REQUEST_RESERVE, default=DEFAULT_COMMAND_REQUEST_RESERVE
+        ): vol.All(vol.Coerce(int), vol.Range(min=0, max=1000)),
         vol.Required(
             CONF_NO_FORCE_REFRESH_HOUR_START,
             default=DEFAULT_NO_FORCE_REFRESH_HOUR_START,
@@ -127,6 +165,10 @@ OPTIONS_SCHEMA = vol.Schema(
             CONF_USE_EMAIL_WITH_GEOCODE_API,
             default=DEFAULT_USE_EMAIL_WITH_GEOCODE_API,
         ): bool,
+        vol.Optional(
+            CONF_RAW_DATA_ON_DEMAND,
+            default=DEFAULT_RAW_DATA_ON_DEMAND,
+        ): bool,
     }
 )
 
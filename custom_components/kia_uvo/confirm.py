@@ -0,0 +1,67 @@
+"""Async confirmation of sent vehicle actions.
+
+The library's synchronous check_action_status sleeps inside the executor
+between probes, holding a thread for up to the whole timeout. Here each probe
+is a single non-blocking status request and the waits between probes are
+asyncio sleeps with exponential backoff, so no thread is held while the car
+responds and the wait is cancelled with the task that runs it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+from hyundai_kia_connect_api.const import ORDER_STATUS
+
+PROBE_DELAY_INITIAL = 2.0
+PROBE_DELAY_MAX = 15.0
+
+
+@dataclass(frozen=True)
+class ActionResult:
+    """Outcome of waiting for an action: the final (or last seen) status,
+    seconds from send to that status, and how many probes it took."""
+
+    status: ORDER_STATUS | None
+    latency: float
+    probes: int
+
+    def as_dict(self) -> dict:
+        """Return a JSON-friendly view for diagnostics."""
+        return {
+            "status": self.status.value if self.status is not None else None,
+            "latency": round(self.latency, 1),
+            "probes": self.probes,
+        }
+
+
+async def async_confirm_action(
+    probe: Callable[[], Awaitable[ORDER_STATUS | None]],
+    deadline: float,
+    *,
+    initial_delay: float = PROBE_DELAY_INITIAL,
+    max_delay: float = PROBE_DELAY_MAX,
+    clock: Callable[[], float] = time.monotonic,
+    sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+) -> ActionResult:
+    """Probe until the action leaves PENDING or ``deadline`` seconds pass.
+
+    Returns TIMEOUT when the deadline is reached while still pending, the
+    same as the library's synchronous wait.
+    """
+    started = clock()
+    delay = initial_delay
+    probes = 0
+    while True:
+        remaining = deadline - (clock() - started)
+        if remaining <= 0:
+            return ActionResult(ORDER_STATUS.TIMEOUT, clock() - started, probes)
+        await sleep(min(delay, remaining))
+        status = await probe()
+        probes += 1
+        if status is not ORDER_STATUS.PENDING:
+            return ActionResult(status, clock() - started, probes)
+        delay = min(delay * 2, max_delay)
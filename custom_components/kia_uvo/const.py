@@ -10,6 +10,14 @@ CONF_NO_FORCE_REFRESH_HOUR_START: str = "no_force_refresh_hour_start"
 CONF_NO_FORCE_REFRESH_HOUR_FINISH: str = "no_force_refresh_hour_finish"
 CONF_ENABLE_GEOLOCATION_ENTITY: str = "enable_geolocation_entity"
 CONF_USE_EMAIL_WITH_GEOCODE_API: str = "use_email_with_geocode_api"
+CONF_ACTIVE_SCAN_INTERVAL: str = "active_scan_interval"
+CONF_IDLE_SCAN_INTERVAL: str = "idle_scan_interval"
+CONF_MAX_CONCURRENT_ACTIONS: str = "max_concurrent_actions"
+CONF_EXECUTOR_THREADS: str = "executor_threads"
+CONF_ACTION_CONFIRMATION_TIMEOUT: str = "action_confirmation_timeout"
+CONF_DAILY_REQUEST_BUDGET: str = "daily_request_budget"
+CONF_COMMAND_REQUEST_RESERVE: str = "command_request_reserve"
+CONF_RAW_DATA_ON_DEMAND: str = "raw_data_on_demand"
 CONF_TOKEN: str = "token"
 
 REGION_EUROPE: str = "Europe"
@@ -44,6 +52,18 @@ DEFAULT_NO_FORCE_REFRESH_HOUR_START: int = 22
 DEFAULT_NO_FORCE_REFRESH_HOUR_FINISH: int = 7
 DEFAULT_ENABLE_GEOLOCATION_ENTITY: bool = False
 DEFAULT_USE_EMAIL_WITH_GEOCODE_API: bool = False
+# 0 = active vehicles use the scan interval; a shorter one is opt-in.
+DEFAULT_ACTIVE_SCAN_INTERVAL: int = 0
+DEFAULT_IDLE_SCAN_INTERVAL: int = 120
+# 0 = no account-level cap; actions are still serialized per vehicle.
+DEFAULT_MAX_CONCURRENT_ACTIONS: int = 0
+# Threads in the account's own pool for blocking library calls.
+DEFAULT_EXECUTOR_THREADS: int = 4
+DEFAULT_ACTION_CONFIRMATION_TIMEOUT: int = 60
+# 0 = no daily budget; requests are still counted.
+DEFAULT_DAILY_REQUEST_BUDGET: int = 0
+DEFAULT_COMMAND_REQUEST_RESERVE: int = 20
+DEFAULT_RAW_DATA_ON_DEMAND: bool = False
 
 DYNAMIC_UNIT: str = "dynamic_unit"
 
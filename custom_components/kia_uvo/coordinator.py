@@ -8,6 +8,7 @@ import logging
 import traceback
 from collections.abc import Callable
 from datetime import timedelta
+from functools import partial
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
@@ -18,8 +19,9 @@ from homeassistant.const import (
     CONF_SCAN_INTERVAL,
     CONF_USERNAME,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed, HomeAssistantError
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_util
 from hyundai_kia_connect_api import (
@@ -31,22 +33,49 @@ from hyundai_kia_connect_api import (
     VehicleManager,
     WindowRequestOptions,
 )
-from hyundai_kia_connect_api.const import WINDOW_STATE
+from hyundai_kia_connect_api.const import ORDER_STATUS, WINDOW_STATE
 from hyundai_kia_connect_api.exceptions import (
     AuthenticationError,
     UnsupportedControlError,
 )
 
+from .breaker import CircuitBreaker
+from .budget import RequestBudget, RequestFamily, RequestLedger, next_midnight
+from .capabilities import CapabilityIndex
+from .cassette import CassetteRecorder
+from .changes import VehicleChangeTracker
+from .coalesce import RefreshCoalescer, RefreshKind, RefreshRequest
+from .commands import (
+    VehicleCommand,
+    VehicleCommandQueue,
+    chain_payloads,
+    merge_window_options,
+)
+from .confirm import ActionResult, async_confirm_action
 from .const import (
+    CONF_ACTION_CONFIRMATION_TIMEOUT,
+    CONF_ACTIVE_SCAN_INTERVAL,
     CONF_BRAND,
+    CONF_COMMAND_REQUEST_RESERVE,
+    CONF_DAILY_REQUEST_BUDGET,
     CONF_ENABLE_GEOLOCATION_ENTITY,
+    CONF_EXECUTOR_THREADS,
     CONF_FORCE_REFRESH_INTERVAL,
+    CONF_IDLE_SCAN_INTERVAL,
+    CONF_MAX_CONCURRENT_ACTIONS,
     CONF_NO_FORCE_REFRESH_HOUR_FINISH,
     CONF_NO_FORCE_REFRESH_HOUR_START,
     CONF_TOKEN,
     CONF_USE_EMAIL_WITH_GEOCODE_API,
+    DEFAULT_ACTION_CONFIRMATION_TIMEOUT,
+    DEFAULT_ACTIVE_SCAN_INTERVAL,
+    DEFAULT_COMMAND_REQUEST_RESERVE,
+    DEFAULT_DAILY_REQUEST_BUDGET,
     DEFAULT_ENABLE_GEOLOCATION_ENTITY,
+    DEFAULT_EXECUTOR_THREADS,
     DEFAULT_FORCE_REFRESH_INTERVAL,
+    DEFAULT_IDLE_SCAN_INTERVAL,
+    DEFAULT_MAX_CONCURRENT_ACTIONS,
     DEFAULT_NO_FORCE_REFRESH_HOUR_FINISH,
     DEFAULT_NO_FORCE_REFRESH_HOUR_START,
     DEFAULT_SCAN_INTERVAL,
@@ -54,9 +83,77 @@ from .const import (
     DOMAIN,
     OffPeakChargingMode,
 )
+from .daily_stats import DailyStatsIndexes
+from .executor import LibraryExecutor
+from .factories import EntityFactories
+from .http_pool import api_sessions, async_get_http_pool, count_requests
+from .metrics import ApiMetrics
+from .polling import PollingPolicy, PollingState
+from .profiler import RefreshProfiler, profile_summary
+from .scheduler import (
+    MIN_UPDATE_INTERVAL,
+    REFRESH_WAVE_SIZE,
+    VehicleRefreshScheduler,
+)
+from .snapshot import (
+    SNAPSHOT_MAX_AGE,
+    SNAPSHOT_SAVE_DELAY,
+    SNAPSHOT_STORAGE_VERSION,
+    snapshot_saved_at,
+    vehicles_from_dict,
+    vehicles_to_dict,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Refresh the token this long before it expires.
+TOKEN_REFRESH_MARGIN = timedelta(minutes=5)
+# Even a token that is not near expiry is re-verified with the library this
+# often, so a token revoked server-side is still noticed.
+TOKEN_RECHECK_INTERVAL = timedelta(hours=1)
+
+# Vehicle refreshes running at once across all kia_uvo entries.
+MAX_CONCURRENT_REFRESHES = 4
+REFRESH_SLOTS_KEY = f"{DOMAIN}_refresh_slots"
+
+REQUEST_LEDGER_STORAGE_VERSION = 1
+# Batch ledger writes; a crash loses at most this many seconds of counts.
+REQUEST_LEDGER_SAVE_DELAY = 30
+
+
+def token_is_fresh(token: Token | None, now: dt.datetime) -> bool:
+    """Return True while every expiry on the token is beyond the margin."""
+    if token is None or not isinstance(token.valid_until, dt.datetime):
+        return False
+    for expiry in (token.valid_until, getattr(token, "ccs_token_valid_until", None)):
+        if not isinstance(expiry, dt.datetime):
+            continue
+        if expiry.tzinfo is None:
+            expiry = expiry.replace(tzinfo=dt.UTC)
+        if expiry - TOKEN_REFRESH_MARGIN <= now:
+            return False
+    return True
+
+
+@callback
+def async_get_refresh_slots(hass: HomeAssistant) -> asyncio.Semaphore:
+    """The domain-wide cap on concurrent vehicle refreshes."""
+    if (slots := hass.data.get(REFRESH_SLOTS_KEY)) is None:
+        slots = hass.data[REFRESH_SLOTS_KEY] = asyncio.Semaphore(
+            MAX_CONCURRENT_REFRESHES
+        )
+    return slots
+
+
+def request_ledger_storage_key(config_entry: ConfigEntry) -> str:
+    """Storage key for an entry's request ledger."""
+    return f"{DOMAIN}.{config_entry.entry_id}.requests"
+
+
+def snapshot_storage_key(config_entry: ConfigEntry) -> str:
+    """Storage key for an entry's vehicle-state snapshot."""
+    return f"{DOMAIN}.{config_entry.entry_id}.vehicles"
+
 
 class HyundaiKiaConnectDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching data from the API."""
@@ -64,7 +161,50 @@ class HyundaiKiaConnectDataUpdateCoordinator(DataUpdateCoordinator):
     def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry) -> None:
         """Initialize."""
         self.platforms: set[str] = set()
-        self._action_lock = asyncio.Lock()
+        # One command queue per vehicle: the API rejects overlapping commands
+        # to the same car (DuplicateRequestError), but different cars are
+        # independent. The optional semaphore caps commands per account.
+        self._command_queues: dict[str, VehicleCommandQueue] = {}
+        max_concurrent_actions = config_entry.options.get(
+            CONF_MAX_CONCURRENT_ACTIONS, DEFAULT_MAX_CONCURRENT_ACTIONS
+        )
+        self._action_semaphore: asyncio.Semaphore | None = (
+            asyncio.Semaphore(max_concurrent_actions)
+            if max_concurrent_actions
+            else None
+        )
+        self._token_refresh: asyncio.Task | None = None
+        self._token_checked_at: dt.datetime | None = None
+        self.action_confirmation_timeout: int = config_entry.options.get(
+            CONF_ACTION_CONFIRMATION_TIMEOUT, DEFAULT_ACTION_CONFIRMATION_TIMEOUT
+        )
+        self.last_action_results: dict[str, ActionResult] = {}
+        self.request_budget = RequestBudget(
+            daily_budget=config_entry.options.get(
+                CONF_DAILY_REQUEST_BUDGET, DEFAULT_DAILY_REQUEST_BUDGET
+            ),
+            command_reserve=config_entry.options.get(
+                CONF_COMMAND_REQUEST_RESERVE, DEFAULT_COMMAND_REQUEST_RESERVE
+            ),
+        )
+        self.request_ledger = RequestLedger(day=dt_util.now().date())
+        self._request_ledger_store: Store = Store(
+            hass,
+            REQUEST_LEDGER_STORAGE_VERSION,
+            request_ledger_storage_key(config_entry),
+        )
+        self.api_metrics = ApiMetrics()
+        self.executor = LibraryExecutor(
+            config_entry.options.get(CONF_EXECUTOR_THREADS, DEFAULT_EXECUTOR_THREADS),
+            name=f"{DOMAIN}_{config_entry.entry_id}",
+        )
+        self._profiler: RefreshProfiler | None = None
+        self._recorder: CassetteRecorder | None = None
+        self._snapshot_store: Store = Store(
+            hass, SNAPSHOT_STORAGE_VERSION, snapshot_storage_key(config_entry)
+        )
+        # When the restored snapshot was taken; cleared by the first success.
+        self.restored_at: dt.datetime | None = None
 
         self.vehicle_manager = VehicleManager(
             region=config_entry.data.get(CONF_REGION),
@@ -83,6 +223,7 @@ class HyundaiKiaConnectDataUpdateCoordinator(DataUpdateCoordinator):
             if config_entry.data.get(CONF_TOKEN, None)
             else None,
         )
+        async_get_http_pool(hass).attach(self.vehicle_manager.api)
         self.scan_interval: int = (
             config_entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL) * 60
         )
@@ -104,6 +245,35 @@ class HyundaiKiaConnectDataUpdateCoordinator(DataUpdateCoordinator):
         self.use_email_with_geocode_api = config_entry.options.get(
             CONF_USE_EMAIL_WITH_GEOCODE_API, DEFAULT_USE_EMAIL_WITH_GEOCODE_API
         )
+        self.scheduler = VehicleRefreshScheduler(
+            self.scan_interval,
+            self.force_refresh_interval,
+            jitter_seed=config_entry.entry_id,
+        )
+        self._refresh_slots = async_get_refresh_slots(hass)
+        self.breaker = CircuitBreaker()
+        self.refreshes = RefreshCoalescer(
+            self._async_run_refresh,
+            lambda coro: hass.async_create_background_task(coro, f"{DOMAIN} refresh"),
+        )
+        self.polling_policy = PollingPolicy.from_options(
+            scan_interval=self.scan_interval,
+            force_refresh_interval=self.force_refresh_interval,
+            active_interval=config_entry.options.get(
+                CONF_ACTIVE_SCAN_INTERVAL, DEFAULT_ACTIVE_SCAN_INTERVAL
+            )
+            * 60,
+            idle_interval=config_entry.options.get(
+                CONF_IDLE_SCAN_INTERVAL, DEFAULT_IDLE_SCAN_INTERVAL
+            )
+            * 60,
+        )
+        self.polling_states: dict[str, PollingState] = {}
+        self.change_tracker = VehicleChangeTracker()
+        self.changed_fields: dict[str, frozenset[str] | None] = {}
+        self.daily_stats = DailyStatsIndexes()
+        self.capabilities = CapabilityIndex()
+        self.entity_factories = EntityFactories()
 
         super().__init__(
             hass,
@@ -128,8 +298,10 @@ class HyundaiKiaConnectDataUpdateCoordinator(DataUpdateCoordinator):
     async def _async_update_data(self):
         """Update data via library. Called by update_coordinator periodically.
 
-        Allow to update for the first time without further checking
-        Allow force update, if time diff between latest update and `now` is greater than force refresh delta
+        Only vehicles whose own schedule is due are refreshed; each one is
+        force refreshed when its data is older than its force refresh
+        interval (outside the no-force hours), otherwise served from cache.
+        The next wake-up is set to when the earliest vehicle comes due.
         """
         _LOGGER.debug(
             "%s - _async_update_data called, scan_interval=%ds, force_refresh_interval=%ds",
@@ -137,11 +309,20 @@ class HyundaiKiaConnectDataUpdateCoordinator(DataUpdateCoordinator):
             self.scan_interval,
             self.force_refresh_interval,
         )
+        now = dt_util.utcnow()
+        if not self.breaker.allow(now):
+            retry_after = (self.breaker.retry_at - now).total_seconds()
+            raise UpdateFailed(
+                f"Backend failing ({self.breaker.last_error}), circuit open "
+                f"until {self.breaker.retry_at}",
+                retry_after=max(retry_after, MIN_UPDATE_INTERVAL.total_seconds()),
+            )
         try:
             await self.async_check_and_refresh_token()
         except AuthenticationError as AuthError:
             raise ConfigEntryAuthFailed(AuthError) from AuthError
         except Exception as err:
+            self.breaker.record_failure(dt_util.utcnow(), err)
             # Transient API errors (e.g. DeviceIDError, ReadTimeoutError) from
             # Kia's EU backend must be surfaced as UpdateFailed rather than
             # propagating as unexpected exceptions.  HA's update coordinator
@@ -152,13 +333,87 @@ class HyundaiKiaConnectDataUpdateCoordinator(DataUpdateCoordinator):
             # unavailable and schedules an automatic retry after 60 seconds
             # instead of waiting for the next full poll interval.
             # See: https://github.com/Hyundai-Kia-Connect/kia_uvo/issues/1538
+            retry_after = max(60, self.breaker.backoff.total_seconds())
             raise UpdateFailed(
-                f"Token refresh failed, will retry in 60s: {err}",
-                retry_after=60,
+                f"Token refresh failed, will retry in {retry_after:.0f}s: {err}",
+                retry_after=retry_after,
             ) from err
-        current_hour = dt_util.now().hour
 
-        if (
+        self.scheduler.sync(self.vehicle_manager.vehicles)
+        now = dt_util.utcnow()
+        allow_force = self._is_force_refresh_allowed()
+        due = self.scheduler.due(now, REFRESH_WAVE_SIZE)
+        _LOGGER.debug(
+            "%s - %d of %d vehicles due for refresh",
+            DOMAIN,
+            len(due),
+            len(self.vehicle_manager.vehicles),
+        )
+        self.request_ledger.rollover(dt_util.now().date())
+        if due and not self.request_budget.allows_poll(self.request_ledger):
+            # Only the command reserve is left: stop polling until midnight.
+            resume = next_midnight(dt_util.now())
+            _LOGGER.info(
+                "%s - Daily request budget spent (%d calls), polling paused until %s",
+                DOMAIN,
+                self.request_ledger.total,
+                resume,
+            )
+            for vehicle_id in due:
+                self.scheduler.defer(vehicle_id, resume)
+            due = []
+        failed = []
+        for index, vehicle_id in enumerate(due):
+            if not self.breaker.allow(dt_util.utcnow()):
+                # The backend is down: leave the rest of the wave until the
+                # circuit's back-off has passed.
+                for skipped in due[index:]:
+                    self.scheduler.defer(skipped, self.breaker.retry_at)
+                failed.extend(due[index:])
+                break
+            vehicle = self.vehicle_manager.vehicles[vehicle_id]
+            force = allow_force and self.scheduler.is_force_due(vehicle, now)
+            if not await self._async_refresh_vehicle(vehicle_id, force):
+                failed.append(vehicle_id)
+
+        self.update_interval = self.scheduler.next_update_interval(dt_util.utcnow())
+        if due and len(failed) == len(due):
+            raise UpdateFailed(
+                f"Error communicating with API: refresh failed for {failed}"
+            )
+        return self.data
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Diff vehicle state before fanning out so entities can skip
+        writes for fields that did not change."""
+        self.changed_fields = self.change_tracker.update(
+            self.vehicle_manager.vehicles, self._polling_schedules()
+        )
+        self.daily_stats.update(self.vehicle_manager.vehicles, self.changed_fields)
+        new_features = self.capabilities.update(
+            self.vehicle_manager.vehicles, self.changed_fields
+        )
+        if self.last_update_success:
+            self.restored_at = None
+            if self.vehicle_manager.vehicles:
+                self._snapshot_store.async_delay_save(
+                    lambda: vehicles_to_dict(
+                        self.vehicle_manager.vehicles, dt_util.utcnow()
+                    ),
+                    SNAPSHOT_SAVE_DELAY,
+                )
+        super().async_update_listeners()
+        self.entity_factories.add_new(self.vehicle_manager.vehicles, new_features)
+        if self._profiler is not None:
+            self._profiler.cycle_done()
+        if self._recorder is not None:
+            self._recorder.cycle_done()
+
+    def _is_force_refresh_allowed(self) -> bool:
+        """Return False inside the configured no-force-refresh hours."""
+        current_hour = dt_util.now().hour
+        return (
             (self.no_force_refresh_hour_start <= self.no_force_refresh_hour_finish)
             and (
                 current_hour < self.no_force_refresh_hour_start
@@ -170,78 +425,430 @@ class HyundaiKiaConnectDataUpdateCoordinator(DataUpdateCoordinator):
                 current_hour < self.no_force_refresh_hour_start
                 and current_hour >= self.no_force_refresh_hour_finish
             )
-        ):
+        )
+
+    async def _async_refresh_vehicle(self, vehicle_id: str, force: bool) -> bool:
+        """Refresh one vehicle, falling back to cached state if a force
+        refresh fails. Returns False when no fresh data could be fetched.
+
+        Waits for a domain-wide refresh slot first, so accounts refreshing
+        at the same time take turns."""
+        async with self._refresh_slots:
+            return await self._async_refresh_vehicle_now(vehicle_id, force)
+
+    async def _async_refresh_vehicle_now(self, vehicle_id: str, force: bool) -> bool:
+        if force:
             try:
-                await self.hass.async_add_executor_job(
-                    self.vehicle_manager.check_and_force_update_vehicles,
-                    self.force_refresh_interval,
+                await self._async_api_call(
+                    RequestFamily.FORCED,
+                    self.vehicle_manager.force_refresh_vehicle_state,
+                    vehicle_id,
                 )
-            except Exception:
-                try:
-                    _LOGGER.exception(
-                        f"Force update failed, falling back to cached: {traceback.format_exc()}"
-                    )
-                    await self.hass.async_add_executor_job(
-                        self.vehicle_manager.update_all_vehicles_with_cached_state
-                    )
-                except Exception:
-                    _LOGGER.exception(f"Cached update failed: {traceback.format_exc()}")
-                    raise UpdateFailed(
-                        f"Error communicating with API: {traceback.format_exc()}"
+            except Exception as err:
+                self.breaker.record_failure(dt_util.utcnow(), err)
+                if not self.breaker.allow(dt_util.utcnow()):
+                    # The circuit just opened: the cached fallback would only
+                    # fail against the same backend.
+                    _LOGGER.warning(
+                        "%s - Force update failed, circuit open until %s: %s",
+                        DOMAIN,
+                        self.breaker.retry_at,
+                        err,
                     )
+                    self._vehicle_failed(vehicle_id)
+                    return False
+                _LOGGER.exception(
+                    f"Force update failed, falling back to cached: {traceback.format_exc()}"
+                )
+            else:
+                self.breaker.record_success()
+                self._vehicle_refreshed(vehicle_id)
+                return True
+        try:
+            await self._async_api_call(
+                RequestFamily.CACHED,
+                self.vehicle_manager.update_vehicle_with_cached_state,
+                vehicle_id,
+            )
+        except Exception as err:
+            _LOGGER.exception(f"Cached update failed: {traceback.format_exc()}")
+            self.breaker.record_failure(dt_util.utcnow(), err)
+            self._invalidate_token_check()
+            self._vehicle_failed(vehicle_id)
+            return False
+        self.breaker.record_success()
+        self._vehicle_refreshed(vehicle_id)
+        return True
 
-        else:
-            await self.hass.async_add_executor_job(
-                self.vehicle_manager.update_all_vehicles_with_cached_state
+    def _vehicle_failed(self, vehicle_id: str) -> None:
+        """Schedule a retry, no earlier than the circuit allows."""
+        now = dt_util.utcnow()
+        self.scheduler.mark_failed(vehicle_id, now)
+        if self.breaker.retry_at is not None:
+            self.scheduler.defer(
+                vehicle_id,
+                max(self.scheduler.get(vehicle_id).next_refresh, self.breaker.retry_at),
             )
 
-        return self.data
+    def _vehicle_refreshed(self, vehicle_id: str) -> None:
+        """Re-evaluate the polling policy from fresh state and reschedule."""
+        now = dt_util.utcnow()
+        self._apply_polling_policy(vehicle_id, now)
+        self.scheduler.mark_refreshed(vehicle_id, now)
+        if self.breaker.backoff:
+            # Still recovering from failures: stretch the interval by what is
+            # left of the back-off.
+            schedule = self.scheduler.get(vehicle_id)
+            self.scheduler.defer(
+                vehicle_id, schedule.next_refresh + self.breaker.backoff
+            )
+
+    def _apply_polling_policy(self, vehicle_id: str, now: dt.datetime) -> None:
+        """Set a vehicle's intervals from its polling state."""
+        vehicle = self.vehicle_manager.vehicles[vehicle_id]
+        state = self.polling_policy.state(vehicle, now)
+        if self.polling_states.get(vehicle_id) is not state:
+            _LOGGER.debug(
+                "%s - Vehicle %s polling state is now %s", DOMAIN, vehicle_id, state
+            )
+        self.polling_states[vehicle_id] = state
+        scan_interval, force_refresh_interval = self.polling_policy.intervals(state)
+        # Spread what is left of the daily request budget over the day.
+        pacing_interval = self.request_budget.pacing_interval(
+            self.request_ledger, dt_util.now(), len(self.vehicle_manager.vehicles)
+        )
+        scan_interval = max(scan_interval, pacing_interval)
+        force_refresh_interval = max(force_refresh_interval, pacing_interval)
+        self.scheduler.set_intervals(vehicle_id, scan_interval, force_refresh_interval)
+
+    def _polling_schedules(self) -> dict[str, tuple[int, PollingState | None]]:
+        """Each vehicle's scan interval and polling state, as the polling
+        interval sensor shows them."""
+        return {
+            vehicle_id: (
+                self.scheduler.get(vehicle_id).scan_interval,
+                self.polling_states.get(vehicle_id),
+            )
+            for vehicle_id in self.vehicle_manager.vehicles
+        }
+
+    async def async_shutdown(self) -> None:
+        """Stop queued commands and on-demand refreshes along with the
+        coordinator."""
+        for queue in self._command_queues.values():
+            await queue.async_shutdown()
+        await self.refreshes.async_shutdown()
+        await super().async_shutdown()
+        await self.hass.async_add_executor_job(self.executor.shutdown)
 
     async def async_update_all(self) -> None:
         """Update vehicle data."""
-        await self.async_check_and_refresh_token()
-        await self.hass.async_add_executor_job(
-            self.vehicle_manager.update_all_vehicles_with_cached_state
-        )
-        self.async_set_updated_data(self.data)
+        await self.refreshes.async_request(RefreshKind.CACHED)
 
     async def async_force_update_all(self) -> None:
         """Force refresh vehicle data and update it."""
-        await self.async_check_and_refresh_token()
-        await self.hass.async_add_executor_job(
-            self.vehicle_manager.force_refresh_all_vehicles_states
-        )
-        self.async_set_updated_data(self.data)
+        await self.refreshes.async_request(RefreshKind.FORCED)
 
     async def async_force_refresh_vehicle(self, vehicle_id: str) -> None:
         """Force refresh a single vehicle's state."""
+        await self.refreshes.async_request(RefreshKind.FORCED, [vehicle_id])
+
+    async def _async_run_refresh(self, request: RefreshRequest) -> None:
+        """Run one coalesced on-demand refresh.
+
+        Forced vehicles go one at a time under the domain-wide refresh cap,
+        in waves of REFRESH_WAVE_SIZE with a pause between them, instead of
+        the library's back-to-back force_refresh_all_vehicles_states.
+        """
         await self.async_check_and_refresh_token()
-        await self.hass.async_add_executor_job(
-            self.vehicle_manager.force_refresh_vehicle_state, vehicle_id
-        )
+        if request.kind is RefreshKind.CACHED and request.vehicle_ids is None:
+            async with self._refresh_slots:
+                await self._async_api_call(
+                    RequestFamily.CACHED,
+                    self.vehicle_manager.update_all_vehicles_with_cached_state,
+                )
+            for vehicle_id in self.vehicle_manager.vehicles:
+                self._vehicle_refreshed(vehicle_id)
+        else:
+            family, fn = (
+                (RequestFamily.FORCED, self.vehicle_manager.force_refresh_vehicle_state)
+                if request.kind is RefreshKind.FORCED
+                else (
+                    RequestFamily.CACHED,
+                    self.vehicle_manager.update_vehicle_with_cached_state,
+                )
+            )
+            vehicle_ids = [
+                vehicle_id
+                for vehicle_id in self.vehicle_manager.vehicles
+                if request.vehicle_ids is None or vehicle_id in request.vehicle_ids
+            ]
+            for index, vehicle_id in enumerate(vehicle_ids):
+                if index and index % REFRESH_WAVE_SIZE == 0:
+                    await asyncio.sleep(MIN_UPDATE_INTERVAL.total_seconds())
+                async with self._refresh_slots:
+                    await self._async_api_call(family, fn, vehicle_id)
+                self._vehicle_refreshed(vehicle_id)
         self.async_set_updated_data(self.data)
 
-    async def async_check_and_refresh_token(self):
-        """Refresh token if needed via library."""
-        await self.hass.async_add_executor_job(
-            self.vehicle_manager.check_and_refresh_token
+    async def async_load_request_ledger(self) -> None:
+        """Restore today's request counts from storage."""
+        self.request_ledger = RequestLedger.from_dict(
+            await self._request_ledger_store.async_load(), dt_util.now().date()
+        )
+
+    async def async_restore_snapshot(self) -> bool:
+        """Load the vehicles saved by the last run into the vehicle manager.
+
+        Only used with a stored token: the library re-reads the vehicle list
+        when it refreshes a token, but not after a fresh login with vehicles
+        already present. Returns True when vehicles were restored.
+        """
+        if self.vehicle_manager.token is None:
+            return False
+        data = await self._snapshot_store.async_load()
+        vehicles = vehicles_from_dict(data)
+        if not vehicles:
+            return False
+        self.vehicle_manager.vehicles = vehicles
+        self.restored_at = snapshot_saved_at(data)
+        _LOGGER.debug("%s - Restored %d vehicles from snapshot", DOMAIN, len(vehicles))
+        return True
+
+    def restored_state_is_fresh(self) -> bool:
+        """Whether entities still show a restored snapshot young enough to
+        count as available although no refresh has succeeded yet."""
+        return (
+            self.restored_at is not None
+            and dt_util.utcnow() - self.restored_at < SNAPSHOT_MAX_AGE
+        )
+
+    async def _async_api_call(
+        self,
+        family: RequestFamily,
+        fn: Callable[..., Any],
+        *args: Any,
+        operation: str | None = None,
+    ) -> Any:
+        """Run a blocking library call in the executor, counting every HTTP
+        request it sends against ``family`` in the day's request ledger.
+        Each request is counted once answered, failed ones included: the
+        quota is charged for attempts, not only for successes."""
+        return await self._async_timed_call(
+            count_requests(
+                fn,
+                partial(
+                    self.hass.loop.call_soon_threadsafe, self._count_request, family
+                ),
+            ),
+            *args,
+            operation=operation or fn.__name__,
         )
-        await self._async_save_token()
 
-    async def async_await_action_and_refresh(self, vehicle_id, action_id):
+    @callback
+    def _count_request(self, family: RequestFamily) -> None:
+        self.request_ledger.record(family, dt_util.now().date())
+        self._request_ledger_store.async_delay_save(
+            self.request_ledger.as_dict, REQUEST_LEDGER_SAVE_DELAY
+        )
+
+    async def _async_timed_call(
+        self, fn: Callable[..., Any], *args: Any, operation: str | None = None
+    ) -> Any:
+        """Run a blocking library call in the executor, recording its queue
+        wait, latency and outcome under ``operation`` (default: its name)."""
+        operation = operation or fn.__name__
+        if self._profiler is not None:
+            fn = self._profiler.wrap(fn)
+        if self._recorder is not None:
+            fn = self._recorder.wrap(fn)
+        return await self.api_metrics.async_timed(
+            operation, self.async_add_executor_job, fn, *args
+        )
+
+    @callback
+    def async_add_executor_job(
+        self, fn: Callable[..., Any], *args: Any
+    ) -> asyncio.Future:
+        """Run a blocking call in the account's own thread pool."""
+        return self.executor.async_add_job(self.hass.loop, fn, *args)
+
+    async def async_profile(
+        self, cycles: int, top: int, timeout: float
+    ) -> dict[str, Any]:
+        """Profile the next ``cycles`` refresh cycles or commands.
+
+        Waits at most ``timeout`` seconds, then writes the pstats file to the
+        config directory and returns where it is with a top-``top`` summary.
+        """
+        if self._profiler is not None:
+            raise HomeAssistantError("A profile is already being captured")
+        profiler = RefreshProfiler(cycles, self.hass.loop.create_future())
         try:
-            await asyncio.sleep(5)
-            await self.hass.async_add_executor_job(
-                self.vehicle_manager.check_action_status,
+            profiler.start()
+        except ValueError as err:
+            raise HomeAssistantError(f"Cannot start profiling: {err}") from err
+        self._profiler = profiler
+        try:
+            async with asyncio.timeout(timeout):
+                await profiler.done
+        except TimeoutError:
+            _LOGGER.debug(
+                "%s - Profile timed out after %d of %d cycles",
+                DOMAIN,
+                profiler.cycles,
+                cycles,
+            )
+        finally:
+            self._profiler = None
+            stats = profiler.stop()
+        path = self.hass.config.path(
+            f"{DOMAIN}_profile_{dt_util.now():%Y%m%d_%H%M%S}.prof"
+        )
+        await self.hass.async_add_executor_job(stats.dump_stats, path)
+        return {
+            "file": path,
+            "cycles": profiler.cycles,
+            "duration": round(profiler.duration, 3),
+            "top": profile_summary(stats, top),
+        }
+
+    async def async_record_cassette(
+        self, cycles: int, timeout: float
+    ) -> dict[str, Any]:
+        """Record the raw API traffic of the next ``cycles`` refresh cycles
+        or commands.
+
+        Waits at most ``timeout`` seconds, then writes the redacted cassette
+        to the config directory and returns where it is.
+        """
+        if self._recorder is not None:
+            raise HomeAssistantError("A cassette is already being recorded")
+        recorder = CassetteRecorder(
+            cycles,
+            self.hass.loop.create_future(),
+            metadata={
+                "region": self.config_entry.data.get(CONF_REGION),
+                "brand": self.config_entry.data.get(CONF_BRAND),
+                "options": dict(self.config_entry.options),
+                "recorded_at": dt_util.utcnow().isoformat(),
+            },
+            vehicle_ids=self.vehicle_manager.vehicles,
+        )
+        recorder.start(api_sessions(self.vehicle_manager.api))
+        self._recorder = recorder
+        try:
+            async with asyncio.timeout(timeout):
+                await recorder.done
+        except TimeoutError:
+            _LOGGER.debug(
+                "%s - Recording timed out after %d of %d cycles",
+                DOMAIN,
+                recorder.cycles,
+                cycles,
+            )
+        finally:
+            self._recorder = None
+            cassette = recorder.stop()
+        path = self.hass.config.path(
+            f"{DOMAIN}_cassette_{dt_util.now():%Y%m%d_%H%M%S}.json.gz"
+        )
+        await self.hass.async_add_executor_job(cassette.dump, path)
+        return {
+            "file": path,
+            "cycles": recorder.cycles,
+            "interactions": len(cassette.interactions),
+        }
+
+    async def async_check_and_refresh_token(self):
+        """Refresh token if needed via library.
+
+        Skipped without leaving the event loop while the token was checked
+        recently and is not close to expiring. Otherwise concurrent callers
+        share one in-flight check, so simultaneous actions do not log in
+        twice.
+        """
+        now = dt_util.utcnow()
+        if (
+            self._token_checked_at is not None
+            and now - self._token_checked_at < TOKEN_RECHECK_INTERVAL
+            and self.vehicle_manager.vehicles
+            and token_is_fresh(self.vehicle_manager.token, now)
+        ):
+            return
+        if self._token_refresh is None:
+            self._token_refresh = self.hass.async_create_task(
+                self._async_refresh_token()
+            )
+        await asyncio.shield(self._token_refresh)
+
+    async def _async_refresh_token(self) -> None:
+        try:
+            await self._async_api_call(
+                RequestFamily.AUTH, self.vehicle_manager.check_and_refresh_token
+            )
+            await self._async_save_token()
+            self._token_checked_at = dt_util.utcnow()
+        finally:
+            self._token_refresh = None
+
+    def _invalidate_token_check(self) -> None:
+        """Have the next caller verify the token with the library again."""
+        self._token_checked_at = None
+
+    async def async_await_action(
+        self, vehicle_id: str, action_id: str, label: str = "action"
+    ) -> ActionResult:
+        """Wait for an action to reach a final state without holding an
+        executor thread between status probes."""
+
+        async def probe():
+            return await self._async_api_call(
+                RequestFamily.CONTROL,
+                self._check_action_status_once,
                 vehicle_id,
                 action_id,
-                True,
-                60,
+                operation="check_action_status",
             )
+
+        result = await async_confirm_action(probe, self.action_confirmation_timeout)
+        self.last_action_results[label] = result
+        _LOGGER.debug(
+            "%s - Action '%s' on vehicle %s: %s after %.1fs (%d probes)",
+            DOMAIN,
+            label,
+            vehicle_id,
+            result.status,
+            result.latency,
+            result.probes,
+        )
+        return result
+
+    def _check_action_status_once(self, vehicle_id: str, action_id: str):
+        """Make a single status request for an action."""
+        # Hyundai USA pops the action's service type on every status check,
+        # assuming one synchronous call; keep it for the next probe.
+        service_types = getattr(self.vehicle_manager.api, "_action_service_types", None)
+        service_type = (
+            service_types.get(action_id) if service_types is not None else None
+        )
+        status = self.vehicle_manager.check_action_status(vehicle_id, action_id, False)
+        if service_type is not None and status is ORDER_STATUS.PENDING:
+            service_types[action_id] = service_type
+        return status
+
+    async def async_await_action_and_refresh(
+        self, vehicle_id, action_id, label: str = "action"
+    ):
+        try:
+            await self.async_await_action(vehicle_id, action_id, label)
         finally:
+            self.scheduler.mark_due(vehicle_id)
             await self.async_refresh()
 
-    async def async_await_action_and_force_refresh(self, vehicle_id, action_id):
+    async def async_await_action_and_force_refresh(
+        self, vehicle_id, action_id, label: str = "action"
+    ):
         """Wait for action then force refresh to get fresh vehicle data.
 
         Used after setting charge limits because the soft refresh (cmm/gvi)
@@ -254,21 +861,18 @@ class HyundaiKiaConnectDataUpdateCoordinator(DataUpdateCoordinator):
         notify HA entities to re-read their state.
         """
         try:
-            await asyncio.sleep(5)
-            await self.hass.async_add_executor_job(
-                self.vehicle_manager.check_action_status,
-                vehicle_id,
-                action_id,
-                True,
-                60,
-            )
+            await self.async_await_action(vehicle_id, action_id, label)
         finally:
             try:
-                await self.hass.async_add_executor_job(
-                    self.vehicle_manager.force_refresh_vehicle_state, vehicle_id
+                await self._async_api_call(
+                    RequestFamily.FORCED,
+                    self.vehicle_manager.force_refresh_vehicle_state,
+                    vehicle_id,
                 )
             except Exception:
                 _LOGGER.exception("Force refresh after call failed")
+            else:
+                self._vehicle_refreshed(vehicle_id)
             self.async_set_updated_data(self.data)
 
     async def _async_send_action(
@@ -278,51 +882,113 @@ class HyundaiKiaConnectDataUpdateCoordinator(DataUpdateCoordinator):
         error_label: str,
         *,
         force_refresh: bool = False,
+        key: str | None = None,
+        cancels: frozenset[str] = frozenset(),
     ):
         """Send a vehicle action, wait for completion, and refresh data.
 
-        Serializes actions with a lock to prevent DuplicateRequestError
-        from the Hyundai API when commands overlap. If another action is
-        already in progress, raises HomeAssistantError immediately so
-        the user gets a clear message instead of a mysterious long wait.
+        ``key`` lets a later action of the same kind replace this one while
+        it is still queued; ``cancels`` drops queued actions with those keys.
+        """
+        await self._async_submit_command(
+            vehicle_id,
+            VehicleCommand(
+                label=error_label,
+                send=lambda _: action_fn(),
+                key=key,
+                cancels=cancels,
+                force_refresh=force_refresh,
+            ),
+        )
+
+    async def _async_submit_command(
+        self, vehicle_id: str, command: VehicleCommand
+    ) -> None:
+        """Queue a command on the vehicle's queue and wait for it to run.
+
+        Commands for one vehicle run in order, one at a time, to prevent
+        DuplicateRequestError from the Hyundai API when commands to the same
+        car overlap. Commands for other vehicles run concurrently, up to the
+        account-level cap if set.
         """
-        if self._action_lock.locked():
-            _LOGGER.warning(
-                "Vehicle action '%s' rejected: another action is already in progress",
-                error_label,
+        queue = self._command_queues.get(vehicle_id)
+        if queue is None:
+            queue = self._command_queues[vehicle_id] = VehicleCommandQueue(
+                vehicle_id,
+                lambda command: self._async_run_command(vehicle_id, command),
+                lambda coro: self.hass.async_create_background_task(
+                    coro, f"{DOMAIN} commands {vehicle_id}"
+                ),
             )
-            raise HomeAssistantError(
-                "Another vehicle action is in progress. "
-                "Please wait for it to complete and try again."
+        if queue.in_flight is not None:
+            _LOGGER.debug(
+                "%s - Vehicle %s busy with '%s', queueing '%s'",
+                DOMAIN,
+                vehicle_id,
+                queue.in_flight.label,
+                command.label,
             )
-        async with self._action_lock:
-            await self.async_check_and_refresh_token()
-            try:
-                action_id = await self.hass.async_add_executor_job(action_fn)
-            except UnsupportedControlError as err:
-                raise HomeAssistantError(
-                    f"Vehicle does not support this action: {err}"
-                ) from err
-            except Exception as err:
-                raise HomeAssistantError(f"Failed to {error_label}: {err}") from err
-            try:
-                if force_refresh:
-                    await self.async_await_action_and_force_refresh(
-                        vehicle_id, action_id
-                    )
-                else:
-                    await self.async_await_action_and_refresh(vehicle_id, action_id)
-            except Exception:
-                _LOGGER.exception(
-                    "Action '%s' was sent but confirmation polling failed",
-                    error_label,
+        await queue.async_submit(command)
+
+    async def _async_run_command(
+        self, vehicle_id: str, command: VehicleCommand
+    ) -> None:
+        """Run a dequeued command under the account-level cap."""
+        try:
+            if self._action_semaphore is None:
+                await self._async_run_action(vehicle_id, command)
+            else:
+                async with self._action_semaphore:
+                    await self._async_run_action(vehicle_id, command)
+        finally:
+            if self._profiler is not None:
+                self._profiler.cycle_done()
+            if self._recorder is not None:
+                self._recorder.cycle_done()
+
+    async def _async_run_action(
+        self,
+        vehicle_id: str,
+        command: VehicleCommand,
+    ) -> None:
+        """Send the command and wait for it; only the vehicle's queue calls
+        this, so commands to one vehicle never overlap."""
+        await self.async_check_and_refresh_token()
+        try:
+            action_id = await self._async_api_call(
+                RequestFamily.CONTROL,
+                command.send,
+                command.payload,
+                operation=command.label,
+            )
+        except UnsupportedControlError as err:
+            raise HomeAssistantError(
+                f"Vehicle does not support this action: {err}"
+            ) from err
+        except Exception as err:
+            self._invalidate_token_check()
+            raise HomeAssistantError(f"Failed to {command.label}: {err}") from err
+        try:
+            if command.force_refresh:
+                await self.async_await_action_and_force_refresh(
+                    vehicle_id, action_id, command.label
+                )
+            else:
+                await self.async_await_action_and_refresh(
+                    vehicle_id, action_id, command.label
                 )
+        except Exception:
+            _LOGGER.exception(
+                "Action '%s' was sent but confirmation polling failed",
+                command.label,
+            )
 
     async def async_lock_vehicle(self, vehicle_id: str):
         await self._async_send_action(
             vehicle_id,
             lambda: self.vehicle_manager.lock(vehicle_id),
             "lock vehicle",
+            key="lock",
         )
 
     async def async_unlock_vehicle(self, vehicle_id: str):
@@ -330,6 +996,7 @@ class HyundaiKiaConnectDataUpdateCoordinator(DataUpdateCoordinator):
             vehicle_id,
             lambda: self.vehicle_manager.unlock(vehicle_id),
             "unlock vehicle",
+            key="lock",
         )
 
     async def async_open_charge_port(self, vehicle_id: str):
@@ -337,6 +1004,7 @@ class HyundaiKiaConnectDataUpdateCoordinator(DataUpdateCoordinator):
             vehicle_id,
             lambda: self.vehicle_manager.open_charge_port(vehicle_id),
             "open charge port",
+            key="charge_port",
         )
 
     async def async_close_charge_port(self, vehicle_id: str):
@@ -344,6 +1012,7 @@ class HyundaiKiaConnectDataUpdateCoordinator(DataUpdateCoordinator):
             vehicle_id,
             lambda: self.vehicle_manager.close_charge_port(vehicle_id),
             "close charge port",
+            key="charge_port",
         )
 
     async def async_start_climate_default(self, vehicle_id: str):
@@ -357,6 +1026,7 @@ class HyundaiKiaConnectDataUpdateCoordinator(DataUpdateCoordinator):
             vehicle_id,
             lambda: self.vehicle_manager.start_climate(vehicle_id, climate_options),
             "start climate",
+            key="climate_start",
         )
 
     async def async_stop_climate(self, vehicle_id: str):
@@ -364,6 +1034,8 @@ class HyundaiKiaConnectDataUpdateCoordinator(DataUpdateCoordinator):
             vehicle_id,
             lambda: self.vehicle_manager.stop_climate(vehicle_id),
             "stop climate",
+            key="climate_stop",
+            cancels=frozenset({"climate_start"}),
         )
 
     async def async_start_charge(self, vehicle_id: str):
@@ -371,6 +1043,7 @@ class HyundaiKiaConnectDataUpdateCoordinator(DataUpdateCoordinator):
             vehicle_id,
             lambda: self.vehicle_manager.start_charge(vehicle_id),
             "start charge",
+            key="charge_start",
         )
 
     async def async_stop_charge(self, vehicle_id: str):
@@ -378,6 +1051,8 @@ class HyundaiKiaConnectDataUpdateCoordinator(DataUpdateCoordinator):
             vehicle_id,
             lambda: self.vehicle_manager.stop_charge(vehicle_id),
             "stop charge",
+            key="charge_stop",
+            cancels=frozenset({"charge_start"}),
         )
 
     async def async_set_charge_limits(self, vehicle_id: str, ac: int, dc: int):
@@ -385,6 +1060,7 @@ class HyundaiKiaConnectDataUpdateCoordinator(DataUpdateCoordinator):
             vehicle_id,
             lambda: self.vehicle_manager.set_charge_limits(vehicle_id, ac, dc),
             "set charge limits",
+            key="charge_limits",
         )
 
     async def async_set_charging_current(self, vehicle_id: str, level: int):
@@ -392,17 +1068,49 @@ class HyundaiKiaConnectDataUpdateCoordinator(DataUpdateCoordinator):
             vehicle_id,
             lambda: self.vehicle_manager.set_charging_current(vehicle_id, level),
             "set charging current",
+            key="charging_current",
         )
 
     async def async_schedule_charging_and_climate(
         self, vehicle_id: str, schedule_options: ScheduleChargingClimateRequestOptions
     ):
-        await self._async_send_action(
+        await self._async_update_schedule(vehicle_id, lambda _: schedule_options)
+
+    async def _async_update_schedule(
+        self,
+        vehicle_id: str,
+        update: Callable[
+            [ScheduleChargingClimateRequestOptions],
+            ScheduleChargingClimateRequestOptions,
+        ],
+    ) -> None:
+        """Queue a schedule change.
+
+        The options are built from vehicle state when the command is sent,
+        not when it is queued, and queued changes are applied in order to
+        that one set of options, so a burst of toggles becomes one request
+        and none of them overwrites another with stale state.
+        """
+
+        def send(updates):
+            options = self._build_schedule_options_from_vehicle(
+                self.vehicle_manager.vehicles[vehicle_id]
+            )
+            for pending_update in updates:
+                options = pending_update(options)
+            return self.vehicle_manager.schedule_charging_and_climate(
+                vehicle_id, options
+            )
+
+        await self._async_submit_command(
             vehicle_id,
-            lambda: self.vehicle_manager.schedule_charging_and_climate(
-                vehicle_id, schedule_options
+            VehicleCommand(
+                label="schedule charging and climate",
+                send=send,
+                payload=[update],
+                key="schedule",
+                merge=chain_payloads,
             ),
-            "schedule charging and climate",
         )
 
     def _build_schedule_options_from_vehicle(
@@ -433,19 +1141,23 @@ class HyundaiKiaConnectDataUpdateCoordinator(DataUpdateCoordinator):
 
     async def async_set_schedule_charge_enabled(self, vehicle_id: str, enabled: bool):
         """Toggle scheduled charging on/off."""
-        vehicle = self.vehicle_manager.vehicles[vehicle_id]
-        options = self._build_schedule_options_from_vehicle(vehicle)
-        options.charging_enabled = enabled
-        await self.async_schedule_charging_and_climate(vehicle_id, options)
+
+        def update(options):
+            options.charging_enabled = enabled
+            return options
+
+        await self._async_update_schedule(vehicle_id, update)
 
     async def async_set_off_peak_charge_only_enabled(
         self, vehicle_id: str, enabled: bool
     ):
         """Toggle off-peak charge only on/off."""
-        vehicle = self.vehicle_manager.vehicles[vehicle_id]
-        options = self._build_schedule_options_from_vehicle(vehicle)
-        options.off_peak_charge_only_enabled = enabled
-        await self.async_schedule_charging_and_climate(vehicle_id, options)
+
+        def update(options):
+            options.off_peak_charge_only_enabled = enabled
+            return options
+
+        await self._async_update_schedule(vehicle_id, update)
 
     async def async_set_off_peak_charging(
         self,
@@ -465,58 +1177,67 @@ class HyundaiKiaConnectDataUpdateCoordinator(DataUpdateCoordinator):
         and only adjusts the window — used by the time entities. Other
         schedule fields (departures) are preserved.
         """
-        vehicle = self.vehicle_manager.vehicles[vehicle_id]
-        options = self._build_schedule_options_from_vehicle(vehicle)
-        if mode is not None:
-            if mode is OffPeakChargingMode.OFF:
-                options.charging_enabled = False
-            elif mode is OffPeakChargingMode.TIME:
-                options.charging_enabled = True
-                options.off_peak_charge_only_enabled = True
-            elif mode is OffPeakChargingMode.TARGET:
-                options.charging_enabled = True
-                options.off_peak_charge_only_enabled = False
-        if start is not None:
-            options.off_peak_start_time = start
-        if end is not None:
-            options.off_peak_end_time = end
-        await self.async_schedule_charging_and_climate(vehicle_id, options)
+
+        def update(options):
+            if mode is not None:
+                if mode is OffPeakChargingMode.OFF:
+                    options.charging_enabled = False
+                elif mode is OffPeakChargingMode.TIME:
+                    options.charging_enabled = True
+                    options.off_peak_charge_only_enabled = True
+                elif mode is OffPeakChargingMode.TARGET:
+                    options.charging_enabled = True
+                    options.off_peak_charge_only_enabled = False
+            if start is not None:
+                options.off_peak_start_time = start
+            if end is not None:
+                options.off_peak_end_time = end
+            return options
+
+        await self._async_update_schedule(vehicle_id, update)
 
     async def async_set_departure_enabled(
         self, vehicle_id: str, departure_num: int, enabled: bool
     ):
         """Toggle a departure schedule on/off."""
-        vehicle = self.vehicle_manager.vehicles[vehicle_id]
-        options = self._build_schedule_options_from_vehicle(vehicle)
-        if departure_num == 1:
-            options.first_departure.enabled = enabled
-        else:
-            options.second_departure.enabled = enabled
-        # reservFlag (charging_enabled) must be 1 for departure slots to take
-        # effect. If the vehicle doesn't expose ev_schedule_charge_enabled
-        # (None), the builder defaults it to False, causing the API to accept
-        # the request but ignore per-slot reservChargeSet.
-        if enabled and not options.charging_enabled:
-            options.charging_enabled = True
-        await self.async_schedule_charging_and_climate(vehicle_id, options)
+
+        def update(options):
+            if departure_num == 1:
+                options.first_departure.enabled = enabled
+            else:
+                options.second_departure.enabled = enabled
+            # reservFlag (charging_enabled) must be 1 for departure slots to
+            # take effect. If the vehicle doesn't expose
+            # ev_schedule_charge_enabled (None), the builder defaults it to
+            # False, causing the API to accept the request but ignore per-slot
+            # reservChargeSet.
+            if enabled and not options.charging_enabled:
+                options.charging_enabled = True
+            return options
+
+        await self._async_update_schedule(vehicle_id, update)
 
     async def async_set_departure_climate_enabled(
         self, vehicle_id: str, departure_num: int, enabled: bool
     ):
         """Toggle departure climate on/off."""
-        vehicle = self.vehicle_manager.vehicles[vehicle_id]
-        options = self._build_schedule_options_from_vehicle(vehicle)
-        options.climate_enabled = enabled
-        await self.async_schedule_charging_and_climate(vehicle_id, options)
+
+        def update(options):
+            options.climate_enabled = enabled
+            return options
+
+        await self._async_update_schedule(vehicle_id, update)
 
     async def async_set_departure_defrost(
         self, vehicle_id: str, departure_num: int, enabled: bool
     ):
         """Toggle departure defrost on/off."""
-        vehicle = self.vehicle_manager.vehicles[vehicle_id]
-        options = self._build_schedule_options_from_vehicle(vehicle)
-        options.defrost = enabled
-        await self.async_schedule_charging_and_climate(vehicle_id, options)
+
+        def update(options):
+            options.defrost = enabled
+            return options
+
+        await self._async_update_schedule(vehicle_id, update)
 
     async def async_start_hazard_lights(self, vehicle_id: str):
         await self._async_send_action(
@@ -537,6 +1258,7 @@ class HyundaiKiaConnectDataUpdateCoordinator(DataUpdateCoordinator):
             vehicle_id,
             lambda: self.vehicle_manager.start_valet_mode(vehicle_id),
             "start valet mode",
+            key="valet_start",
         )
 
     async def async_stop_valet_mode(self, vehicle_id: str):
@@ -544,6 +1266,8 @@ class HyundaiKiaConnectDataUpdateCoordinator(DataUpdateCoordinator):
             vehicle_id,
             lambda: self.vehicle_manager.stop_valet_mode(vehicle_id),
             "stop valet mode",
+            key="valet_stop",
+            cancels=frozenset({"valet_start"}),
         )
 
     async def async_set_v2l_limit(self, vehicle_id: str, limit: int):
@@ -553,15 +1277,29 @@ class HyundaiKiaConnectDataUpdateCoordinator(DataUpdateCoordinator):
                 vehicle_id, limit
             ),
             "set V2L limit",
+            key="v2l_limit",
         )
 
     async def async_set_windows(
         self, vehicle_id: str, windowOptions: WindowRequestOptions
     ):
-        await self._async_send_action(
+        await self._async_set_windows_state(vehicle_id, windowOptions, "set windows")
+
+    async def _async_set_windows_state(
+        self, vehicle_id: str, options: WindowRequestOptions, error_label: str
+    ) -> None:
+        """Queue a window request; queued window requests merge into one."""
+        await self._async_submit_command(
             vehicle_id,
-            lambda: self.vehicle_manager.set_windows_state(vehicle_id, windowOptions),
-            "set windows",
+            VehicleCommand(
+                label=error_label,
+                send=lambda window_options: self.vehicle_manager.set_windows_state(
+                    vehicle_id, window_options
+                ),
+                payload=options,
+                key="windows",
+                merge=merge_window_options,
+            ),
         )
 
     async def async_set_navigation(self, vehicle_id: str, poi_list: list[POIInfo]):
@@ -578,11 +1316,7 @@ class HyundaiKiaConnectDataUpdateCoordinator(DataUpdateCoordinator):
             back_left=WINDOW_STATE.OPEN,
             back_right=WINDOW_STATE.OPEN,
         )
-        await self._async_send_action(
-            vehicle_id,
-            lambda: self.vehicle_manager.set_windows_state(vehicle_id, options),
-            "open all windows",
-        )
+        await self._async_set_windows_state(vehicle_id, options, "open all windows")
 
     async def async_close_all_windows(self, vehicle_id: str):
         options = WindowRequestOptions(
@@ -591,11 +1325,7 @@ class HyundaiKiaConnectDataUpdateCoordinator(DataUpdateCoordinator):
             back_left=WINDOW_STATE.CLOSED,
             back_right=WINDOW_STATE.CLOSED,
         )
-        await self._async_send_action(
-            vehicle_id,
-            lambda: self.vehicle_manager.set_windows_state(vehicle_id, options),
-            "close all windows",
-        )
+        await self._async_set_windows_state(vehicle_id, options, "close all windows")
 
     async def async_vent_all_windows(self, vehicle_id: str):
         options = WindowRequestOptions(
@@ -604,11 +1334,7 @@ class HyundaiKiaConnectDataUpdateCoordinator(DataUpdateCoordinator):
             back_left=WINDOW_STATE.VENTILATION,
             back_right=WINDOW_STATE.VENTILATION,
         )
-        await self._async_send_action(
-            vehicle_id,
-            lambda: self.vehicle_manager.set_windows_state(vehicle_id, options),
-            "vent all windows",
-        )
+        await self._async_set_windows_state(vehicle_id, options, "vent all windows")
 
     async def _async_save_token(self):
         """Persist the latest token into the config entry."""
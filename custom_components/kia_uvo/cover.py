@@ -64,18 +64,26 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     coordinator = hass.data[DOMAIN][config_entry.unique_id]
-    entities = []
-    for vehicle_id in coordinator.vehicle_manager.vehicles:
-        vehicle: Vehicle = coordinator.vehicle_manager.vehicles[vehicle_id]
-        if not vehicle.supports_window_control:
-            continue
-        for description in COVER_DESCRIPTIONS:
-            if getattr(vehicle, description.key, None) is not None:
-                entities.append(
-                    HyundaiKiaConnectCover(coordinator, description, vehicle)
-                )
-
-    async_add_entities(entities)
+
+    def vehicle_entities(vehicle: Vehicle) -> list[HyundaiKiaConnectCover]:
+        capabilities = coordinator.capabilities.get(vehicle)
+        if not capabilities.supports(
+            "supports_window_control", lambda v: v.supports_window_control
+        ):
+            return []
+        return [
+            HyundaiKiaConnectCover(coordinator, description, vehicle)
+            for description in COVER_DESCRIPTIONS
+            if capabilities.has(description.key)
+        ]
+
+    config_entry.async_on_unload(
+        coordinator.entity_factories.register(
+            vehicle_entities,
+            async_add_entities,
+            coordinator.vehicle_manager.vehicles.values(),
+        )
+    )
 
 
 PARALLEL_UPDATES = 1
@@ -0,0 +1,97 @@
+"""Date-keyed index of each vehicle's daily driving stats.
+
+The daily stats sensors used to format every stored day on each state
+write, and the "today" sensor scanned the whole list for today's entry. The
+coordinator now rebuilds a vehicle's index only when its ``daily_stats``
+changed in a refresh; the sensors read the memoized attribute payloads, and
+today's entry is a dict lookup, so a new day needs no refresh to show up.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+from collections.abc import Mapping
+from typing import Any
+
+from hyundai_kia_connect_api import Vehicle
+from hyundai_kia_connect_api.Vehicle import DailyDrivingStats
+
+STATS_FIELDS = (
+    "total_consumed",
+    "engine_consumption",
+    "climate_consumption",
+    "onboard_electronics_consumption",
+    "battery_care_consumption",
+    "regenerated_energy",
+    "distance",
+)
+
+
+def day_key(day: dt.date) -> str:
+    """Return the attribute key of a day."""
+    return day.strftime("%Y-%m-%d")
+
+
+def _stats_payload(stats: DailyDrivingStats) -> dict[str, Any]:
+    return {name: getattr(stats, name) for name in STATS_FIELDS}
+
+
+class DailyStatsIndex:
+    """One vehicle's daily stats keyed by day, with memoized payloads."""
+
+    def __init__(self) -> None:
+        """Initialize empty."""
+        self.days: dict[str, dict[str, Any]] = {}
+        self._today: dict[str, Any] | None = None
+        self._today_date: dt.date | None = None
+
+    def update(self, daily_stats: list[DailyDrivingStats] | None) -> None:
+        """Rebuild from the vehicle's stats list."""
+        self.days = {
+            day_key(stats.date): _stats_payload(stats) for stats in daily_stats or ()
+        }
+        self._today = None
+
+    def __len__(self) -> int:
+        return len(self.days)
+
+    def today(self, today: dt.date) -> dict[str, Any]:
+        """Return the attributes for ``today``, zeros when it has no stats."""
+        if self._today is None or self._today_date != today:
+            key = day_key(today)
+            self._today_date = today
+            self._today = {
+                "today_date": key,
+                **self.days.get(key, dict.fromkeys(STATS_FIELDS, 0)),
+            }
+        return self._today
+
+
+class DailyStatsIndexes:
+    """Daily stats indexes of all vehicles of an account."""
+
+    def __init__(self) -> None:
+        """Initialize with no vehicles indexed."""
+        self._indexes: dict[str, DailyStatsIndex] = {}
+
+    def get(self, vehicle: Vehicle) -> DailyStatsIndex:
+        """Return the vehicle's index, building it on first use."""
+        index = self._indexes.get(vehicle.id)
+        if index is None:
+            index = self._indexes[vehicle.id] = DailyStatsIndex()
+            index.update(vehicle.daily_stats)
+        return index
+
+    def update(
+        self,
+        vehicles: Mapping[str, Vehicle],
+        changed_fields: Mapping[str, frozenset[str] | None],
+    ) -> None:
+        """Rebuild the indexes of vehicles whose daily stats changed."""
+        for vehicle_id, vehicle in vehicles.items():
+            index = self._indexes.get(vehicle_id)
+            changed = changed_fields.get(vehicle_id)
+            if index is not None and (changed is None or "daily_stats" in changed):
+                index.update(vehicle.daily_stats)
+        for vehicle_id in self._indexes.keys() - vehicles.keys():
+            del self._indexes[vehicle_id]
@@ -24,13 +24,19 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     coordinator = hass.data[DOMAIN][config_entry.unique_id]
-    entities = []
-    for vehicle_id in coordinator.vehicle_manager.vehicles:
-        vehicle: Vehicle = coordinator.vehicle_manager.vehicles[vehicle_id]
-        if vehicle.location is not None:
-            entities.append(HyundaiKiaConnectTracker(coordinator, vehicle))
 
-    async_add_entities(entities)
+    def vehicle_entities(vehicle: Vehicle) -> list[HyundaiKiaConnectTracker]:
+        if not coordinator.capabilities.get(vehicle).has("location"):
+            return []
+        return [HyundaiKiaConnectTracker(coordinator, vehicle)]
+
+    config_entry.async_on_unload(
+        coordinator.entity_factories.register(
+            vehicle_entities,
+            async_add_entities,
+            coordinator.vehicle_manager.vehicles.values(),
+        )
+    )
     return True
 
 
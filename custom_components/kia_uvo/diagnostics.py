@@ -21,16 +21,32 @@ from homeassistant.core import HomeAssistant
 from homeassistant.loader import async_get_integration
 
 from .const import (
+    CONF_ACTION_CONFIRMATION_TIMEOUT,
+    CONF_ACTIVE_SCAN_INTERVAL,
     CONF_BRAND,
+    CONF_COMMAND_REQUEST_RESERVE,
+    CONF_DAILY_REQUEST_BUDGET,
     CONF_ENABLE_GEOLOCATION_ENTITY,
+    CONF_EXECUTOR_THREADS,
     CONF_FORCE_REFRESH_INTERVAL,
+    CONF_IDLE_SCAN_INTERVAL,
+    CONF_MAX_CONCURRENT_ACTIONS,
     CONF_NO_FORCE_REFRESH_HOUR_FINISH,
     CONF_NO_FORCE_REFRESH_HOUR_START,
+    CONF_RAW_DATA_ON_DEMAND,
     CONF_USE_EMAIL_WITH_GEOCODE_API,
+    DEFAULT_ACTION_CONFIRMATION_TIMEOUT,
+    DEFAULT_ACTIVE_SCAN_INTERVAL,
+    DEFAULT_COMMAND_REQUEST_RESERVE,
+    DEFAULT_DAILY_REQUEST_BUDGET,
     DEFAULT_ENABLE_GEOLOCATION_ENTITY,
+    DEFAULT_EXECUTOR_THREADS,
     DEFAULT_FORCE_REFRESH_INTERVAL,
+    DEFAULT_IDLE_SCAN_INTERVAL,
+    DEFAULT_MAX_CONCURRENT_ACTIONS,
     DEFAULT_NO_FORCE_REFRESH_HOUR_FINISH,
     DEFAULT_NO_FORCE_REFRESH_HOUR_START,
+    DEFAULT_RAW_DATA_ON_DEMAND,
     DEFAULT_SCAN_INTERVAL,
     DEFAULT_USE_EMAIL_WITH_GEOCODE_API,
     DOMAIN,
@@ -70,6 +86,27 @@ def _config_options(entry: ConfigEntry) -> dict[str, Any]:
         "force_refresh_interval": entry.options.get(
             CONF_FORCE_REFRESH_INTERVAL, DEFAULT_FORCE_REFRESH_INTERVAL
         ),
+        "active_scan_interval": entry.options.get(
+            CONF_ACTIVE_SCAN_INTERVAL, DEFAULT_ACTIVE_SCAN_INTERVAL
+        ),
+        "idle_scan_interval": entry.options.get(
+            CONF_IDLE_SCAN_INTERVAL, DEFAULT_IDLE_SCAN_INTERVAL
+        ),
+        "max_concurrent_actions": entry.options.get(
+            CONF_MAX_CONCURRENT_ACTIONS, DEFAULT_MAX_CONCURRENT_ACTIONS
+        ),
+        "executor_threads": entry.options.get(
+            CONF_EXECUTOR_THREADS, DEFAULT_EXECUTOR_THREADS
+        ),
+        "action_confirmation_timeout": entry.options.get(
+            CONF_ACTION_CONFIRMATION_TIMEOUT, DEFAULT_ACTION_CONFIRMATION_TIMEOUT
+        ),
+        "daily_request_budget": entry.options.get(
+            CONF_DAILY_REQUEST_BUDGET, DEFAULT_DAILY_REQUEST_BUDGET
+        ),
+        "command_request_reserve": entry.options.get(
+            CONF_COMMAND_REQUEST_RESERVE, DEFAULT_COMMAND_REQUEST_RESERVE
+        ),
         "no_force_refresh_hour_start": entry.options.get(
             CONF_NO_FORCE_REFRESH_HOUR_START, DEFAULT_NO_FORCE_REFRESH_HOUR_START
         ),
@@ -82,6 +119,9 @@ def _config_options(entry: ConfigEntry) -> dict[str, Any]:
         "use_email_with_geocode_api": entry.options.get(
             CONF_USE_EMAIL_WITH_GEOCODE_API, DEFAULT_USE_EMAIL_WITH_GEOCODE_API
         ),
+        "raw_data_on_demand": entry.options.get(
+            CONF_RAW_DATA_ON_DEMAND, DEFAULT_RAW_DATA_ON_DEMAND
+        ),
     }
 
 
@@ -128,6 +168,15 @@ async def async_get_config_entry_diagnostics(
         "config_options": _config_options(entry),
         "auth": _token_meta(vm.token),
         "vehicle_count": len(vm.vehicles),
+        "requests_today": coordinator.request_ledger.as_dict(),
+        "api_calls": coordinator.api_metrics.as_dict(),
+        "executor": coordinator.executor.as_dict(),
+        "circuit_breaker": coordinator.breaker.as_dict(),
+        "on_demand_refreshes": coordinator.refreshes.as_dict(),
+        "last_actions": {
+            label: result.as_dict()
+            for label, result in coordinator.last_action_results.items()
+        },
     }
     # Redact only the uncontrolled Vehicle data (raw asdict: GPS, VIN, geocode
     # address, region-specific field names). Whole-payload redaction collides
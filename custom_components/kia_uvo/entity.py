@@ -1,8 +1,12 @@
 """Base Entity for Hyundai / Kia Connect integration."""
 
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import callback
+from homeassistant.helpers.device_registry import DeviceEntryType
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from .changes import has_changed
 from .const import BRANDS, DOMAIN, REGIONS
 
 
@@ -10,11 +14,14 @@ class HyundaiKiaConnectEntity(CoordinatorEntity):
     """Class for base entity for Hyundai / Kia Connect integration."""
 
     _attr_has_entity_name = True
+    # Vehicle fields this entity reads; None means any field of its vehicle.
+    _watched_fields: frozenset[str] | None = None
 
     def __init__(self, coordinator, vehicle):
         """Initialize the base entity."""
         super().__init__(coordinator)
         self.vehicle = vehicle
+        self._last_available: bool | None = None
 
     @property
     def device_info(self):
@@ -26,3 +33,42 @@ class HyundaiKiaConnectEntity(CoordinatorEntity):
             name=self.vehicle.name,
             serial_number=f"{self.vehicle.VIN}",
         )
+
+    @property
+    def available(self) -> bool:
+        """Also available on a fresh restored snapshot while the first
+        refreshes after a warm start fail."""
+        return super().available or self.coordinator.restored_state_is_fresh()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when a watched field or availability changed."""
+        available = self.available
+        if available == self._last_available and not has_changed(
+            self.coordinator.changed_fields.get(self.vehicle.id),
+            self._watched_fields,
+        ):
+            return
+        self._last_available = available
+        super()._handle_coordinator_update()
+
+
+class HyundaiKiaConnectAccountEntity(CoordinatorEntity):
+    """Base entity for account-wide state, on a service device per entry."""
+
+    _attr_has_entity_name = True
+
+    def __init__(self, coordinator, config_entry: ConfigEntry):
+        """Initialize the account entity."""
+        super().__init__(coordinator)
+        self.config_entry = config_entry
+
+    @property
+    def device_info(self):
+        """Return device information to use for this entity."""
+        return DeviceInfo(
+            identifiers={(DOMAIN, self.config_entry.unique_id)},
+            manufacturer=f"{BRANDS[self.coordinator.vehicle_manager.brand]} {REGIONS[self.coordinator.vehicle_manager.region]}",
+            name=self.config_entry.title,
+            entry_type=DeviceEntryType.SERVICE,
+        )
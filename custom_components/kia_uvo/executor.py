@@ -0,0 +1,84 @@
+"""A bounded thread pool of the integration's own for blocking library calls.
+
+The library is synchronous, and a slow backend keeps an executor thread per
+call for the whole round trip. In HA's shared default executor that competes
+with the recorder, cameras and every other integration; here each account
+gets a pool of its own, sized by the ``executor_threads`` option, so a stuck
+Kia / Hyundai backend can only exhaust its own threads.
+
+The pool counts calls waiting for a thread (queue depth) and calls running
+(busy threads), with the peaks of both since startup.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class LibraryExecutor:
+    """A ThreadPoolExecutor with queue-depth and busy-thread counts."""
+
+    def __init__(self, max_workers: int, name: str) -> None:
+        """Initialize; threads are started on demand up to ``max_workers``."""
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=name
+        )
+        self._lock = threading.Lock()
+        self.queued = 0
+        self.busy = 0
+        self.peak_queued = 0
+        self.peak_busy = 0
+
+    def _run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        with self._lock:
+            self.queued -= 1
+            self.busy += 1
+            self.peak_busy = max(self.peak_busy, self.busy)
+        try:
+            return fn(*args)
+        finally:
+            with self._lock:
+                self.busy -= 1
+
+    def async_add_job(
+        self, loop: asyncio.AbstractEventLoop, fn: Callable[..., Any], *args: Any
+    ) -> asyncio.Future:
+        """Schedule ``fn(*args)`` on the pool; like hass.async_add_executor_job."""
+        with self._lock:
+            self.queued += 1
+            self.peak_queued = max(self.peak_queued, self.queued)
+        try:
+            return loop.run_in_executor(self._executor, self._run, fn, *args)
+        except RuntimeError:
+            with self._lock:
+                self.queued -= 1
+            raise
+
+    def shutdown(self) -> None:
+        """Drop calls still waiting for a thread and wait for running ones.
+
+        Blocking; run it in HA's executor.
+        """
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        with self._lock:
+            if self.queued:
+                _LOGGER.debug("Dropped %d queued library calls", self.queued)
+            self.queued = 0
+
+    def as_dict(self) -> dict[str, int]:
+        """Return a JSON-friendly view for diagnostics."""
+        return {
+            "threads": self.max_workers,
+            "busy": self.busy,
+            "queued": self.queued,
+            "peak_busy": self.peak_busy,
+            "peak_queued": self.peak_queued,
+        }
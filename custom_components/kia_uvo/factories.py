@@ -0,0 +1,92 @@
+"""Per-vehicle entity factories that add entities without a reload.
+
+Platforms gate most vehicle entities on the vehicle reporting a value at
+setup. A field that first shows up later (a charge limit after a force
+refresh, a newly added vehicle) used to need a reload, with its full
+re-login and first refresh, before its entity existed. Each platform now
+registers a factory building its entities for one vehicle; after a refresh
+that changed a vehicle's feature set (see ``capabilities``) the coordinator
+runs the factories for that vehicle again and adds the entities whose
+unique ids are new to the running platform.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+from hyundai_kia_connect_api import Vehicle
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class _Factory:
+    build: Callable[[Vehicle], Iterable[Any]]
+    add_entities: Callable[..., None]
+    update_before_add: bool
+    unique_ids: set[str] = field(default_factory=set)
+
+    def add(self, vehicles: Iterable[Vehicle]) -> list[Any]:
+        new = [
+            entity
+            for vehicle in vehicles
+            for entity in self.build(vehicle)
+            if entity.unique_id not in self.unique_ids
+        ]
+        if new:
+            self.unique_ids.update(entity.unique_id for entity in new)
+            if self.update_before_add:
+                self.add_entities(new, True)
+            else:
+                self.add_entities(new)
+        return new
+
+
+class EntityFactories:
+    """The vehicle entity factories of an account's running platforms."""
+
+    def __init__(self) -> None:
+        """Initialize with no factories."""
+        self._factories: list[_Factory] = []
+        self._vehicle_ids: set[str] = set()
+
+    def register(
+        self,
+        build: Callable[[Vehicle], Iterable[Any]],
+        add_entities: Callable[..., None],
+        vehicles: Iterable[Vehicle],
+        update_before_add: bool = False,
+    ) -> Callable[[], None]:
+        """Add ``build``'s entities for ``vehicles`` and keep it for later
+        refreshes; return a callable that unregisters it."""
+        vehicles = list(vehicles)
+        factory = _Factory(build, add_entities, update_before_add)
+        self._factories.append(factory)
+        self._vehicle_ids.update(vehicle.id for vehicle in vehicles)
+        factory.add(vehicles)
+
+        def unregister() -> None:
+            self._factories.remove(factory)
+
+        return unregister
+
+    def add_new(self, vehicles: Mapping[str, Vehicle], changed_ids: set[str]) -> int:
+        """Add the entities of vehicles that are new or whose feature set
+        changed; return how many were added."""
+        if not self._factories:
+            return 0
+        targets = [
+            vehicle
+            for vehicle_id, vehicle in vehicles.items()
+            if vehicle_id in changed_ids or vehicle_id not in self._vehicle_ids
+        ]
+        if not targets:
+            return 0
+        self._vehicle_ids.update(vehicle.id for vehicle in targets)
+        added = sum(len(factory.add(targets)) for factory in self._factories)
+        if added:
+            _LOGGER.debug("Added %d entities for newly reported fields", added)
+        return added
@@ -0,0 +1,137 @@
+"""Keep-alive HTTP connections shared by every config entry.
+
+Each coordinator's VehicleManager builds its own ``requests`` session, so
+accounts on the same regional API never share connections and a poll after
+an idle period pays a fresh TCP/TLS handshake. One adapter is mounted on
+every account's session instead: its urllib3 pool manager keeps one bounded
+pool of keep-alive connections per API host (region and brand), reused by
+all entries. Cookies and headers stay per session.
+
+Sessions whose regional API mounts its own adapter (the US APIs pin TLS
+settings that way) keep it. The pool lives in ``hass.data`` under
+``HTTP_POOL_KEY`` and is closed when the last entry unloads.
+
+Every attached session, pooled or not, also gets a response hook that
+counts HTTP requests for the request budget: each response (every retry
+and redirect hop included) is reported to the counter of the function
+wrapped by ``count_requests`` running on that thread.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Callable
+from typing import Any
+
+import requests
+from homeassistant.core import HomeAssistant, callback
+from requests.adapters import HTTPAdapter
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+HTTP_POOL_KEY = f"{DOMAIN}_http_pool"
+# API hosts kept pooled at once: regions times brands seen on one instance.
+POOL_HOSTS = 16
+# Keep-alive connections kept per host; extra concurrent calls still run,
+# their connections are just not kept.
+POOL_CONNECTIONS_PER_HOST = 10
+
+# Attributes the regional APIs keep their session under.
+_SESSION_ATTRIBUTES = ("session", "sessions")
+
+_local = threading.local()
+
+
+def api_sessions(api: Any) -> list[requests.Session]:
+    """Return the ``requests`` sessions a regional API makes its calls on."""
+    sessions = (getattr(api, name, None) for name in _SESSION_ATTRIBUTES)
+    return [session for session in sessions if isinstance(session, requests.Session)]
+
+
+def _count_response(response: requests.Response, *args: Any, **kwargs: Any) -> None:
+    if (count := getattr(_local, "count", None)) is not None:
+        count()
+
+
+def count_requests(fn: Callable[..., Any], count: Callable[[], None]) -> Callable:
+    """Return ``fn`` calling ``count`` for each HTTP request an attached
+    session answers while it runs on whichever worker thread runs it."""
+
+    def run(*args: Any) -> Any:
+        _local.count = count
+        try:
+            return fn(*args)
+        finally:
+            _local.count = None
+
+    return run
+
+
+class SharedHTTPAdapter(HTTPAdapter):
+    """An adapter that sessions may close without closing the pool."""
+
+    def close(self) -> None:
+        """Leave the shared pool open; see ``shutdown``."""
+
+    def shutdown(self) -> None:
+        """Close every pooled connection."""
+        super().close()
+
+
+class HttpPool:
+    """The shared adapter and the sessions it is mounted on."""
+
+    def __init__(
+        self,
+        hosts: int = POOL_HOSTS,
+        connections_per_host: int = POOL_CONNECTIONS_PER_HOST,
+    ) -> None:
+        """Initialize with no sessions attached."""
+        self.adapter = SharedHTTPAdapter(
+            pool_connections=hosts, pool_maxsize=connections_per_host
+        )
+        self.sessions = 0
+
+    def attach(self, api: Any) -> int:
+        """Mount the shared adapter on a regional API's sessions.
+
+        Returns how many sessions now use the pool.
+        """
+        attached = 0
+        for session in api_sessions(api):
+            if _count_response not in session.hooks["response"]:
+                session.hooks["response"].append(_count_response)
+            if type(session.get_adapter("https://")) is not HTTPAdapter:
+                continue
+            session.mount("https://", self.adapter)
+            attached += 1
+        self.sessions += attached
+        _LOGGER.debug(
+            "%s - %d session(s) of %s on the shared HTTP pool",
+            DOMAIN,
+            attached,
+            type(api).__name__,
+        )
+        return attached
+
+    def close(self) -> None:
+        """Close the pooled connections."""
+        self.adapter.shutdown()
+
+
+@callback
+def async_get_http_pool(hass: HomeAssistant) -> HttpPool:
+    """Return the domain's pool, creating it on first use."""
+    if (pool := hass.data.get(HTTP_POOL_KEY)) is None:
+        pool = hass.data[HTTP_POOL_KEY] = HttpPool()
+    return pool
+
+
+@callback
+def async_close_http_pool(hass: HomeAssistant) -> None:
+    """Close and drop the domain's pool, if there is one."""
+    if (pool := hass.data.pop(HTTP_POOL_KEY, None)) is not None:
+        pool.close()
@@ -0,0 +1,153 @@
+"""Latency and outcome metrics for Hyundai / Kia Connect library calls.
+
+Every blocking library call runs in HA's executor. A slow update can come
+from the backend, from the token refresh in front of it, or from the call
+waiting for a free executor thread, so each call records two durations:
+
+- queue wait: from submission until an executor thread starts the call;
+- latency: the library call itself, i.e. the round trips to the backend.
+
+The last ``METRICS_WINDOW`` samples are kept per operation for percentiles,
+with success and error counts (by exception type) since startup.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from collections import Counter, deque
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+METRICS_WINDOW = 200
+PERCENTILES = (50, 95, 99)
+
+
+def percentile(samples: Iterable[float], pct: float) -> float | None:
+    """Nearest-rank percentile of ``samples``; None when there are none."""
+    ordered = sorted(samples)
+    if not ordered:
+        return None
+    rank = math.ceil(len(ordered) * pct / 100)
+    return ordered[min(max(rank, 1), len(ordered)) - 1]
+
+
+def _summary(samples: deque[float]) -> dict[str, float | None]:
+    summary = {}
+    for pct in PERCENTILES:
+        value = percentile(samples, pct)
+        summary[f"p{pct}"] = round(value, 3) if value is not None else None
+    return summary
+
+
+@dataclass
+class CallStats:
+    """Rolling durations and outcome counts for one kind of call."""
+
+    latencies: deque[float] = field(
+        default_factory=lambda: deque(maxlen=METRICS_WINDOW)
+    )
+    queue_waits: deque[float] = field(
+        default_factory=lambda: deque(maxlen=METRICS_WINDOW)
+    )
+    successes: int = 0
+    errors: Counter[str] = field(default_factory=Counter)
+
+    @property
+    def calls(self) -> int:
+        """Calls finished since startup, successful or not."""
+        return self.successes + self.errors.total()
+
+    def record(
+        self, latency: float, queue_wait: float, error: BaseException | None
+    ) -> None:
+        """Add one finished call."""
+        self.latencies.append(latency)
+        self.queue_waits.append(queue_wait)
+        if error is None:
+            self.successes += 1
+        else:
+            self.errors[type(error).__name__] += 1
+
+    def latency(self, pct: float) -> float | None:
+        """Latency percentile over the window, in seconds."""
+        return percentile(self.latencies, pct)
+
+    def queue_wait(self, pct: float) -> float | None:
+        """Executor queue-wait percentile over the window, in seconds."""
+        return percentile(self.queue_waits, pct)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-friendly view for diagnostics."""
+        return {
+            "calls": self.calls,
+            "successes": self.successes,
+            "errors": dict(self.errors),
+            "latency": _summary(self.latencies),
+            "queue_wait": _summary(self.queue_waits),
+        }
+
+
+class ApiMetrics:
+    """Call metrics per library operation, plus an all-calls total."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        """Initialize with no calls recorded."""
+        self._clock = clock
+        self.total = CallStats()
+        self.operations: dict[str, CallStats] = {}
+
+    def record(
+        self,
+        operation: str,
+        latency: float,
+        queue_wait: float,
+        error: BaseException | None = None,
+    ) -> None:
+        """Add one finished call to its operation and to the total."""
+        self.operations.setdefault(operation, CallStats()).record(
+            latency, queue_wait, error
+        )
+        self.total.record(latency, queue_wait, error)
+
+    async def async_timed(
+        self,
+        operation: str,
+        add_executor_job: Callable[[Callable[[], Any]], Awaitable[Any]],
+        fn: Callable[..., Any],
+        *args: Any,
+    ) -> Any:
+        """Run ``fn`` through ``add_executor_job`` and record how long it
+        queued and ran. Both ends are timed on the worker thread, so event
+        loop delays in picking up the result are not counted."""
+        submitted = self._clock()
+        started: float | None = None
+        finished: float | None = None
+
+        def run() -> Any:
+            nonlocal started, finished
+            started = self._clock()
+            try:
+                return fn(*args)
+            finally:
+                finished = self._clock()
+
+        try:
+            result = await add_executor_job(run)
+        except Exception as err:
+            if started is not None and finished is not None:
+                self.record(operation, finished - started, started - submitted, err)
+            raise
+        self.record(operation, finished - started, started - submitted)
+        return result
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-friendly view for diagnostics."""
+        return {
+            "total": self.total.as_dict(),
+            "operations": {
+                operation: stats.as_dict()
+                for operation, stats in sorted(self.operations.items())
+            },
+        }
@@ -17,7 +17,8 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from hyundai_kia_connect_api import Vehicle
 
-from .const import DOMAIN, DYNAMIC_UNIT
+from .accessors import compile_accessors
+from .const import DOMAIN
 from .coordinator import HyundaiKiaConnectDataUpdateCoordinator
 from .entity import HyundaiKiaConnectEntity
 
@@ -64,16 +65,22 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     coordinator = hass.data[DOMAIN][config_entry.unique_id]
-    entities = []
-    for vehicle_id in coordinator.vehicle_manager.vehicles:
-        vehicle: Vehicle = coordinator.vehicle_manager.vehicles[vehicle_id]
-        for description in NUMBER_DESCRIPTIONS:
-            if getattr(vehicle, description.key, None) is not None:
-                entities.append(
-                    HyundaiKiaConnectNumber(coordinator, description, vehicle)
-                )
 
-    async_add_entities(entities)
+    def vehicle_entities(vehicle: Vehicle) -> list[HyundaiKiaConnectNumber]:
+        capabilities = coordinator.capabilities.get(vehicle)
+        return [
+            HyundaiKiaConnectNumber(coordinator, description, vehicle)
+            for description in NUMBER_DESCRIPTIONS
+            if capabilities.has(description.key)
+        ]
+
+    config_entry.async_on_unload(
+        coordinator.entity_factories.register(
+            vehicle_entities,
+            async_add_entities,
+            coordinator.vehicle_manager.vehicles.values(),
+        )
+    )
     return True
 
 
@@ -91,6 +98,9 @@ class HyundaiKiaConnectNumber(NumberEntity, HyundaiKiaConnectEntity):
         self.entity_description = description
         self._key = description.key
         self._attr_unique_id = f"{DOMAIN}_{vehicle.id}_{self._key}"
+        self._accessors = compile_accessors(
+            self._key, description.native_unit_of_measurement
+        )
         self._attr_icon = description.icon
         self._attr_mode = NumberMode.SLIDER
         self._attr_device_class = description.device_class
@@ -98,7 +108,7 @@ class HyundaiKiaConnectNumber(NumberEntity, HyundaiKiaConnectEntity):
     @property
     def native_value(self) -> float | None:
         """Return the entity value to represent the entity state."""
-        return getattr(self.vehicle, self._key)
+        return self._accessors.value(self.vehicle)
 
     @staticmethod
     def _is_valid_charge_limit(val) -> bool:
@@ -175,7 +185,4 @@ class HyundaiKiaConnectNumber(NumberEntity, HyundaiKiaConnectEntity):
     @property
     def native_unit_of_measurement(self):
         """Return the unit the value was reported in by the sensor"""
-        if self.entity_description.native_unit_of_measurement == DYNAMIC_UNIT:
-            return getattr(self.vehicle, self._key + "_unit")
-        else:
-            return self.entity_description.native_unit_of_measurement
+        return self._accessors.unit(self.vehicle)
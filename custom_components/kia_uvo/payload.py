@@ -0,0 +1,37 @@
+"""Raw vehicle payloads served on demand.
+
+The all-data sensor used to carry each vehicle's raw API payload as a state
+attribute, which HA serializes on every write, stores in the recorder and
+pushes to every open frontend. With the ``raw_data_on_demand`` option the
+sensor only shows a digest and the time of the payload; the payload itself
+is fetched with the ``get_vehicle_data`` service.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Any
+
+from hyundai_kia_connect_api import Vehicle
+
+
+def payload_digest(data: Any) -> str | None:
+    """Return a short, stable content hash of a raw payload."""
+    if data is None:
+        return None
+    encoded = json.dumps(
+        data, sort_keys=True, separators=(",", ":"), default=str
+    ).encode()
+    return hashlib.blake2b(encoded, digest_size=8).hexdigest()
+
+
+def vehicle_payload(vehicle: Vehicle) -> dict[str, Any]:
+    """Return a vehicle's raw payload with its digest, for a service response."""
+    updated_at = vehicle.last_updated_at
+    return {
+        "vehicle_name": vehicle.name,
+        "digest": payload_digest(vehicle.data),
+        "updated_at": updated_at.isoformat() if updated_at else None,
+        "vehicle_data": vehicle.data,
+    }
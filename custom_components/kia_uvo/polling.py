@@ -0,0 +1,87 @@
+"""State-adaptive polling policy for Hyundai / Kia Connect.
+
+Decides each vehicle's cached and forced refresh intervals from its live
+state: a vehicle that is charging, driving or running climate is polled at
+the active interval, one that has been parked and idle for a while backs
+off to the idle interval, and everything else uses the configured scan
+interval.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+from dataclasses import dataclass
+from enum import StrEnum
+
+from hyundai_kia_connect_api import Vehicle
+
+# A vehicle whose own data (last_updated_at) is older than this, and which is
+# not charging, running or conditioning, counts as parked and idle.
+IDLE_AFTER = dt.timedelta(hours=1)
+
+
+class PollingState(StrEnum):
+    """Polling cadence a vehicle is currently in."""
+
+    ACTIVE = "active"
+    NORMAL = "normal"
+    IDLE = "idle"
+
+
+@dataclass(frozen=True)
+class PollingPolicy:
+    """Interval bounds in seconds, taken from the config entry options."""
+
+    scan_interval: int
+    force_refresh_interval: int
+    active_interval: int
+    idle_interval: int
+
+    @classmethod
+    def from_options(
+        cls,
+        scan_interval: int,
+        force_refresh_interval: int,
+        active_interval: int,
+        idle_interval: int,
+    ) -> PollingPolicy:
+        """Build the policy from option values, where an active interval of 0
+        means the scan interval. Polling then only gets less frequent than
+        the scan interval unless a shorter active interval is configured."""
+        return cls(
+            scan_interval=scan_interval,
+            force_refresh_interval=force_refresh_interval,
+            active_interval=active_interval or scan_interval,
+            idle_interval=max(idle_interval, scan_interval),
+        )
+
+    def state(self, vehicle: Vehicle, now: dt.datetime) -> PollingState:
+        """Classify the vehicle from the signals the coordinator already has."""
+        if (
+            vehicle.ev_battery_is_charging
+            or vehicle.engine_is_running
+            or vehicle.air_control_is_on
+        ):
+            return PollingState.ACTIVE
+        if (
+            vehicle.last_updated_at is not None
+            and now - vehicle.last_updated_at > IDLE_AFTER
+        ):
+            return PollingState.IDLE
+        return PollingState.NORMAL
+
+    def intervals(self, state: PollingState) -> tuple[int, int]:
+        """Return (scan_interval, force_refresh_interval) for a state.
+
+        The active interval is the floor and the idle interval the ceiling;
+        the configured scan interval is clamped between them. Only an idle
+        vehicle stretches its force refresh interval, since forcing a
+        sleeping car is what costs 12V battery and quota.
+        """
+        low = min(self.active_interval, self.idle_interval)
+        high = max(self.active_interval, self.idle_interval)
+        if state is PollingState.ACTIVE:
+            return low, self.force_refresh_interval
+        if state is PollingState.IDLE:
+            return high, max(self.force_refresh_interval, high)
+        return min(max(self.scan_interval, low), high), self.force_refresh_interval
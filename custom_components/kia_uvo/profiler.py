@@ -0,0 +1,98 @@
+"""On-demand profiling of coordinator refresh cycles and commands.
+
+A session profiles the event loop thread from start until the requested
+number of cycles (listener fan-outs after an update, or finished commands)
+has run, so the update logic and the entity writes it triggers are both
+covered. Library calls made in the executor during the session are profiled
+on their worker thread and merged into the same statistics.
+
+On Python 3.12+ cProfile is built on sys.monitoring and one profiler sees
+every thread, so a second one cannot be enabled; the worker side then falls
+back to the session's profile, which already records those calls.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import cProfile
+import pstats
+import time
+from collections.abc import Callable
+from typing import Any
+
+DEFAULT_PROFILE_TOP = 20
+
+
+class RefreshProfiler:
+    """One profiling session over the next ``cycles`` cycles."""
+
+    def __init__(self, cycles: int, done: asyncio.Future) -> None:
+        """Initialize; ``done`` resolves once enough cycles have run."""
+        self.target = cycles
+        self.cycles = 0
+        self.done = done
+        self.started: float | None = None
+        self.duration = 0.0
+        self._loop_profile = cProfile.Profile()
+        self._executor_profiles: list[cProfile.Profile] = []
+
+    def start(self) -> None:
+        """Start profiling the calling (event loop) thread.
+
+        Raises ValueError when another profiler is already active.
+        """
+        self._loop_profile.enable()
+        self.started = time.monotonic()
+
+    def wrap(self, fn: Callable[..., Any]) -> Callable[..., Any]:
+        """Return ``fn`` profiled on whichever worker thread runs it."""
+
+        def run(*args: Any) -> Any:
+            profile = cProfile.Profile()
+            try:
+                profile.enable()
+            except ValueError:
+                return fn(*args)
+            try:
+                return fn(*args)
+            finally:
+                profile.disable()
+                self._executor_profiles.append(profile)
+
+        return run
+
+    def cycle_done(self) -> None:
+        """Count one finished cycle and resolve ``done`` at the target."""
+        self.cycles += 1
+        if self.cycles >= self.target and not self.done.done():
+            self.done.set_result(None)
+
+    def stop(self) -> pstats.Stats:
+        """Stop profiling and return the loop and executor stats combined."""
+        self._loop_profile.disable()
+        if self.started is not None:
+            self.duration = time.monotonic() - self.started
+        stats = pstats.Stats(self._loop_profile)
+        for profile in self._executor_profiles:
+            stats.add(profile)
+        return stats
+
+
+def profile_summary(stats: pstats.Stats, top: int = DEFAULT_PROFILE_TOP) -> list:
+    """The ``top`` functions by cumulative time, for a service response."""
+    rows = sorted(
+        stats.stats.items(),  # type: ignore[attr-defined]
+        key=lambda item: item[1][3],
+        reverse=True,
+    )
+    summary = []
+    for (filename, line, name), (_, calls, total, cumulative, _) in rows[:top]:
+        summary.append(
+            {
+                "function": f"{filename}:{line}({name})",
+                "calls": calls,
+                "total_time": round(total, 4),
+                "cumulative_time": round(cumulative, 4),
+            }
+        )
+    return summary
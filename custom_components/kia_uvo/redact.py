@@ -25,12 +25,15 @@ _SENSITIVE_SUBSTRINGS = (
     "account",
     "email",
     "userid",
+    "username",
+    "loginid",
     "sessionid",
     "rmtoken",
     "secret",
     "latitude",
     "longitude",
     "geocode",
+    "pauth",
 )
 
 _SENSITIVE_EXACT = frozenset(
@@ -43,20 +46,59 @@ _SENSITIVE_EXACT = frozenset(
 )
 
 
-def _is_sensitive_key(key: str) -> bool:
+def _is_sensitive_key(key: str, extra: tuple[str, ...] = ()) -> bool:
     normalized = key.lower().replace("_", "").replace("-", "")
     if normalized in _SENSITIVE_EXACT:
         return True
-    return any(s in normalized for s in _SENSITIVE_SUBSTRINGS)
+    return any(s in normalized for s in (*_SENSITIVE_SUBSTRINGS, *extra))
 
 
-def redact(obj: Any) -> Any:
-    """Recursively redact dict values whose key matches a sensitive pattern."""
+def _redact_strings(obj: Any) -> Any:
     if isinstance(obj, dict):
-        return {
-            key: (REDACTED if _is_sensitive_key(key) else redact(value))
-            for key, value in obj.items()
-        }
+        return {key: _redact_strings(value) for key, value in obj.items()}
     if isinstance(obj, list):
-        return [redact(item) for item in obj]
+        return [_redact_strings(item) for item in obj]
+    return REDACTED if isinstance(obj, str) else obj
+
+
+def _redact_value(value: Any, options: dict[str, Any]) -> Any:
+    """Redact a sensitive value but keep its shape: every string in it is
+    replaced, a number or boolean on its own becomes its type's zero."""
+    if isinstance(value, dict | list):
+        return _redact_strings(redact(value, **options))
+    if isinstance(value, str):
+        return REDACTED
+    return type(value)()
+
+
+def _redact_item(key: str, value: Any, options: dict[str, Any]) -> Any:
+    if not _is_sensitive_key(key, options["extra"]):
+        return redact(value, **options)
+    if isinstance(value, str) and value in options["keep"]:
+        return value
+    return _redact_value(value, options) if options["keep_structure"] else REDACTED
+
+
+def redact(
+    obj: Any,
+    *,
+    keep_structure: bool = False,
+    extra: tuple[str, ...] = (),
+    keep: frozenset[str] = frozenset(),
+) -> Any:
+    """Recursively redact dict values whose key matches a sensitive pattern.
+
+    With ``keep_structure`` the result still parses like the original (for
+    replaying recorded API payloads): a sensitive dict or list keeps its
+    keys and numbers with every string in it redacted, and a sensitive
+    number or boolean is zeroed rather than turned into a string. ``extra``
+    adds key substrings to redact on top of the built-in ones, and strings
+    in ``keep`` (placeholders that already stand in for a secret) are left
+    as they are even under a sensitive key.
+    """
+    options = {"keep_structure": keep_structure, "extra": extra, "keep": keep}
+    if isinstance(obj, dict):
+        return {key: _redact_item(key, value, options) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [redact(item, **options) for item in obj]
     return obj
@@ -0,0 +1,171 @@
+"""Per-vehicle refresh scheduling for Hyundai / Kia Connect.
+
+Each vehicle on the account keeps its own next-due time and its own cached
+and forced refresh intervals. The coordinator wakes up when the earliest
+vehicle is due and refreshes only the vehicles whose time has come, so an
+idle car on a multi-vehicle account no longer rides along with one that is
+charging.
+
+Large fleets are spread out so the backend never sees one burst: each
+vehicle's interval gets a fixed jitter derived from the config entry and
+vehicle id (stable across restarts, different per account and car), and a
+cycle refreshes at most ``REFRESH_WAVE_SIZE`` vehicles, most overdue first;
+the rest follow in later waves ``MIN_UPDATE_INTERVAL`` apart.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import hashlib
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from hyundai_kia_connect_api import Vehicle
+
+# Never reschedule the coordinator tighter than this, even when a vehicle is
+# already overdue; keeps a failing vehicle from spinning the event loop.
+MIN_UPDATE_INTERVAL = dt.timedelta(seconds=10)
+# Delay before retrying a vehicle whose refresh failed.
+RETRY_INTERVAL = dt.timedelta(seconds=60)
+# A vehicle's jitter is up to this share of its interval, capped at MAX_JITTER.
+JITTER_FRACTION = 0.1
+MAX_JITTER = dt.timedelta(minutes=5)
+# Vehicles refreshed per coordinator cycle.
+REFRESH_WAVE_SIZE = 10
+
+
+def jitter_fraction(key: str) -> float:
+    """A fraction in [0, 1) that is fixed for ``key``."""
+    digest = hashlib.blake2b(key.encode(), digest_size=8).digest()
+    return int.from_bytes(digest) / 2**64
+
+
+@dataclass
+class VehicleSchedule:
+    """Refresh bookkeeping for a single vehicle (intervals in seconds)."""
+
+    scan_interval: int
+    force_refresh_interval: int
+    next_refresh: dt.datetime | None = None
+    last_refresh: dt.datetime | None = None
+    jitter: float = 0.0
+
+    @property
+    def interval(self) -> dt.timedelta:
+        """Wake-up interval: a forced refresh can come due before a cached one."""
+        return dt.timedelta(
+            seconds=min(self.scan_interval, self.force_refresh_interval)
+        )
+
+    @property
+    def jittered_interval(self) -> dt.timedelta:
+        """The interval plus this vehicle's share of jitter."""
+        interval = self.interval
+        return interval + min(interval * JITTER_FRACTION * self.jitter, MAX_JITTER)
+
+
+class VehicleRefreshScheduler:
+    """Track when each vehicle next needs a cached or forced refresh."""
+
+    def __init__(
+        self,
+        scan_interval: int,
+        force_refresh_interval: int,
+        jitter_seed: str | None = None,
+    ) -> None:
+        """Initialize with the account-wide default intervals (seconds).
+
+        With a ``jitter_seed`` (the config entry id) every vehicle's interval
+        is jittered; without one, intervals are exact.
+        """
+        self.scan_interval = scan_interval
+        self.force_refresh_interval = force_refresh_interval
+        self.jitter_seed = jitter_seed
+        self._schedules: dict[str, VehicleSchedule] = {}
+
+    def get(self, vehicle_id: str) -> VehicleSchedule:
+        """Return the schedule for a vehicle, creating it due immediately."""
+        if vehicle_id not in self._schedules:
+            self._schedules[vehicle_id] = VehicleSchedule(
+                scan_interval=self.scan_interval,
+                force_refresh_interval=self.force_refresh_interval,
+                jitter=jitter_fraction(f"{self.jitter_seed}:{vehicle_id}")
+                if self.jitter_seed is not None
+                else 0.0,
+            )
+        return self._schedules[vehicle_id]
+
+    def sync(self, vehicle_ids: Iterable[str]) -> None:
+        """Add schedules for new vehicles and drop removed ones."""
+        vehicle_ids = set(vehicle_ids)
+        for vehicle_id in vehicle_ids:
+            self.get(vehicle_id)
+        for vehicle_id in set(self._schedules) - vehicle_ids:
+            del self._schedules[vehicle_id]
+
+    def set_intervals(
+        self, vehicle_id: str, scan_interval: int, force_refresh_interval: int
+    ) -> None:
+        """Change a vehicle's intervals, pulling its next refresh forward if
+        the new intervals make it due sooner."""
+        schedule = self.get(vehicle_id)
+        schedule.scan_interval = scan_interval
+        schedule.force_refresh_interval = force_refresh_interval
+        if schedule.last_refresh is not None:
+            candidate = schedule.last_refresh + schedule.jittered_interval
+            if schedule.next_refresh is None or candidate < schedule.next_refresh:
+                schedule.next_refresh = candidate
+
+    def due(self, now: dt.datetime, limit: int | None = None) -> list[str]:
+        """Return the ids of vehicles whose next refresh is at or before now,
+        most overdue first; at most ``limit`` of them (one wave)."""
+        due = [
+            (
+                schedule.next_refresh or dt.datetime.min.replace(tzinfo=dt.UTC),
+                vehicle_id,
+            )
+            for vehicle_id, schedule in self._schedules.items()
+            if schedule.next_refresh is None or schedule.next_refresh <= now
+        ]
+        due.sort()
+        return [vehicle_id for _, vehicle_id in due[:limit]]
+
+    def is_force_due(self, vehicle: Vehicle, now: dt.datetime) -> bool:
+        """Mirror VehicleManager.check_and_force_update_vehicle per vehicle:
+        force only when the car's own data is older than its force interval."""
+        if vehicle.last_updated_at is None:
+            return False
+        schedule = self.get(vehicle.id)
+        age = (now - vehicle.last_updated_at).total_seconds()
+        return age > schedule.force_refresh_interval
+
+    def mark_refreshed(self, vehicle_id: str, now: dt.datetime) -> None:
+        """Record a successful refresh and schedule the next one."""
+        schedule = self.get(vehicle_id)
+        schedule.last_refresh = now
+        schedule.next_refresh = now + schedule.jittered_interval
+
+    def mark_failed(self, vehicle_id: str, now: dt.datetime) -> None:
+        """Retry a failed vehicle after RETRY_INTERVAL (or its own interval,
+        if shorter) instead of leaving it due on every cycle."""
+        schedule = self.get(vehicle_id)
+        schedule.next_refresh = now + min(RETRY_INTERVAL, schedule.interval)
+
+    def defer(self, vehicle_id: str, until: dt.datetime) -> None:
+        """Hold a vehicle's next refresh back until the given time."""
+        self.get(vehicle_id).next_refresh = until
+
+    def mark_due(self, vehicle_id: str) -> None:
+        """Make a vehicle due on the next coordinator cycle."""
+        self.get(vehicle_id).next_refresh = None
+
+    def next_update_interval(self, now: dt.datetime) -> dt.timedelta:
+        """Time until the earliest vehicle is due, floored at the minimum."""
+        if not self._schedules:
+            return dt.timedelta(
+                seconds=min(self.scan_interval, self.force_refresh_interval)
+            )
+        earliest = min(
+            (schedule.next_refresh or now) for schedule in self._schedules.values()
+        )
+        return max(earliest - now, MIN_UPDATE_INTERVAL)
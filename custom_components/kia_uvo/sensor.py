@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from datetime import date
+from datetime import datetime
 from typing import Final
 
 from homeassistant.components.sensor import (
@@ -21,16 +21,40 @@ from homeassistant.const import (
     UnitOfPower,
     UnitOfTime,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_time_change
+from homeassistant.util import dt as dt_util
 from hyundai_kia_connect_api import Vehicle
 from hyundai_kia_connect_api.const import ENGINE_TYPES
 
-from .const import CHARGING_CURRENTS, DOMAIN, DYNAMIC_UNIT
-from .entity import HyundaiKiaConnectEntity
+from .accessors import compile_accessors
+from .breaker import BreakerState
+from .budget import RequestFamily
+from .changes import SCHEDULE_FIELD, watched_fields
+from .const import (
+    CONF_RAW_DATA_ON_DEMAND,
+    DEFAULT_RAW_DATA_ON_DEMAND,
+    DOMAIN,
+    DYNAMIC_UNIT,
+)
+from .entity import HyundaiKiaConnectAccountEntity, HyundaiKiaConnectEntity
+from .payload import payload_digest
 
 _LOGGER = logging.getLogger(__name__)
 
+# Fields a sensor reads besides its key and unit, for change tracking.
+EXTRA_WATCHED_FIELDS: Final[dict[str, tuple[str, ...]]] = {
+    "_geocode_name": ("_geocode_address",),
+    "dtc_count": ("dtc_descriptions",),
+    "location_last_updated_at": ("_location_last_set_time",),
+    # The per-tire units are properties derived from the shared field.
+    "tire_pressure_front_left": ("tire_pressure_unit",),
+    "tire_pressure_front_right": ("tire_pressure_unit",),
+    "tire_pressure_rear_left": ("tire_pressure_unit",),
+    "tire_pressure_rear_right": ("tire_pressure_unit",),
+}
+
 SENSOR_DESCRIPTIONS: Final[tuple[SensorEntityDescription, ...]] = (
     SensorEntityDescription(
         key="_total_driving_range",
@@ -446,73 +470,45 @@ async def async_setup_entry(
 ) -> None:
     """Set up sensor platform."""
     coordinator = hass.data[DOMAIN][config_entry.unique_id]
-    entities = []
-    for vehicle_id in coordinator.vehicle_manager.vehicles:
-        vehicle: Vehicle = coordinator.vehicle_manager.vehicles[vehicle_id]
-        for description in SENSOR_DESCRIPTIONS:
-            if description.key == "_air_temperature":
-                # The setpoint is transient — it is None while climate is off
-                # (USA returns airTemp.value "OFF"), so don't gate on it. Gate
-                # on climate presence (air_control_is_on, the same signal the
-                # climate entity uses) to avoid creating an unusable sensor on
-                # vehicles that report no climate. A None setpoint -> HA
-                # `unknown`; the real setpoint arrives on the next poll.
-                create = (
-                    vehicle.air_control_is_on is not None
-                    or vehicle._air_temperature is not None
-                )
-            elif description.key == "car_battery_percentage":
-                # The 12V SoC is transient — None while the telematics unit
-                # is asleep, after a 12V reset, or when the status payload
-                # omits it. Don't gate creation on it: a None at setup (e.g.
-                # a version-update reload) means the entity isn't yielded and
-                # HA marks it "no longer provided", with no return until the
-                # next reload. Always create; None -> HA `unknown`, the real
-                # SoC arrives on the next poll. See #1803.
-                create = True
-            elif description.key == "ev_charging_power":
-                # Charging power is transient and usually None at setup while
-                # the vehicle is unplugged. Create the sensor for electrified
-                # vehicles so a later coordinator poll can publish the value
-                # without requiring an integration reload.
-                create = (
-                    vehicle.engine_type in (ENGINE_TYPES.EV, ENGINE_TYPES.PHEV)
-                    or vehicle.ev_charging_power is not None
-                )
-            elif description.key.startswith("tire_pressure_"):
-                # Transient like _air_temperature above: some backends (AU/NZ)
-                # report the TPMS no-data sentinel whenever the car is parked
-                # — nearly always the case at setup — so don't gate on the
-                # value. The parsed unit is the capability signal: non-None
-                # exactly for direct-TPMS vehicles (known PressureUnit), None
-                # for indirect TPMS (PressureUnit 3, e.g. KONA — #1786) and
-                # old-protocol vehicles, which never report a numeric
-                # pressure. A None pressure -> HA `unknown` until a poll
-                # catches the car driving.
-                create = (
-                    getattr(vehicle, description.key, None) is not None
-                    or vehicle.tire_pressure_unit is not None
-                )
-            else:
-                create = getattr(vehicle, description.key, None) is not None
-            if create:
-                entities.append(
-                    HyundaiKiaConnectSensor(coordinator, description, vehicle)
-                )
-        if vehicle.daily_stats:
-            entities.append(
-                DailyDrivingStatsEntity(
-                    coordinator, coordinator.vehicle_manager.vehicles[vehicle_id]
-                )
-            )
-            entities.append(
-                TodaysDailyDrivingStatsEntity(
-                    coordinator, coordinator.vehicle_manager.vehicles[vehicle_id]
-                )
-            )
-        entities.append(
-            VehicleEntity(coordinator, coordinator.vehicle_manager.vehicles[vehicle_id])
+    raw_data_on_demand = config_entry.options.get(
+        CONF_RAW_DATA_ON_DEMAND, DEFAULT_RAW_DATA_ON_DEMAND
+    )
+
+    def vehicle_entities(vehicle: Vehicle) -> list[SensorEntity]:
+        capabilities = coordinator.capabilities.get(vehicle)
+        entities: list[SensorEntity] = [
+            HyundaiKiaConnectSensor(coordinator, description, vehicle)
+            for description in SENSOR_DESCRIPTIONS
+            if capabilities.has_sensor(description.key)
+        ]
+        if capabilities.supports("daily_stats", lambda v: v.daily_stats):
+            entities.append(DailyDrivingStatsEntity(coordinator, vehicle))
+            entities.append(TodaysDailyDrivingStatsEntity(coordinator, vehicle))
+        entities.append(VehicleEntity(coordinator, vehicle, raw_data_on_demand))
+        entities.append(PollingIntervalSensor(coordinator, vehicle))
+        return entities
+
+    config_entry.async_on_unload(
+        coordinator.entity_factories.register(
+            vehicle_entities,
+            async_add_entities,
+            coordinator.vehicle_manager.vehicles.values(),
         )
+    )
+    entities = []
+    entities.extend(
+        ApiRequestsSensor(coordinator, config_entry, family) for family in RequestFamily
+    )
+    entities.append(ApiRequestsRemainingSensor(coordinator, config_entry))
+    entities.extend(
+        [
+            ApiLatencySensor(coordinator, config_entry),
+            ApiQueueWaitSensor(coordinator, config_entry),
+            ApiErrorsSensor(coordinator, config_entry),
+            ExecutorBusySensor(coordinator, config_entry),
+            ApiCircuitSensor(coordinator, config_entry),
+        ]
+    )
     async_add_entities(entities)
     return True
 
@@ -531,6 +527,12 @@ class HyundaiKiaConnectSensor(SensorEntity, HyundaiKiaConnectEntity):
         self.entity_description = description
         self._key = description.key
         self._attr_unique_id = f"{DOMAIN}_{vehicle.id}_{self._key}"
+        self._accessors = compile_accessors(
+            self._key, description.native_unit_of_measurement
+        )
+        self._watched_fields = watched_fields(
+            self._key, *EXTRA_WATCHED_FIELDS.get(self._key, ())
+        )
         self._attr_icon = description.icon
         self._attr_state_class = description.state_class
         self._attr_device_class = description.device_class
@@ -550,36 +552,27 @@ class HyundaiKiaConnectSensor(SensorEntity, HyundaiKiaConnectEntity):
     @property
     def native_value(self):
         """Return the value reported by the sensor."""
-        value = getattr(self.vehicle, self._key)
-        if self._key == "ev_charging_current":
-            return CHARGING_CURRENTS.get(value, None)
-        if self._key in ("ev_first_departure_days", "ev_second_departure_days"):
-            if isinstance(value, list):
-                return ", ".join(str(d) for d in value)
-            return value
-        return value
+        return self._accessors.value(self.vehicle)
 
     @property
     def native_unit_of_measurement(self):
         """Return the unit the value was reported in by the sensor"""
-        if self.entity_description.native_unit_of_measurement == DYNAMIC_UNIT:
-            return getattr(self.vehicle, self._key + "_unit")
-        else:
-            return self.entity_description.native_unit_of_measurement
+        return self._accessors.unit(self.vehicle)
 
     @property
     def state_attributes(self):
-        if self.entity_description.key == "_geocode_name":
-            return {"address": self.vehicle._geocode_address}
-        elif self.entity_description.key == "dtc_count":
-            return {"DTC Text": self.vehicle.dtc_descriptions}
+        return self._accessors.attributes(self.vehicle)
 
 
 class VehicleEntity(SensorEntity, HyundaiKiaConnectEntity):
     _attr_translation_key = "data"
+    _watched_fields = frozenset({"data", "name"})
+    # The raw payload is too big and too volatile for recorder history.
+    _unrecorded_attributes = frozenset({"vehicle_data"})
 
-    def __init__(self, coordinator, vehicle: Vehicle):
+    def __init__(self, coordinator, vehicle: Vehicle, on_demand: bool = False):
         super().__init__(coordinator, vehicle)
+        self._on_demand = on_demand
 
     @property
     def state(self):
@@ -591,6 +584,15 @@ class VehicleEntity(SensorEntity, HyundaiKiaConnectEntity):
 
     @property
     def state_attributes(self):
+        if self._on_demand:
+            updated_at = self.vehicle.last_updated_at
+            return {
+                "vehicle_data_digest": payload_digest(self.vehicle.data),
+                "vehicle_data_updated_at": updated_at.isoformat()
+                if updated_at
+                else None,
+                "vehicle_name": self.vehicle.name,
+            }
         return {
             "vehicle_data": self.vehicle.data,
             "vehicle_name": self.vehicle.name,
@@ -601,32 +603,231 @@ class VehicleEntity(SensorEntity, HyundaiKiaConnectEntity):
         return f"{DOMAIN}-all-data-{self.vehicle.id}"
 
 
+class PollingIntervalSensor(SensorEntity, HyundaiKiaConnectEntity):
+    """Effective cached polling interval chosen by the polling policy."""
+
+    _attr_translation_key = "polling_interval"
+    _attr_icon = "mdi:timer-sync-outline"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.MINUTES
+    _watched_fields = frozenset({SCHEDULE_FIELD})
+
+    def __init__(self, coordinator, vehicle: Vehicle):
+        super().__init__(coordinator, vehicle)
+        self._attr_unique_id = f"{DOMAIN}_{vehicle.id}_polling_interval"
+
+    @property
+    def native_value(self):
+        return self.coordinator.scheduler.get(self.vehicle.id).scan_interval / 60
+
+    @property
+    def extra_state_attributes(self):
+        state = self.coordinator.polling_states.get(self.vehicle.id)
+        return {"polling_state": state.value if state is not None else None}
+
+
+class ApiRequestsSensor(SensorEntity, HyundaiKiaConnectAccountEntity):
+    """HTTP requests sent today for one endpoint family.
+
+    Counts requests, not library calls: a cached update of every vehicle
+    or a login is several requests, each retry and redirect one more.
+    """
+
+    _attr_icon = "mdi:api"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_state_class = SensorStateClass.TOTAL
+
+    def __init__(self, coordinator, config_entry: ConfigEntry, family: RequestFamily):
+        super().__init__(coordinator, config_entry)
+        self._family = family
+        self._attr_translation_key = f"api_requests_{family}"
+        self._attr_unique_id = (
+            f"{DOMAIN}_{config_entry.unique_id}_api_requests_{family}"
+        )
+
+    @property
+    def native_value(self):
+        return self.coordinator.request_ledger.counts[self._family]
+
+    @property
+    def last_reset(self):
+        return dt_util.start_of_local_day(self.coordinator.request_ledger.day)
+
+
+class ApiRequestsRemainingSensor(SensorEntity, HyundaiKiaConnectAccountEntity):
+    """API requests left in today's budget; unknown without a budget."""
+
+    _attr_translation_key = "api_requests_remaining"
+    _attr_icon = "mdi:api"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(self, coordinator, config_entry: ConfigEntry):
+        super().__init__(coordinator, config_entry)
+        self._attr_unique_id = (
+            f"{DOMAIN}_{config_entry.unique_id}_api_requests_remaining"
+        )
+
+    @property
+    def native_value(self):
+        return self.coordinator.request_budget.remaining(
+            self.coordinator.request_ledger
+        )
+
+    @property
+    def extra_state_attributes(self):
+        budget = self.coordinator.request_budget
+        return {
+            "daily_budget": budget.daily_budget or None,
+            "command_reserve": budget.command_reserve,
+            "polls_remaining": budget.polls_remaining(self.coordinator.request_ledger),
+        }
+
+
+class ApiLatencySensor(SensorEntity, HyundaiKiaConnectAccountEntity):
+    """95th percentile duration of recent library calls."""
+
+    _attr_translation_key = "api_latency"
+    _attr_icon = "mdi:timer-outline"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.SECONDS
+    _attr_suggested_display_precision = 2
+
+    def __init__(self, coordinator, config_entry: ConfigEntry):
+        super().__init__(coordinator, config_entry)
+        self._attr_unique_id = f"{DOMAIN}_{config_entry.unique_id}_api_latency"
+
+    @property
+    def native_value(self):
+        return self.coordinator.api_metrics.total.latency(95)
+
+    @property
+    def extra_state_attributes(self):
+        metrics = self.coordinator.api_metrics
+        return {
+            "p50": metrics.total.latency(50),
+            "p99": metrics.total.latency(99),
+            "p95_by_operation": {
+                operation: stats.latency(95)
+                for operation, stats in metrics.operations.items()
+            },
+        }
+
+
+class ApiQueueWaitSensor(SensorEntity, HyundaiKiaConnectAccountEntity):
+    """95th percentile time recent library calls waited for an executor
+    thread."""
+
+    _attr_translation_key = "api_queue_wait"
+    _attr_icon = "mdi:timer-sand"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.SECONDS
+    _attr_suggested_display_precision = 2
+
+    def __init__(self, coordinator, config_entry: ConfigEntry):
+        super().__init__(coordinator, config_entry)
+        self._attr_unique_id = f"{DOMAIN}_{config_entry.unique_id}_api_queue_wait"
+
+    @property
+    def native_value(self):
+        return self.coordinator.api_metrics.total.queue_wait(95)
+
+    @property
+    def extra_state_attributes(self):
+        total = self.coordinator.api_metrics.total
+        return {"p50": total.queue_wait(50), "p99": total.queue_wait(99)}
+
+
+class ApiErrorsSensor(SensorEntity, HyundaiKiaConnectAccountEntity):
+    """Failed library calls since startup, by exception type."""
+
+    _attr_translation_key = "api_errors"
+    _attr_icon = "mdi:alert-circle-outline"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+
+    def __init__(self, coordinator, config_entry: ConfigEntry):
+        super().__init__(coordinator, config_entry)
+        self._attr_unique_id = f"{DOMAIN}_{config_entry.unique_id}_api_errors"
+
+    @property
+    def native_value(self):
+        return self.coordinator.api_metrics.total.errors.total()
+
+    @property
+    def extra_state_attributes(self):
+        total = self.coordinator.api_metrics.total
+        return {"calls": total.calls, **total.errors}
+
+
+class ExecutorBusySensor(SensorEntity, HyundaiKiaConnectAccountEntity):
+    """Threads of the account's pool running a library call, with the
+    calls queued behind them."""
+
+    _attr_translation_key = "executor_busy"
+    _attr_icon = "mdi:cogs"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(self, coordinator, config_entry: ConfigEntry):
+        super().__init__(coordinator, config_entry)
+        self._attr_unique_id = f"{DOMAIN}_{config_entry.unique_id}_executor_busy"
+
+    @property
+    def native_value(self):
+        return self.coordinator.executor.busy
+
+    @property
+    def extra_state_attributes(self):
+        executor = self.coordinator.executor
+        return {
+            "threads": executor.max_workers,
+            "queue_depth": executor.queued,
+            "peak_busy": executor.peak_busy,
+            "peak_queue_depth": executor.peak_queued,
+        }
+
+
+class ApiCircuitSensor(SensorEntity, HyundaiKiaConnectAccountEntity):
+    """State of the circuit breaker guarding polling calls."""
+
+    _attr_translation_key = "api_circuit"
+    _attr_icon = "mdi:electric-switch"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_device_class = SensorDeviceClass.ENUM
+
+    def __init__(self, coordinator, config_entry: ConfigEntry):
+        super().__init__(coordinator, config_entry)
+        self._attr_options = [state.value for state in BreakerState]
+        self._attr_unique_id = f"{DOMAIN}_{config_entry.unique_id}_api_circuit"
+
+    @property
+    def native_value(self):
+        return self.coordinator.breaker.state.value
+
+    @property
+    def extra_state_attributes(self):
+        breaker = self.coordinator.breaker.as_dict()
+        del breaker["state"]
+        return breaker
+
+
 class DailyDrivingStatsEntity(SensorEntity, HyundaiKiaConnectEntity):
     _attr_translation_key = "daily_driving_stats"
+    _watched_fields = frozenset({"daily_stats"})
 
     def __init__(self, coordinator, vehicle: Vehicle):
         super().__init__(coordinator, vehicle)
 
     @property
     def state(self):
-        return len(self.vehicle.daily_stats)
+        return len(self.coordinator.daily_stats.get(self.vehicle))
 
     @property
     def state_attributes(self):
-        m = {}
-        for day in self.vehicle.daily_stats:
-            key = day.date.strftime("%Y-%m-%d")
-            value = {
-                "total_consumed": day.total_consumed,
-                "engine_consumption": day.engine_consumption,
-                "climate_consumption": day.climate_consumption,
-                "onboard_electronics_consumption": day.onboard_electronics_consumption,
-                "battery_care_consumption": day.battery_care_consumption,
-                "regenerated_energy": day.regenerated_energy,
-                "distance": day.distance,
-            }
-            m[key] = value
-        return m
+        return self.coordinator.daily_stats.get(self.vehicle).days
 
     @property
     def unique_id(self):
@@ -639,46 +840,36 @@ class DailyDrivingStatsEntity(SensorEntity, HyundaiKiaConnectEntity):
 
 class TodaysDailyDrivingStatsEntity(SensorEntity, HyundaiKiaConnectEntity):
     _attr_translation_key = "todays_daily_driving_stats"
+    _watched_fields = frozenset({"daily_stats"})
 
     def __init__(self, coordinator, vehicle: Vehicle):
         super().__init__(coordinator, vehicle)
 
+    async def async_added_to_hass(self) -> None:
+        """Switch to the new day's stats at midnight."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_track_time_change(
+                self.hass, self._async_midnight, hour=0, minute=0, second=0
+            )
+        )
+
+    @callback
+    def _async_midnight(self, now: datetime) -> None:
+        self.async_write_ha_state()
+
+    def _today(self) -> dict:
+        return self.coordinator.daily_stats.get(self.vehicle).today(
+            dt_util.now().date()
+        )
+
     @property
     def state(self):
-        today = date.today()
-        todayskey = today.strftime("%Y-%m-%d")
-        return todayskey
+        return self._today()["today_date"]
 
     @property
     def state_attributes(self):
-        today = date.today()
-        todayskey = today.strftime("%Y-%m-%d")
-        m = {
-            "today_date": todayskey,
-            "total_consumed": 0,
-            "engine_consumption": 0,
-            "climate_consumption": 0,
-            "onboard_electronics_consumption": 0,
-            "battery_care_consumption": 0,
-            "regenerated_energy": 0,
-            "distance": 0,
-        }
-        for day in self.vehicle.daily_stats:
-            key = day.date.strftime("%Y-%m-%d")
-            if key == todayskey:
-                todayvalue = {
-                    "today_date": key,
-                    "total_consumed": day.total_consumed,
-                    "engine_consumption": day.engine_consumption,
-                    "climate_consumption": day.climate_consumption,
-                    "onboard_electronics_consumption": day.onboard_electronics_consumption,
-                    "battery_care_consumption": day.battery_care_consumption,
-                    "regenerated_energy": day.regenerated_energy,
-                    "distance": day.distance,
-                }
-                m = todayvalue
-                break
-        return m
+        return self._today()
 
     @property
     def unique_id(self):
@@ -4,7 +4,7 @@ from typing import cast
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_DEVICE_ID
-from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.core import HomeAssistant, ServiceCall, SupportsResponse, callback
 from homeassistant.helpers import device_registry
 from hyundai_kia_connect_api import (
     ClimateRequestOptions,
@@ -16,6 +16,8 @@ from hyundai_kia_connect_api import (
 
 from .const import DOMAIN, OffPeakChargingMode
 from .coordinator import HyundaiKiaConnectDataUpdateCoordinator
+from .payload import vehicle_payload
+from .profiler import DEFAULT_PROFILE_TOP
 
 SERVICE_UPDATE = "update"
 SERVICE_FORCE_UPDATE = "force_update"
@@ -37,6 +39,9 @@ SERVICE_STOP_VALET_MODE = "stop_valet_mode"
 SERVICE_SET_WINDOWS = "set_windows"
 SERVICE_SET_NAVIGATION = "set_navigation"
 SERVICE_SET_OFF_PEAK_CHARGING = "set_off_peak_charging"
+SERVICE_PROFILE = "profile"
+SERVICE_RECORD_CASSETTE = "record_cassette"
+SERVICE_GET_VEHICLE_DATA = "get_vehicle_data"
 
 SUPPORTED_SERVICES = (
     SERVICE_UPDATE,
@@ -59,8 +64,17 @@ SUPPORTED_SERVICES = (
     SERVICE_SET_WINDOWS,
     SERVICE_SET_NAVIGATION,
     SERVICE_SET_OFF_PEAK_CHARGING,
+    SERVICE_PROFILE,
+    SERVICE_RECORD_CASSETTE,
+    SERVICE_GET_VEHICLE_DATA,
 )
 
+SERVICE_RESPONSES = {
+    SERVICE_PROFILE: SupportsResponse.ONLY,
+    SERVICE_RECORD_CASSETTE: SupportsResponse.ONLY,
+    SERVICE_GET_VEHICLE_DATA: SupportsResponse.ONLY,
+}
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -330,6 +344,26 @@ def async_setup_services(hass: HomeAssistant) -> bool:
         )
         await coordinator.async_set_navigation(vehicle_id, [poi])
 
+    async def async_handle_profile(call):
+        coordinator = _get_coordinator_from_device(hass, call)
+        return await coordinator.async_profile(
+            cycles=int(call.data.get("cycles", 1)),
+            top=int(call.data.get("top", DEFAULT_PROFILE_TOP)),
+            timeout=float(call.data.get("timeout", 900)),
+        )
+
+    async def async_handle_record_cassette(call):
+        coordinator = _get_coordinator_from_device(hass, call)
+        return await coordinator.async_record_cassette(
+            cycles=int(call.data.get("cycles", 1)),
+            timeout=float(call.data.get("timeout", 900)),
+        )
+
+    async def async_handle_get_vehicle_data(call):
+        coordinator = _get_coordinator_from_device(hass, call)
+        vehicle_id = _get_vehicle_id_from_device(hass, call)
+        return vehicle_payload(coordinator.vehicle_manager.get_vehicle(vehicle_id))
+
     services = {
         SERVICE_FORCE_UPDATE: async_handle_force_update,
         SERVICE_UPDATE: async_handle_update,
@@ -351,10 +385,18 @@ def async_setup_services(hass: HomeAssistant) -> bool:
         SERVICE_SET_WINDOWS: async_handle_set_windows,
         SERVICE_SET_NAVIGATION: async_handle_set_navigation,
         SERVICE_SET_OFF_PEAK_CHARGING: async_handle_set_off_peak_charging,
+        SERVICE_PROFILE: async_handle_profile,
+        SERVICE_RECORD_CASSETTE: async_handle_record_cassette,
+        SERVICE_GET_VEHICLE_DATA: async_handle_get_vehicle_data,
     }
 
     for service in SUPPORTED_SERVICES:
-        hass.services.async_register(DOMAIN, service, services[service])
+        hass.services.async_register(
+            DOMAIN,
+            service,
+            services[service],
+            supports_response=SERVICE_RESPONSES.get(service, SupportsResponse.NONE),
+        )
     return True
 
 
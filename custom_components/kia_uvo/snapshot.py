@@ -0,0 +1,163 @@
+"""Persisted vehicle-state snapshot for warm starts.
+
+The coordinator stores the last good vehicle list and state after each
+successful update. On the next start the vehicles are restored from it, so
+platforms are set up immediately and the first API refresh runs in the
+background instead of blocking setup. Until a refresh succeeds, entities
+stay available on the restored state while the snapshot is younger than
+``SNAPSHOT_MAX_AGE``.
+
+Vehicle fields hold datetimes, enums and nested library dataclasses, none of
+which JSON keeps, so values are written with a small type tag and rebuilt on
+load. Only classes from the library package are ever reconstructed.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import datetime as dt
+import importlib
+import logging
+from collections.abc import Mapping
+from enum import Enum
+from typing import Any
+
+from hyundai_kia_connect_api import Vehicle
+
+_LOGGER = logging.getLogger(__name__)
+
+SNAPSHOT_STORAGE_VERSION = 1
+# Snapshot writes are batched; an update storm writes at most this often.
+SNAPSHOT_SAVE_DELAY = 60
+# A restored snapshot older than this no longer keeps entities available.
+SNAPSHOT_MAX_AGE = dt.timedelta(hours=12)
+
+_TYPE = "__type"
+_ALLOWED_MODULE = "hyundai_kia_connect_api"
+
+
+def _class_path(cls: type) -> str:
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+def _load_class(path: str) -> type:
+    module_name, _, qualname = path.partition(":")
+    if module_name.split(".")[0] != _ALLOWED_MODULE:
+        raise ValueError(f"Refusing to restore {path}")
+    obj: Any = importlib.import_module(module_name)
+    for part in qualname.split("."):
+        obj = getattr(obj, part)
+    return obj
+
+
+def encode_value(value: Any) -> Any:
+    """Convert a vehicle field value into JSON-safe tagged data."""
+    if value is None or isinstance(value, bool | int | float | str):
+        return value
+    if isinstance(value, Enum):
+        return {_TYPE: "enum", "class": _class_path(type(value)), "value": value.value}
+    if isinstance(value, dt.datetime):
+        return {_TYPE: "datetime", "value": value.isoformat()}
+    if isinstance(value, dt.date):
+        return {_TYPE: "date", "value": value.isoformat()}
+    if isinstance(value, dt.time):
+        return {_TYPE: "time", "value": value.isoformat()}
+    if isinstance(value, dt.timezone):
+        return {_TYPE: "timezone", "offset": value.utcoffset(None).total_seconds()}
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {
+            _TYPE: "dataclass",
+            "class": _class_path(type(value)),
+            "fields": {
+                field.name: encode_value(getattr(value, field.name))
+                for field in dataclasses.fields(value)
+            },
+        }
+    if isinstance(value, tuple):
+        return {_TYPE: "tuple", "items": [encode_value(item) for item in value]}
+    if isinstance(value, list):
+        return [encode_value(item) for item in value]
+    if isinstance(value, Mapping):
+        if all(isinstance(key, str) for key in value) and _TYPE not in value:
+            return {key: encode_value(item) for key, item in value.items()}
+        return {
+            _TYPE: "dict",
+            "items": [[encode_value(k), encode_value(v)] for k, v in value.items()],
+        }
+    raise TypeError(f"Cannot snapshot {type(value).__name__}")
+
+
+def decode_value(data: Any) -> Any:
+    """Rebuild a value written by encode_value."""
+    if isinstance(data, list):
+        return [decode_value(item) for item in data]
+    if not isinstance(data, dict):
+        return data
+    kind = data.get(_TYPE)
+    if kind is None:
+        return {key: decode_value(item) for key, item in data.items()}
+    if kind == "enum":
+        return _load_class(data["class"])(data["value"])
+    if kind == "datetime":
+        return dt.datetime.fromisoformat(data["value"])
+    if kind == "date":
+        return dt.date.fromisoformat(data["value"])
+    if kind == "time":
+        return dt.time.fromisoformat(data["value"])
+    if kind == "timezone":
+        return dt.timezone(dt.timedelta(seconds=data["offset"]))
+    if kind == "dataclass":
+        cls = _load_class(data["class"])
+        try:
+            # Start from defaults so fields added since the snapshot exist.
+            obj = cls()
+        except TypeError:
+            obj = cls.__new__(cls)
+        for name, item in data["fields"].items():
+            setattr(obj, name, decode_value(item))
+        return obj
+    if kind == "tuple":
+        return tuple(decode_value(item) for item in data["items"])
+    if kind == "dict":
+        return {decode_value(k): decode_value(v) for k, v in data["items"]}
+    raise ValueError(f"Unknown snapshot type {kind}")
+
+
+def vehicles_to_dict(
+    vehicles: Mapping[str, Vehicle], saved_at: dt.datetime
+) -> dict[str, Any]:
+    """Serialize the vehicle manager's vehicles, skipping any that fail."""
+    encoded = {}
+    for vehicle_id, vehicle in vehicles.items():
+        try:
+            encoded[vehicle_id] = encode_value(vehicle)
+        except TypeError as err:
+            _LOGGER.debug("Not snapshotting vehicle %s: %s", vehicle_id, err)
+    return {"saved_at": saved_at.isoformat(), "vehicles": encoded}
+
+
+def snapshot_saved_at(data: dict[str, Any] | None) -> dt.datetime | None:
+    """When a stored snapshot was taken; None if unknown."""
+    try:
+        return dt.datetime.fromisoformat(data["saved_at"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def vehicles_from_dict(data: dict[str, Any] | None) -> dict[str, Vehicle]:
+    """Restore vehicles from a stored snapshot; empty if none or unreadable."""
+    if not data:
+        return {}
+    try:
+        vehicles = {
+            vehicle_id: decode_value(encoded)
+            for vehicle_id, encoded in data["vehicles"].items()
+        }
+    except (AttributeError, KeyError, TypeError, ValueError) as err:
+        _LOGGER.warning("Ignoring unreadable vehicle snapshot: %s", err)
+        return {}
+    return {
+        vehicle_id: vehicle
+        for vehicle_id, vehicle in vehicles.items()
+        if isinstance(vehicle, Vehicle)
+    }
@@ -190,16 +190,22 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     coordinator = hass.data[DOMAIN][config_entry.unique_id]
-    entities = []
-    for vehicle_id in coordinator.vehicle_manager.vehicles:
-        vehicle: Vehicle = coordinator.vehicle_manager.vehicles[vehicle_id]
-        for description in SWITCH_DESCRIPTIONS:
-            if description.exists_fn(vehicle):
-                entities.append(
-                    HyundaiKiaConnectSwitch(coordinator, description, vehicle)
-                )
-
-    async_add_entities(entities)
+
+    def vehicle_entities(vehicle: Vehicle) -> list[HyundaiKiaConnectSwitch]:
+        capabilities = coordinator.capabilities.get(vehicle)
+        return [
+            HyundaiKiaConnectSwitch(coordinator, description, vehicle)
+            for description in SWITCH_DESCRIPTIONS
+            if capabilities.supports(f"switch.{description.key}", description.exists_fn)
+        ]
+
+    config_entry.async_on_unload(
+        coordinator.entity_factories.register(
+            vehicle_entities,
+            async_add_entities,
+            coordinator.vehicle_manager.vehicles.values(),
+        )
+    )
 
 
 PARALLEL_UPDATES = 1
@@ -0,0 +1,495 @@
+"""Local stand-in for the Kia / Hyundai / Genesis connected-car API.
+
+Serves the Canadian API dialect (kiaconnect.ca, mybluelink.ca and
+genesisconnect.ca share it) for a synthetic fleet: login, vehicle list,
+cached and forced status, service, location, charge limits and the remote
+commands with their transaction status. Point a VehicleManager for region 2
+at it with ``point_vehicle_manager`` and the whole integration runs against
+it with no network.
+
+Faults are injectable, at start-up or while running:
+
+- ``latency`` / ``jitter``: seconds added to every response;
+- ``error_rate``: share of requests answered with a server error;
+- ``daily_quota``: requests per day before every request is rejected;
+- ``duplicate_rate``: share of commands rejected as duplicates. A command to
+  a vehicle with one still pending is always rejected, like the real API;
+- ``token_lifetime`` / ``command_duration``: seconds until an access token
+  expires / a command completes.
+
+Run standalone with ``python scripts/fake_backend.py --vehicles 100``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import json
+import random
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Self
+
+API_PATH = "/tods/api/"
+
+ERROR_AUTH_EXPIRED = "7403"
+ERROR_WRONG_CREDENTIALS = "7404"
+ERROR_NOT_PROCESSED = "7445"
+
+# Control endpoints and what they do to the vehicle once they complete.
+COMMANDS = {
+    "drlck": {"doorLock": True},
+    "drulck": {"doorLock": False},
+    "rmtstrt": {"airCtrlOn": True, "engine": True},
+    "rmtstp": {"airCtrlOn": False, "engine": False},
+    "evc/rfon": {"airCtrlOn": True},
+    "evc/rfoff": {"airCtrlOn": False},
+    "evc/rcstrt": {"evStatus.batteryCharge": True},
+    "evc/rcstp": {"evStatus.batteryCharge": False},
+    "evc/setsoc": {},
+}
+
+FUEL_KINDS = ("E", "G", "P")  # EV, ICE, PHEV
+
+
+@dataclass
+class Faults:
+    """Injected faults; attributes may be changed while the server runs."""
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    daily_quota: int = 0
+    duplicate_rate: float = 0.0
+    token_lifetime: int = 86400
+    command_duration: float = 2.0
+
+
+@dataclass
+class FakeVehicle:
+    """One synthetic car and its server-side state."""
+
+    vehicle_id: str
+    index: int
+    fuel_kind: str
+    odometer: float
+    soc: int
+    latitude: float
+    longitude: float
+    status: dict[str, Any] = field(default_factory=dict)
+    charge_limits: dict[int, int] = field(default_factory=lambda: {0: 80, 1: 90})
+    status_date: dt.datetime = field(
+        default_factory=lambda: dt.datetime.now(dt.UTC) - dt.timedelta(minutes=30)
+    )
+
+    def refresh(self, now: dt.datetime) -> None:
+        """Move the car along a little, as a forced status request would."""
+        self.odometer += 1.5
+        self.latitude += 0.001
+        if self.status.get("evStatus", {}).get("batteryCharge"):
+            self.soc = min(self.soc + 2, 100)
+        else:
+            self.soc = max(self.soc - 1, 5)
+        self.status_date = now
+        self._update_status()
+
+    def _update_status(self) -> None:
+        ev = self.fuel_kind != "G"
+        range_km = self.soc * 4 if ev else 600
+        self.status.update(
+            {
+                "lastStatusDate": self.status_date.strftime("%Y%m%d%H%M%S"),
+                "airTemp": {"value": "OFF", "unit": 0},
+                "battery": {"batSoc": 85},
+                "dte": {"value": range_km, "unit": 1},
+                "fuelLevel": 0 if self.fuel_kind == "E" else 60,
+                "lowFuelLight": False,
+            }
+        )
+        ev_status = self.status.setdefault("evStatus", {"batteryCharge": False})
+        ev_status.update(
+            {
+                "batteryStatus": self.soc,
+                "batteryPlugin": 1 if ev_status.get("batteryCharge") else 0,
+                "drvDistance": [
+                    {
+                        "rangeByFuel": {
+                            "totalAvailableRange": {"value": range_km, "unit": 1},
+                            "evModeRange": {"value": range_km if ev else 0, "unit": 1},
+                            "gasModeRange": {
+                                "value": 0 if self.fuel_kind == "E" else 400,
+                                "unit": 1,
+                            },
+                        }
+                    }
+                ],
+                "remainTime2": {
+                    "atc": {"value": 120},
+                    "etc1": {"value": 40},
+                    "etc2": {"value": 600},
+                    "etc3": {"value": 240},
+                },
+            }
+        )
+
+    @classmethod
+    def synthetic(cls, index: int) -> FakeVehicle:
+        vehicle = cls(
+            vehicle_id=str(uuid.uuid5(uuid.NAMESPACE_OID, f"fake-vehicle-{index}")),
+            index=index,
+            fuel_kind=FUEL_KINDS[index % len(FUEL_KINDS)],
+            odometer=10000.0 + index * 137,
+            soc=40 + index % 60,
+            latitude=45.4 + index / 1000,
+            longitude=-75.7,
+        )
+        vehicle.status.update(
+            {
+                "engine": False,
+                "airCtrlOn": False,
+                "doorLock": True,
+                "doorOpen": dict.fromkeys(
+                    ("frontLeft", "frontRight", "backLeft", "backRight"), 0
+                ),
+                "windowOpen": dict.fromkeys(
+                    ("frontLeft", "frontRight", "backLeft", "backRight"), 0
+                ),
+                "trunkOpen": False,
+                "hoodOpen": False,
+                "defrost": False,
+                "steerWheelHeat": 0,
+                "sideBackWindowHeat": 0,
+                "washerFluidStatus": False,
+                "breakOilStatus": False,
+                "tirePressureLamp": {"tirePressureLampAll": 0},
+            }
+        )
+        vehicle._update_status()
+        return vehicle
+
+    def vehicle_list_entry(self) -> dict[str, Any]:
+        return {
+            "vehicleId": self.vehicle_id,
+            "nickName": f"Fake {self.index}",
+            "modelName": "EV6" if self.fuel_kind == "E" else "Sorento",
+            "modelYear": "2023",
+            "vin": f"KNDFAKE{self.index:010d}",
+            "fuelKindCode": self.fuel_kind,
+            "dtcCount": 0,
+        }
+
+    def apply(self, changes: dict[str, Any]) -> None:
+        for path, value in changes.items():
+            target = self.status
+            *parents, leaf = path.split(".")
+            for parent in parents:
+                target = target.setdefault(parent, {})
+            target[leaf] = value
+        self._update_status()
+
+
+@dataclass
+class Transaction:
+    vehicle_id: str
+    endpoint: str
+    completes_at: float
+    payload: dict[str, Any]
+    done: bool = False
+
+
+class FakeBackend:
+    """The fake API's state, served by a threaded HTTP server."""
+
+    def __init__(
+        self,
+        vehicle_count: int = 1,
+        faults: Faults | None = None,
+        *,
+        username: str = "fake@example.com",
+        password: str = "password",
+        host: str = "127.0.0.1",
+        port: int = 0,
+        seed: int | None = None,
+    ) -> None:
+        self.faults = faults or Faults()
+        self.username = username
+        self.password = password
+        self.vehicles = {
+            vehicle.vehicle_id: vehicle
+            for vehicle in (FakeVehicle.synthetic(i) for i in range(vehicle_count))
+        }
+        self.requests: dict[str, int] = {}
+        self._random = random.Random(seed)
+        self._tokens: dict[str, float] = {}
+        self._transactions: dict[str, Transaction] = {}
+        self._quota_day: dt.date | None = None
+        self._quota_used = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), _handler_for(self))
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        """Base URL to use as the API's ``API_URL``."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}{API_PATH}"
+
+    def start(self) -> Self:
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="fake-backend", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> Self:
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def expire_tokens(self) -> None:
+        """Invalidate every access token, as a server-side logout would."""
+        with self._lock:
+            self._tokens.clear()
+
+    def handle(
+        self, endpoint: str, headers: dict[str, str], body: dict[str, Any]
+    ) -> tuple[int, dict[str, Any], dict[str, str]]:
+        """Answer one request: (HTTP status, JSON body, extra headers)."""
+        faults = self.faults
+        delay = faults.latency + self._random.uniform(0, faults.jitter)
+        if delay:
+            time.sleep(delay)
+        with self._lock:
+            self.requests[endpoint] = self.requests.get(endpoint, 0) + 1
+            if self._quota_exhausted():
+                return 429, _error(ERROR_NOT_PROCESSED, "Daily quota exceeded"), {}
+            if self._random.random() < faults.error_rate:
+                return 200, _error(ERROR_NOT_PROCESSED, "Injected server error"), {}
+            if endpoint == "v2/login":
+                return self._login(body)
+            if not self._token_valid(headers.get("accesstoken")):
+                return 200, _error(ERROR_AUTH_EXPIRED, "Authentication expired"), {}
+            if endpoint == "vhcllst":
+                vehicles = [v.vehicle_list_entry() for v in self.vehicles.values()]
+                return 200, _ok({"vehicles": vehicles}), {}
+            vehicle = self.vehicles.get(headers.get("vehicleid", ""))
+            if vehicle is None:
+                return 200, _error(ERROR_NOT_PROCESSED, "Unknown vehicle"), {}
+            self._complete_transactions()
+            return self._vehicle_request(endpoint, vehicle, headers, body)
+
+    def _quota_exhausted(self) -> bool:
+        if not self.faults.daily_quota:
+            return False
+        today = dt.date.today()
+        if today != self._quota_day:
+            self._quota_day, self._quota_used = today, 0
+        self._quota_used += 1
+        return self._quota_used > self.faults.daily_quota
+
+    def _login(self, body: dict[str, Any]):
+        if (body.get("loginId"), body.get("password")) != (
+            self.username,
+            self.password,
+        ):
+            return 200, _error(ERROR_WRONG_CREDENTIALS, "Wrong username/password"), {}
+        access_token = uuid.uuid4().hex
+        self._tokens[access_token] = time.time() + self.faults.token_lifetime
+        token = {
+            "accessToken": access_token,
+            "refreshToken": uuid.uuid4().hex,
+            # The client subtracts 60 s from this.
+            "expireIn": self.faults.token_lifetime + 60,
+        }
+        return 200, _ok({"token": token}), {}
+
+    def _token_valid(self, access_token: str | None) -> bool:
+        expires = self._tokens.get(access_token or "")
+        return expires is not None and expires > time.time()
+
+    def _complete_transactions(self) -> None:
+        now = time.monotonic()
+        for transaction in self._transactions.values():
+            if not transaction.done and transaction.completes_at <= now:
+                transaction.done = True
+                vehicle = self.vehicles[transaction.vehicle_id]
+                vehicle.apply(COMMANDS[transaction.endpoint])
+                if transaction.endpoint == "evc/setsoc":
+                    for limit in transaction.payload.get("tsoc", []):
+                        vehicle.charge_limits[limit["plugType"]] = limit["level"]
+
+    def _vehicle_request(self, endpoint, vehicle: FakeVehicle, headers, body):
+        if endpoint == "lstvhclsts":
+            return 200, _ok({"status": vehicle.status}), {}
+        if endpoint == "rltmvhclsts":
+            vehicle.refresh(dt.datetime.now(dt.UTC))
+            return 200, _ok({"status": vehicle.status}), {}
+        if endpoint == "nxtsvc":
+            info = {
+                "currentOdometer": vehicle.odometer,
+                "currentOdometerUnit": 1,
+                "imatServiceOdometer": 15000,
+                "imatServiceOdometerUnit": 1,
+                "msopServiceOdometer": 5000,
+                "msopServiceOdometerUnit": 1,
+            }
+            return 200, _ok({"maintenanceInfo": info}), {}
+        if endpoint == "fndmcr":
+            location = {
+                "coord": {
+                    "lat": vehicle.latitude,
+                    "lon": vehicle.longitude,
+                    "alt": 70,
+                },
+                "head": 90,
+                "speed": {"value": 0, "unit": 1},
+                "time": vehicle.status_date.strftime("%Y%m%d%H%M%S"),
+            }
+            return 200, _ok(location), {}
+        if endpoint == "vrfypin":
+            return 200, _ok({"pAuth": uuid.uuid4().hex}), {}
+        if endpoint == "evc/selsoc":
+            limits = [
+                {"plugType": plug, "level": level}
+                for plug, level in vehicle.charge_limits.items()
+            ]
+            return 200, _ok(limits), {}
+        if endpoint == "alerts/maintenance/evTripDetails":
+            return 200, _ok({"tripdetails": []}), {}
+        if endpoint == "rmtsts":
+            return self._transaction_status(headers.get("transactionid", ""))
+        if endpoint in COMMANDS:
+            return self._command(endpoint, vehicle, body)
+        return 404, _error(ERROR_NOT_PROCESSED, f"Unknown endpoint {endpoint}"), {}
+
+    def _command(self, endpoint: str, vehicle: FakeVehicle, body: dict[str, Any]):
+        pending = any(
+            not t.done and t.vehicle_id == vehicle.vehicle_id
+            for t in self._transactions.values()
+        )
+        if pending or self._random.random() < self.faults.duplicate_rate:
+            return 200, _error(ERROR_NOT_PROCESSED, "Duplicate request"), {}
+        transaction_id = uuid.uuid4().hex
+        self._transactions[transaction_id] = Transaction(
+            vehicle_id=vehicle.vehicle_id,
+            endpoint=endpoint,
+            completes_at=time.monotonic() + self.faults.command_duration,
+            payload=body,
+        )
+        return 200, _ok({}), {"transactionId": transaction_id}
+
+    def _transaction_status(self, transaction_id: str):
+        transaction = self._transactions.get(transaction_id)
+        if transaction is None:
+            return 200, _error(ERROR_NOT_PROCESSED, "Unknown transaction"), {}
+        result = {
+            "apiStatusCode": "0000" if transaction.done else "null",
+            "apiResult": "C" if transaction.done else "P",
+        }
+        return 200, _ok({"transaction": result}), {}
+
+
+def _ok(result: Any) -> dict[str, Any]:
+    return {"responseHeader": {"responseCode": 0}, "result": result}
+
+
+def _error(code: str, description: str) -> dict[str, Any]:
+    return {
+        "responseHeader": {"responseCode": 1},
+        "error": {"errorCode": code, "errorDesc": description},
+    }
+
+
+def _handler_for(backend: FakeBackend) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self) -> None:
+            length = int(self.headers.get("Content-Length") or 0)
+            raw = self.rfile.read(length) if length else b""
+            try:
+                body = json.loads(raw) if raw else {}
+            except ValueError:
+                body = {}
+            if not self.path.startswith(API_PATH):
+                status, payload, extra = 404, _error("404", "Not found"), {}
+            else:
+                status, payload, extra = backend.handle(
+                    self.path[len(API_PATH) :],
+                    {key.lower(): value for key, value in self.headers.items()},
+                    body if isinstance(body, dict) else {},
+                )
+            data = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            for key, value in extra.items():
+                self.send_header(key, value)
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+    return Handler
+
+
+def point_vehicle_manager(vehicle_manager, backend: FakeBackend) -> None:
+    """Send a region 2 (Canada) VehicleManager's requests to ``backend``."""
+    vehicle_manager.api.API_URL = backend.url
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--vehicles", type=int, default=1)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--username", default="fake@example.com")
+    parser.add_argument("--password", default="password")
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--daily-quota", type=int, default=0)
+    parser.add_argument("--duplicate-rate", type=float, default=0.0)
+    parser.add_argument("--token-lifetime", type=int, default=86400)
+    parser.add_argument("--command-duration", type=float, default=2.0)
+    args = parser.parse_args()
+
+    faults = Faults(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        daily_quota=args.daily_quota,
+        duplicate_rate=args.duplicate_rate,
+        token_lifetime=args.token_lifetime,
+        command_duration=args.command_duration,
+    )
+    backend = FakeBackend(
+        args.vehicles,
+        faults,
+        username=args.username,
+        password=args.password,
+        host=args.host,
+        port=args.port,
+    )
+    print(json.dumps({"url": backend.url, "vehicles": len(backend.vehicles)}))
+    try:
+        backend._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        backend._server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,117 @@
+"""Replay recorded cassettes in place of the network.
+
+Replaying answers every request from a cassette made by
+``custom_components.kia_uvo.cassette`` instead of the network, in recorded
+order per method and URL; once an endpoint's responses run out its last one
+is repeated, so a short recording can drive any number of refresh cycles.
+
+While active it hooks ``requests``' HTTPAdapter.send for the whole process,
+so it also answers the calls a library makes outside its sessions. That is
+why it lives with the tests and not in the integration.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from collections import defaultdict, deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from http import HTTPStatus
+from typing import Any
+from urllib.parse import urlsplit, urlunsplit
+
+from requests import PreparedRequest, Response
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.structures import CaseInsensitiveDict
+
+from custom_components.kia_uvo.cassette import Cassette, Interaction
+
+_original_send: Callable[..., Response] | None = None
+_replay: ReplayTransport | None = None
+
+
+def _endpoint(method: str | None, url: str | None) -> tuple[str, str]:
+    """What a request is matched on: method and URL without the query."""
+    parts = urlsplit(url or "")
+    return (method or "GET").upper(), urlunsplit(parts._replace(query=""))
+
+
+def to_response(interaction: Interaction, request: PreparedRequest) -> Response:
+    """A requests Response for ``request`` carrying the recorded answer."""
+    response = Response()
+    response.status_code = interaction.status
+    try:
+        response.reason = HTTPStatus(interaction.status).phrase
+    except ValueError:
+        response.reason = ""
+    response.headers = CaseInsensitiveDict(interaction.headers)
+    if interaction.response is None:
+        content = b""
+    elif isinstance(interaction.response, str):
+        content = interaction.response.encode()
+    else:
+        content = json.dumps(interaction.response).encode()
+        response.headers.setdefault("Content-Type", "application/json")
+    response._content = content
+    response._content_consumed = True
+    response.encoding = "utf-8"
+    response.url = request.url or ""
+    response.request = request
+    return response
+
+
+class ReplayTransport(HTTPAdapter):
+    """Answers requests from a cassette instead of the network."""
+
+    def __init__(self, cassette: Cassette) -> None:
+        """Queue the cassette's responses per method and URL."""
+        super().__init__()
+        self.cassette = cassette
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._queues: dict[tuple[str, str], deque[Interaction]] = defaultdict(deque)
+        for interaction in cassette.interactions:
+            self._queues[_endpoint(interaction.method, interaction.url)].append(
+                interaction
+            )
+
+    def send(self, request: PreparedRequest, **kwargs: Any) -> Response:
+        """Return the next recorded response for the request's endpoint."""
+        endpoint = _endpoint(request.method, request.url)
+        with self._lock:
+            self.requests += 1
+            queue = self._queues.get(endpoint)
+            if not queue:
+                raise RequestsConnectionError(
+                    f"No recorded response for {endpoint[0]} {endpoint[1]}",
+                    request=request,
+                )
+            interaction = queue.popleft() if len(queue) > 1 else queue[0]
+        return to_response(interaction, request)
+
+
+def _replay_send(
+    adapter: HTTPAdapter, request: PreparedRequest, **kwargs: Any
+) -> Response:
+    return _replay.send(request, **kwargs)
+
+
+@contextmanager
+def replay(cassette: Cassette) -> Iterator[ReplayTransport]:
+    """Answer every ``requests`` call from ``cassette`` while active."""
+    global _replay, _original_send
+    if _replay is not None:
+        raise RuntimeError("A cassette is already being replayed")
+    transport = ReplayTransport(cassette)
+    _replay = transport
+    _original_send = HTTPAdapter.send
+    HTTPAdapter.send = _replay_send
+    try:
+        yield transport
+    finally:
+        HTTPAdapter.send = _original_send
+        _replay = None
+        _original_send = None
+        transport.close()
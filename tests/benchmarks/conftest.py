@@ -0,0 +1,308 @@
+"""Harness for the offline update-pipeline benchmarks.
+
+Drives the real coordinator and the real platform setup functions against an
+in-process fake VehicleManager holding synthetic vehicles. Entity state
+writes are counted (and the entity's state properties evaluated) instead of
+going to HA's state machine, so the numbers cover the integration's own
+setup loops and update fan-out, not Home Assistant core.
+
+The benchmarks are skipped unless pytest runs with ``--run-benchmarks``.
+Baselines live in ``baselines.json`` next to this file. A metric without a
+baseline fails the check; run with ``--update-baselines`` to record them
+after an intended change, and commit the file.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import datetime as dt
+import importlib
+import json
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from homeassistant.config_entries import current_entry
+from homeassistant.const import CONF_REGION, CONF_USERNAME
+from hyundai_kia_connect_api import Token, Vehicle
+from hyundai_kia_connect_api.const import ENGINE_TYPES
+
+from custom_components.kia_uvo import PLATFORMS
+from custom_components.kia_uvo import coordinator as coordinator_mod
+from custom_components.kia_uvo.const import CONF_BRAND, DOMAIN
+
+BASELINES_FILE = Path(__file__).with_name("baselines.json")
+# Peak memory may grow this much over its baseline before the check fails.
+MEMORY_TOLERANCE = 1.2
+
+_STATE_PROPERTIES = (
+    "available",
+    "native_value",
+    "is_on",
+    "is_locked",
+    "is_closed",
+    "hvac_mode",
+    "extra_state_attributes",
+)
+
+
+def synthetic_vehicle(index: int) -> Vehicle:
+    """An EV with the fields most platforms create entities for."""
+    now = dt.datetime.now(dt.UTC)
+    vehicle = Vehicle(
+        id=f"vehicle-{index}",
+        name=f"Vehicle {index}",
+        model="EV6",
+        VIN=f"KNA0000000000{index:04d}",
+        engine_type=ENGINE_TYPES.EV,
+    )
+    vehicle.last_updated_at = now
+    vehicle.odometer = (10000 + index, "km")
+    vehicle.total_driving_range = (350, "km")
+    vehicle.ev_driving_range = (350, "km")
+    vehicle.air_temperature = (21, "C")
+    vehicle.location = (52.0 + index / 1000, 4.0, now)
+    vehicle.car_battery_percentage = 90
+    vehicle.ev_battery_percentage = 80
+    vehicle.ev_battery_is_charging = False
+    vehicle.ev_battery_is_plugged_in = False
+    vehicle.ev_charge_limits_ac = 80
+    vehicle.ev_charge_limits_dc = 90
+    vehicle.is_locked = True
+    vehicle.engine_is_running = False
+    vehicle.air_control_is_on = False
+    vehicle.steering_wheel_heater_is_on = False
+    vehicle.washer_fluid_warning_is_on = False
+    vehicle.supports_window_control = True
+    vehicle.front_left_window_is_open = False
+    vehicle.front_right_window_is_open = False
+    vehicle.back_left_window_is_open = False
+    vehicle.back_right_window_is_open = False
+    vehicle.data = {"status": {"odometer": 10000 + index}}
+    return vehicle
+
+
+class FakeVehicleManager:
+    """Stands in for the library's VehicleManager; every refresh moves the
+    odometer and timestamp and drains a little battery, like a driven car."""
+
+    def __init__(self, vehicle_count: int) -> None:
+        self.region = 1
+        self.brand = 1
+        self.api = MagicMock()
+        self.token = Token(
+            username="bench",
+            access_token="access",
+            refresh_token="refresh",
+            valid_until=dt.datetime.now(dt.UTC) + dt.timedelta(days=1),
+        )
+        self.vehicles = {
+            vehicle.id: vehicle
+            for vehicle in (synthetic_vehicle(i) for i in range(vehicle_count))
+        }
+
+    def check_and_refresh_token(self) -> bool:
+        return False
+
+    def get_vehicle(self, vehicle_id: str) -> Vehicle:
+        return self.vehicles[vehicle_id]
+
+    def update_vehicle_with_cached_state(self, vehicle_id: str) -> None:
+        vehicle = self.vehicles[vehicle_id]
+        vehicle.odometer = (vehicle.odometer + 1, "km")
+        vehicle.ev_battery_percentage = max(vehicle.ev_battery_percentage - 1, 0)
+        vehicle.last_updated_at = dt.datetime.now(dt.UTC)
+        vehicle.data = {"status": {"odometer": vehicle.odometer}}
+
+    force_refresh_vehicle_state = update_vehicle_with_cached_state
+
+    def update_all_vehicles_with_cached_state(self) -> None:
+        for vehicle_id in self.vehicles:
+            self.update_vehicle_with_cached_state(vehicle_id)
+
+
+class _MemoryStore:
+    """In-memory stand-in for homeassistant.helpers.storage.Store."""
+
+    def __init__(self, hass, version, key) -> None:
+        self.data = None
+
+    async def async_load(self):
+        return self.data
+
+    def async_delay_save(self, data_func, delay=0) -> None:
+        pass
+
+    async def async_remove(self) -> None:
+        self.data = None
+
+
+class Pipeline:
+    """One config entry: coordinator, vehicle manager and entities.
+
+    With ``entry_data`` the coordinator keeps the real VehicleManager it
+    builds from it (for replaying cassettes); otherwise a FakeVehicleManager
+    with ``vehicle_count`` synthetic vehicles replaces it.
+    """
+
+    def __init__(
+        self,
+        vehicle_count: int = 0,
+        entry_data: dict[str, Any] | None = None,
+        options: dict[str, Any] | None = None,
+    ) -> None:
+        self.loop = asyncio.new_event_loop()
+        self.hass = MagicMock()
+        self.hass.loop = self.loop
+        self.hass.is_stopping = False
+        self.hass.config.language = "en"
+        self.hass.async_create_task = self.loop.create_task
+        self.hass.async_add_executor_job = self._run_inline
+        self.entry = MagicMock()
+        self.entry.entry_id = self.entry.unique_id = "bench"
+        self.entry.title = "Kia Europe bench"
+        self.entry.data = entry_data or {
+            CONF_REGION: 1,
+            CONF_BRAND: 1,
+            CONF_USERNAME: "bench",
+        }
+        self.entry.options = options or {}
+        self.hass.data = {DOMAIN: {}}
+
+        token = current_entry.set(self.entry)
+        try:
+            self.coordinator = coordinator_mod.HyundaiKiaConnectDataUpdateCoordinator(
+                self.hass, self.entry
+            )
+        finally:
+            current_entry.reset(token)
+        if entry_data is None:
+            self.coordinator.vehicle_manager = FakeVehicleManager(vehicle_count)
+        # Library calls run inline so timings cover the integration's code.
+        self.coordinator.async_add_executor_job = self._run_inline
+        self.hass.data[DOMAIN][self.entry.unique_id] = self.coordinator
+        self.entities: list[Any] = []
+        self.writes = 0
+        self._unsubscribes: list = []
+
+    def _run_inline(self, fn, *args) -> asyncio.Future:
+        future = self.loop.create_future()
+        try:
+            future.set_result(fn(*args))
+        except Exception as err:
+            future.set_exception(err)
+        return future
+
+    def _write_state(self, entity) -> None:
+        self.writes += 1
+        for name in _STATE_PROPERTIES:
+            getattr(entity, name, None)
+
+    async def _async_setup_platforms(self) -> list[Any]:
+        entities: list[Any] = []
+
+        def add_entities(new_entities, update_before_add: bool = False) -> None:
+            entities.extend(new_entities)
+
+        for platform in PLATFORMS:
+            module = importlib.import_module(f"custom_components.kia_uvo.{platform}")
+            await module.async_setup_entry(self.hass, self.entry, add_entities)
+        return entities
+
+    def setup_platforms(self) -> list[Any]:
+        """Create every platform's entities and subscribe them to updates."""
+        self.close_listeners()
+        self.entities = self.loop.run_until_complete(self._async_setup_platforms())
+        for entity in self.entities:
+            entity.async_write_ha_state = lambda entity=entity: self._write_state(
+                entity
+            )
+            self._unsubscribes.append(
+                self.coordinator.async_add_listener(entity._handle_coordinator_update)
+            )
+        return self.entities
+
+    async def _async_cycle(self) -> None:
+        for vehicle_id in self.coordinator.vehicle_manager.vehicles:
+            self.coordinator.scheduler.mark_due(vehicle_id)
+        await self.coordinator._async_update_data()
+        self.coordinator.async_update_listeners()
+
+    def run_cycle(self) -> None:
+        """One scheduled refresh of every vehicle and the listener fan-out."""
+        self.loop.run_until_complete(self._async_cycle())
+
+    def close_listeners(self) -> None:
+        for unsubscribe in self._unsubscribes:
+            unsubscribe()
+        self._unsubscribes.clear()
+
+    def close(self) -> None:
+        self.close_listeners()
+        self.coordinator.executor.shutdown()
+        self.loop.close()
+
+
+class Baselines:
+    """Stored benchmark metrics, compared against or, with ``update``,
+    recorded."""
+
+    def __init__(self, update: bool = False) -> None:
+        self.data: dict[str, dict[str, float]] = (
+            json.loads(BASELINES_FILE.read_text()) if BASELINES_FILE.exists() else {}
+        )
+        self.update = update
+
+    def check(self, name: str, metrics: dict[str, float]) -> None:
+        """Fail when a metric regressed or has no baseline."""
+        if self.update:
+            self.data[name] = metrics
+            return
+        stored = self.data.get(name)
+        if stored is None:
+            pytest.fail(f"{name}: no baseline, record it with --update-baselines")
+        for metric, value in metrics.items():
+            if metric not in stored:
+                pytest.fail(
+                    f"{name}: no {metric} baseline, record it with --update-baselines"
+                )
+            elif metric == "entities":
+                assert value == stored[metric], (
+                    f"{name}: {value} entities, baseline {stored[metric]}"
+                )
+            elif metric.endswith("_kib"):
+                assert value <= stored[metric] * MEMORY_TOLERANCE, (
+                    f"{name}: {metric} {value} over baseline {stored[metric]}"
+                )
+            else:
+                assert value <= stored[metric], (
+                    f"{name}: {metric} {value} over baseline {stored[metric]}"
+                )
+
+    def save(self) -> None:
+        if self.update:
+            BASELINES_FILE.write_text(
+                json.dumps(self.data, indent=2, sort_keys=True) + "\n"
+            )
+
+
+@pytest.fixture(scope="session")
+def baselines(pytestconfig):
+    stored = Baselines(update=pytestconfig.getoption("--update-baselines"))
+    yield stored
+    stored.save()
+
+
+@pytest.fixture
+def pipeline(monkeypatch):
+    monkeypatch.setattr(coordinator_mod, "Store", _MemoryStore)
+    created: list[Pipeline] = []
+
+    def make(vehicle_count: int = 0, **kwargs: Any) -> Pipeline:
+        created.append(Pipeline(vehicle_count, **kwargs))
+        return created[-1]
+
+    yield make
+    for item in created:
+        item.close()
@@ -0,0 +1,45 @@
+"""Tests for the cassette replay harness."""
+
+import pytest
+import requests
+from cassette_replay import replay
+from requests.adapters import HTTPAdapter
+
+from custom_components.kia_uvo.cassette import Cassette, Interaction
+
+LOGIN_URL = "https://api.example.com/tods/api/v2/login"
+STATUS_URL = "https://api.example.com/tods/api/lstvhclsts"
+
+
+def _interaction(url: str, odometer: int) -> Interaction:
+    return Interaction(
+        method="POST",
+        url=url,
+        request=None,
+        status=200,
+        headers={"Content-Type": "application/json"},
+        response={"odometer": odometer},
+    )
+
+
+def test_replay_answers_in_order_then_repeats_the_last() -> None:
+    cassette = Cassette(
+        interactions=[_interaction(STATUS_URL, 1), _interaction(STATUS_URL, 2)]
+    )
+    with replay(cassette) as transport, requests.Session() as session:
+        odometers = [
+            session.post(STATUS_URL + "?x=1").json()["odometer"] for _ in range(3)
+        ]
+        with pytest.raises(requests.ConnectionError):
+            session.post(LOGIN_URL)
+    assert odometers == [1, 2, 2]
+    assert transport.requests == 4
+
+
+def test_replay_restores_the_transport() -> None:
+    original = HTTPAdapter.send
+    with replay(Cassette()):
+        assert HTTPAdapter.send is not original
+        with pytest.raises(RuntimeError), replay(Cassette()):
+            pass
+    assert HTTPAdapter.send is original
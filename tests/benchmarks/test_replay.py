@@ -0,0 +1,90 @@
+"""Replay recorded API traffic through the coordinator and platform setup.
+
+Cassettes come from the ``kia_uvo.record_cassette`` service; drop the
+``.json.gz`` files into ``cassettes/`` next to this file. Each one is
+replayed by ``cassette_replay``: it logs in, refreshes and sets up every
+platform from the recorded payloads with no network, then refreshes again
+and checks that no entity raises while its state is written. Timings are compared by pytest-benchmark, entity counts
+against ``baselines.json``.
+
+``fake_backend_ca.json.gz`` is one EV of ``scripts/fake_backend.py``
+(``FakeBackend(1, seed=1)``): a login, a cached and a forced refresh, with
+the fake's URL rewritten to the Canadian API host it stands in for. Its
+replayed vehicle state is checked on every test run.
+"""
+
+from pathlib import Path
+
+import pytest
+from cassette_replay import replay
+from homeassistant.const import (
+    CONF_PASSWORD,
+    CONF_PIN,
+    CONF_REGION,
+    CONF_USERNAME,
+)
+from hyundai_kia_connect_api.const import ENGINE_TYPES
+
+from custom_components.kia_uvo.cassette import Cassette
+from custom_components.kia_uvo.const import CONF_BRAND
+
+CASSETTE_DIR = Path(__file__).with_name("cassettes")
+CASSETTES = sorted(CASSETTE_DIR.glob("*.json.gz"))
+FAKE_BACKEND_CASSETTE = CASSETTE_DIR / "fake_backend_ca.json.gz"
+
+
+def _replay_pipeline(pipeline, cassette: Cassette):
+    return pipeline(
+        entry_data={
+            CONF_REGION: cassette.metadata["region"],
+            CONF_BRAND: cassette.metadata["brand"],
+            CONF_USERNAME: "replay",
+            CONF_PASSWORD: "replay",
+            CONF_PIN: "",
+        },
+        options=cassette.metadata.get("options"),
+    )
+
+
+def test_fake_backend_cassette_replays_vehicle_state(pipeline, monkeypatch) -> None:
+    cassette = Cassette.load(FAKE_BACKEND_CASSETTE)
+    bench = _replay_pipeline(pipeline, cassette)
+    # The recorded data ages, so pin the cached refresh path.
+    monkeypatch.setattr(bench.coordinator, "_is_force_refresh_allowed", lambda: False)
+    with replay(cassette) as transport:
+        bench.run_cycle()
+        entities = bench.setup_platforms()
+    assert transport.requests
+
+    (vehicle,) = bench.coordinator.vehicle_manager.vehicles.values()
+    assert vehicle.id == "vehicle-1"
+    assert vehicle.name == "Fake 0"
+    assert vehicle.model == "EV6"
+    assert vehicle.engine_type is ENGINE_TYPES.EV
+    assert vehicle.is_locked is True
+    assert vehicle.engine_is_running is False
+    assert vehicle.ev_battery_is_charging is False
+    assert vehicle.ev_battery_percentage == 40
+    assert vehicle.car_battery_percentage == 85
+    assert vehicle.ev_driving_range == 160
+    assert vehicle.odometer == 10000
+    assert vehicle.ev_charge_limits_ac is not None
+    assert entities
+
+
+@pytest.mark.benchmarks
+@pytest.mark.parametrize("path", CASSETTES, ids=lambda path: path.name)
+def test_replay(benchmark, pipeline, baselines, path) -> None:
+    """Set up from a recording, then time one replayed refresh cycle."""
+    cassette = Cassette.load(path)
+    bench = _replay_pipeline(pipeline, cassette)
+    with replay(cassette) as transport:
+        bench.run_cycle()
+        assert bench.coordinator.vehicle_manager.vehicles, "no vehicles replayed"
+        entities = bench.setup_platforms()
+        bench.run_cycle()
+        assert bench.writes, "no entity was written"
+        benchmark(bench.run_cycle)
+    assert transport.requests
+
+    baselines.check(f"replay[{path.name}]", {"entities": len(entities)})
@@ -0,0 +1,64 @@
+"""Benchmarks for platform setup and the coordinator update fan-out.
+
+Run with ``pytest tests/benchmarks --run-benchmarks``; timings are compared by pytest-benchmark
+(``--benchmark-autosave`` / ``--benchmark-compare``), entity counts, state
+writes per cycle and peak memory against ``baselines.json``.
+"""
+
+import tracemalloc
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+pytestmark = pytest.mark.benchmarks
+
+VEHICLE_COUNTS = (1, 10, 100)
+
+
+@pytest.mark.parametrize("vehicle_count", VEHICLE_COUNTS)
+def test_platform_setup(benchmark, pipeline, baselines, vehicle_count) -> None:
+    """Time creating every platform's entities for the account."""
+    bench = pipeline(vehicle_count)
+    entities = benchmark(bench.setup_platforms)
+
+    tracemalloc.start()
+    try:
+        pipeline(vehicle_count).setup_platforms()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    baselines.check(
+        f"setup[{vehicle_count}]",
+        {"entities": len(entities), "peak_memory_kib": round(peak / 1024)},
+    )
+
+
+@pytest.mark.parametrize("vehicle_count", VEHICLE_COUNTS)
+def test_update_cycle(benchmark, pipeline, baselines, vehicle_count) -> None:
+    """Time one refresh of every vehicle plus the entity fan-out."""
+    bench = pipeline(vehicle_count)
+    bench.setup_platforms()
+    # The first cycle writes every entity once; measure the steady state.
+    bench.run_cycle()
+    bench.writes = 0
+    bench.run_cycle()
+    writes_per_cycle = bench.writes
+
+    benchmark(bench.run_cycle)
+
+    tracemalloc.start()
+    try:
+        bench.run_cycle()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    baselines.check(
+        f"update_cycle[{vehicle_count}]",
+        {
+            "state_writes": writes_per_cycle,
+            "peak_memory_kib": round(peak / 1024),
+        },
+    )
@@ -3,3 +3,28 @@
 import pytest
 
 pytest.register_assert_rewrite("custom_components.kia_uvo")
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("kia_uvo")
+    group.addoption(
+        "--run-benchmarks",
+        action="store_true",
+        help="run the tests marked 'benchmarks' (tests/benchmarks)",
+    )
+    group.addoption(
+        "--update-baselines",
+        action="store_true",
+        help="record tests/benchmarks/baselines.json instead of checking it",
+    )
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    if config.getoption("--run-benchmarks"):
+        return
+    skip = pytest.mark.skip(reason="benchmark; run with --run-benchmarks")
+    for item in items:
+        if item.get_closest_marker("benchmarks") is not None:
+            item.add_marker(skip)
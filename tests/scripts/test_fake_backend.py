@@ -0,0 +1,62 @@
+import sys
+from pathlib import Path
+
+import pytest
+from hyundai_kia_connect_api import VehicleManager
+from hyundai_kia_connect_api.const import ORDER_STATUS
+from hyundai_kia_connect_api.exceptions import APIError
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "scripts"))
+
+from fake_backend import FakeBackend, Faults, point_vehicle_manager
+
+
+@pytest.fixture
+def backend():
+    with FakeBackend(3, Faults(command_duration=0), seed=1) as server:
+        yield server
+
+
+def _vehicle_manager(backend: FakeBackend) -> VehicleManager:
+    vehicle_manager = VehicleManager(
+        region=2,
+        brand=1,
+        username=backend.username,
+        password=backend.password,
+        pin="1234",
+    )
+    point_vehicle_manager(vehicle_manager, backend)
+    return vehicle_manager
+
+
+def test_login_lists_fleet_and_updates(backend):
+    vehicle_manager = _vehicle_manager(backend)
+    vehicle_manager.check_and_refresh_token()
+    assert len(vehicle_manager.vehicles) == 3
+
+    vehicle_manager.update_all_vehicles_with_cached_state()
+    vehicle = next(iter(vehicle_manager.vehicles.values()))
+    assert vehicle.odometer is not None
+    assert vehicle.is_locked is True
+
+
+def test_command_completes_and_changes_state(backend):
+    vehicle_manager = _vehicle_manager(backend)
+    vehicle_manager.check_and_refresh_token()
+    vehicle_id = next(iter(vehicle_manager.vehicles))
+
+    action_id = vehicle_manager.unlock(vehicle_id)
+    assert vehicle_manager.check_action_status(vehicle_id, action_id, False) == (
+        ORDER_STATUS.SUCCESS
+    )
+    vehicle_manager.update_vehicle_with_cached_state(vehicle_id)
+    assert vehicle_manager.vehicles[vehicle_id].is_locked is False
+
+
+def test_quota_exhaustion_rejects_requests(backend):
+    vehicle_manager = _vehicle_manager(backend)
+    vehicle_manager.check_and_refresh_token()
+    backend.faults.daily_quota = sum(backend.requests.values())
+
+    with pytest.raises(APIError):
+        vehicle_manager.update_all_vehicles_with_cached_state()
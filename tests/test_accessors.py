@@ -0,0 +1,48 @@
+"""Tests for the per-description accessors of vehicle entities."""
+
+from types import SimpleNamespace
+
+from custom_components.kia_uvo.accessors import compile_accessors
+from custom_components.kia_uvo.const import DYNAMIC_UNIT
+
+
+def test_plain_value_and_static_unit() -> None:
+    accessors = compile_accessors("ev_battery_percentage", "%")
+    vehicle = SimpleNamespace(ev_battery_percentage=80)
+    assert accessors.value(vehicle) == 80
+    assert accessors.unit(vehicle) == "%"
+    assert accessors.attributes(vehicle) is None
+
+
+def test_dynamic_unit_reads_the_unit_field() -> None:
+    accessors = compile_accessors("_odometer", DYNAMIC_UNIT)
+    vehicle = SimpleNamespace(_odometer=1200, _odometer_unit="km")
+    assert accessors.value(vehicle) == 1200
+    assert accessors.unit(vehicle) == "km"
+
+
+def test_transforms_are_attached() -> None:
+    vehicle = SimpleNamespace(
+        ev_charging_current=2,
+        ev_first_departure_days=[1, 3],
+        ev_second_departure_days=None,
+    )
+    assert compile_accessors("ev_charging_current").value(vehicle) == 90
+    assert compile_accessors("ev_first_departure_days").value(vehicle) == "1, 3"
+    assert compile_accessors("ev_second_departure_days").value(vehicle) is None
+
+
+def test_attributes() -> None:
+    vehicle = SimpleNamespace(
+        dtc_count=1, dtc_descriptions=["P0001"], _geocode_address="1 Main St"
+    )
+    assert compile_accessors("dtc_count").attributes(vehicle) == {"DTC Text": ["P0001"]}
+    assert compile_accessors("_geocode_name").attributes(vehicle) == {
+        "address": "1 Main St"
+    }
+
+
+def test_compiled_once_per_description() -> None:
+    assert compile_accessors("_odometer", DYNAMIC_UNIT) is compile_accessors(
+        "_odometer", DYNAMIC_UNIT
+    )
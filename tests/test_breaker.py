@@ -0,0 +1,92 @@
+"""Tests for the polling circuit breaker and its back-off."""
+
+import datetime as dt
+
+from custom_components.kia_uvo.breaker import (
+    BACKOFF_STEP,
+    MAX_BACKOFF,
+    RECOVERY_STEPS,
+    BreakerState,
+    CircuitBreaker,
+)
+
+NOW = dt.datetime(2026, 1, 1, 12, 0, tzinfo=dt.UTC)
+ERROR = ConnectionError("backend down")
+
+
+def _fail(breaker: CircuitBreaker, times: int, now: dt.datetime = NOW) -> None:
+    for _ in range(times):
+        breaker.record_failure(now, ERROR)
+
+
+def test_opens_after_threshold_and_blocks_until_retry() -> None:
+    breaker = CircuitBreaker()
+    _fail(breaker, 2)
+    assert breaker.state is BreakerState.CLOSED
+    assert breaker.allow(NOW)
+
+    _fail(breaker, 1)
+    assert breaker.state is BreakerState.OPEN
+    assert breaker.backoff == BACKOFF_STEP * 4
+    assert breaker.retry_at == NOW + BACKOFF_STEP * 4
+    assert not breaker.allow(NOW + BACKOFF_STEP)
+    assert breaker.last_error == "ConnectionError"
+
+
+def test_half_open_probe_failure_reopens_for_longer() -> None:
+    breaker = CircuitBreaker()
+    _fail(breaker, 3)
+    later = breaker.retry_at
+    assert breaker.allow(later)
+    assert breaker.state is BreakerState.HALF_OPEN
+
+    breaker.record_failure(later, ERROR)
+    assert breaker.state is BreakerState.OPEN
+    assert breaker.retry_at == later + BACKOFF_STEP * 8
+    assert breaker.times_opened == 2
+
+
+def test_success_closes_and_steps_the_backoff_down() -> None:
+    breaker = CircuitBreaker(max_backoff=BACKOFF_STEP * 24)
+    _fail(breaker, 4)
+    assert breaker.backoff == BACKOFF_STEP * 8
+    assert breaker.allow(breaker.retry_at)
+
+    breaker.record_success()
+    assert breaker.state is BreakerState.CLOSED
+    assert breaker.retry_at is None
+    assert breaker.backoff == BACKOFF_STEP * 5
+    breaker.record_success()
+    assert breaker.backoff == BACKOFF_STEP * 2
+    breaker.record_success()
+    assert breaker.backoff == dt.timedelta(0)
+
+
+def test_recovers_from_the_longest_backoff_in_a_few_successes() -> None:
+    breaker = CircuitBreaker()
+    _fail(breaker, 20)
+    assert breaker.backoff == MAX_BACKOFF
+    successes = 0
+    while breaker.backoff:
+        breaker.record_success()
+        successes += 1
+    assert successes == RECOVERY_STEPS
+
+
+def test_backoff_is_capped() -> None:
+    breaker = CircuitBreaker()
+    _fail(breaker, 20)
+    assert breaker.backoff == MAX_BACKOFF
+
+
+def test_as_dict() -> None:
+    breaker = CircuitBreaker()
+    _fail(breaker, 3)
+    assert breaker.as_dict() == {
+        "state": "open",
+        "consecutive_failures": 3,
+        "backoff_seconds": 240.0,
+        "retry_at": (NOW + BACKOFF_STEP * 4).isoformat(),
+        "last_error": "ConnectionError",
+        "times_opened": 1,
+    }
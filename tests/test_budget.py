@@ -0,0 +1,72 @@
+"""Tests for the API request budget ledger."""
+
+import datetime as dt
+
+from custom_components.kia_uvo.budget import (
+    RequestBudget,
+    RequestFamily,
+    RequestLedger,
+    next_midnight,
+)
+
+TODAY = dt.date(2026, 1, 1)
+NOON = dt.datetime(2026, 1, 1, 12, 0, tzinfo=dt.UTC)
+
+
+def test_ledger_counts_by_family_and_rolls_over() -> None:
+    ledger = RequestLedger(day=TODAY)
+    ledger.record(RequestFamily.CACHED, TODAY, calls=3)
+    ledger.record(RequestFamily.CONTROL, TODAY)
+    assert ledger.total == 4
+    assert ledger.counts[RequestFamily.CACHED] == 3
+
+    ledger.record(RequestFamily.FORCED, TODAY + dt.timedelta(days=1))
+    assert ledger.day == TODAY + dt.timedelta(days=1)
+    assert ledger.total == 1
+
+
+def test_ledger_round_trips_through_storage() -> None:
+    ledger = RequestLedger(day=TODAY)
+    ledger.record(RequestFamily.FORCED, TODAY, calls=2)
+    restored = RequestLedger.from_dict(ledger.as_dict(), TODAY)
+    assert restored == ledger
+
+
+def test_stale_or_corrupt_storage_starts_fresh() -> None:
+    ledger = RequestLedger(day=TODAY)
+    ledger.record(RequestFamily.CACHED, TODAY, calls=5)
+    tomorrow = TODAY + dt.timedelta(days=1)
+    assert RequestLedger.from_dict(ledger.as_dict(), tomorrow).total == 0
+    assert RequestLedger.from_dict({"day": "garbage"}, TODAY).total == 0
+    assert RequestLedger.from_dict(None, TODAY).total == 0
+
+
+def test_reserve_is_kept_for_commands() -> None:
+    budget = RequestBudget(daily_budget=100, command_reserve=20)
+    ledger = RequestLedger(day=TODAY)
+    ledger.record(RequestFamily.CACHED, TODAY, calls=79)
+    assert budget.allows_poll(ledger)
+    ledger.record(RequestFamily.CACHED, TODAY)
+    assert not budget.allows_poll(ledger)
+    assert budget.remaining(ledger) == 20
+
+
+def test_no_budget_never_paces_or_pauses() -> None:
+    budget = RequestBudget(daily_budget=0, command_reserve=20)
+    ledger = RequestLedger(day=TODAY)
+    ledger.record(RequestFamily.CACHED, TODAY, calls=10_000)
+    assert budget.allows_poll(ledger)
+    assert budget.remaining(ledger) is None
+    assert budget.pacing_interval(ledger, NOON, 1) == 0
+
+
+def test_pacing_spreads_polls_over_rest_of_day() -> None:
+    budget = RequestBudget(daily_budget=68, command_reserve=20)
+    ledger = RequestLedger(day=TODAY)
+    # 48 polls left for 12 hours: one every 15 minutes, or every 30 for two cars.
+    assert budget.pacing_interval(ledger, NOON, 1) == 900
+    assert budget.pacing_interval(ledger, NOON, 2) == 1800
+
+
+def test_next_midnight_keeps_timezone() -> None:
+    assert next_midnight(NOON) == dt.datetime(2026, 1, 2, tzinfo=dt.UTC)
@@ -0,0 +1,64 @@
+"""Tests for the per-vehicle capability index."""
+
+from hyundai_kia_connect_api import Vehicle
+from hyundai_kia_connect_api.const import ENGINE_TYPES
+from hyundai_kia_connect_api.Vehicle import DailyDrivingStats
+
+from custom_components.kia_uvo.capabilities import CapabilityIndex
+
+
+def _vehicle(**values) -> Vehicle:
+    vehicle = Vehicle(id="v1", name="test", model="test")
+    for name, value in values.items():
+        setattr(vehicle, name, value)
+    return vehicle
+
+
+def test_has_follows_field_presence() -> None:
+    capabilities = CapabilityIndex().get(_vehicle(ev_battery_percentage=80))
+    assert capabilities.has("ev_battery_percentage")
+    assert not capabilities.has("ev_charge_limits_ac")
+
+
+def test_sensor_special_cases() -> None:
+    capabilities = CapabilityIndex().get(
+        _vehicle(engine_type=ENGINE_TYPES.EV, air_control_is_on=False)
+    )
+    assert capabilities.has_sensor("ev_charging_power")
+    assert capabilities.has_sensor("car_battery_percentage")
+    assert capabilities.has_sensor("_air_temperature")
+
+
+def test_answers_are_memoized_until_the_feature_set_changes() -> None:
+    vehicle = _vehicle(ev_battery_percentage=80)
+    index = CapabilityIndex()
+    capabilities = index.get(vehicle)
+    calls = []
+
+    def probe(v: Vehicle) -> bool:
+        calls.append(v)
+        return v.ev_charge_limits_ac is not None
+
+    assert not capabilities.supports("ac_limit", probe)
+    assert not capabilities.supports("ac_limit", probe)
+    assert len(calls) == 1
+
+    vehicle.ev_battery_percentage = 75
+    changes = {"v1": frozenset({"ev_battery_percentage"})}
+    assert index.update({"v1": vehicle}, changes) == set()
+    assert not capabilities.supports("ac_limit", probe)
+    assert len(calls) == 1
+
+    vehicle.ev_charge_limits_ac = 80
+    changes = {"v1": frozenset({"ev_charge_limits_ac"})}
+    assert index.update({"v1": vehicle}, changes) == {"v1"}
+    assert capabilities.supports("ac_limit", probe)
+    assert index.get(vehicle) is capabilities
+
+
+def test_empty_daily_stats_is_not_a_feature() -> None:
+    vehicle = _vehicle(daily_stats=[])
+    index = CapabilityIndex()
+    assert "daily_stats" not in index.get(vehicle).features
+    vehicle.daily_stats = [DailyDrivingStats(distance=1.0)]
+    assert index.update({"v1": vehicle}, {"v1": None}) == {"v1"}
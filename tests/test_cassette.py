@@ -0,0 +1,154 @@
+"""Tests for recording raw API traffic."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+from custom_components.kia_uvo.cassette import (
+    Cassette,
+    CassetteRecorder,
+    Interaction,
+)
+from custom_components.kia_uvo.http_pool import HttpPool
+from custom_components.kia_uvo.redact import REDACTED
+
+LOGIN_URL = "https://api.example.com/tods/api/v2/login"
+STATUS_URL = "https://api.example.com/tods/api/lstvhclsts"
+
+
+def _fake_send(adapter, request, **kwargs) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response.headers["Content-Type"] = "application/json"
+    response.headers["Set-Cookie"] = "session=secret"
+    response._content = json.dumps(
+        {"result": {"accessToken": "abc", "odometer": 1234}}
+    ).encode()
+    response.url = request.url
+    response.request = request
+    return response
+
+
+def _login(session: requests.Session) -> dict:
+    return session.post(
+        LOGIN_URL + "?vin=KNA123&lang=en",
+        json={"loginId": "me@example.com", "password": "hunter2"},
+    ).json()
+
+
+async def test_records_only_wrapped_calls_on_its_sessions_redacted(
+    monkeypatch,
+) -> None:
+    monkeypatch.setattr(HTTPAdapter, "send", _fake_send)
+    session, other = requests.Session(), requests.Session()
+    recorder = CassetteRecorder(1, asyncio.get_running_loop().create_future())
+    recorder.start([session])
+    try:
+        _login(session)
+        recorder.wrap(_login)(other)
+        assert recorder.wrap(_login)(session)["result"]["accessToken"] == "abc"
+    finally:
+        cassette = recorder.stop()
+
+    assert HTTPAdapter.send is _fake_send
+    assert all("send" not in vars(adapter) for adapter in session.adapters.values())
+    assert len(cassette.interactions) == 1
+    interaction = cassette.interactions[0]
+    assert interaction.method == "POST"
+    assert "KNA123" not in interaction.url
+    assert "lang=en" in interaction.url
+    assert interaction.request["password"] == REDACTED
+    assert interaction.response == {
+        "result": {"accessToken": REDACTED, "odometer": 1234}
+    }
+    assert interaction.headers == {"Content-Type": "application/json"}
+
+
+async def test_recorders_share_the_pooled_adapter(monkeypatch) -> None:
+    monkeypatch.setattr(HTTPAdapter, "send", _fake_send)
+    pool = HttpPool()
+    first = SimpleNamespace(session=requests.Session())
+    second = SimpleNamespace(session=requests.Session())
+    pool.attach(first)
+    pool.attach(second)
+    loop = asyncio.get_running_loop()
+    recorders = [CassetteRecorder(1, loop.create_future()) for _ in range(2)]
+    recorders[0].start([first.session])
+    recorders[1].start([second.session])
+
+    recorders[1].wrap(_login)(second.session)
+    assert len(recorders[0].stop().interactions) == 0
+    assert "send" in vars(pool.adapter)
+    recorders[1].wrap(_login)(second.session)
+    assert len(recorders[1].stop().interactions) == 2
+    assert "send" not in vars(pool.adapter)
+
+
+async def test_vehicle_ids_become_placeholders(monkeypatch) -> None:
+    vehicle_id = "250f6bc1-66e7-5d4d-840a-dd8bdfefa4e7"
+
+    def send(adapter, request, **kwargs) -> requests.Response:
+        response = _fake_send(adapter, request)
+        response._content = json.dumps(
+            {"vehicleId": vehicle_id, "pAuth": "secret"}
+        ).encode()
+        return response
+
+    monkeypatch.setattr(HTTPAdapter, "send", send)
+    session = requests.Session()
+    recorder = CassetteRecorder(
+        1, asyncio.get_running_loop().create_future(), vehicle_ids=[vehicle_id]
+    )
+    recorder.start([session])
+    try:
+        recorder.wrap(session.get)(
+            f"https://api.example.com/tods/api/vehicles/{vehicle_id}/status"
+            f"?vehicleId={vehicle_id}"
+        )
+    finally:
+        cassette = recorder.stop()
+
+    interaction = cassette.interactions[0]
+    assert vehicle_id not in json.dumps(cassette.as_dict())
+    assert interaction.url == (
+        "https://api.example.com/tods/api/vehicles/vehicle-1/status?vehicleId=vehicle-1"
+    )
+    assert interaction.response == {"vehicleId": "vehicle-1", "pAuth": REDACTED}
+
+
+async def test_session_resolves_after_target_cycles() -> None:
+    recorder = CassetteRecorder(2, asyncio.get_running_loop().create_future())
+    recorder.cycle_done()
+    assert not recorder.done.done()
+    recorder.cycle_done()
+    assert recorder.done.done()
+
+
+def _interaction(url: str, odometer: int) -> Interaction:
+    return Interaction(
+        method="POST",
+        url=url,
+        request=None,
+        status=200,
+        headers={"Content-Type": "application/json"},
+        response={"odometer": odometer},
+    )
+
+
+def test_dump_and_load_round_trip(tmp_path) -> None:
+    cassette = Cassette(
+        metadata={"region": 2, "brand": 1},
+        interactions=[_interaction(STATUS_URL, 1), _interaction(STATUS_URL, 2)],
+    )
+    path = tmp_path / "cassette.json.gz"
+    cassette.dump(path)
+    assert Cassette.load(path) == cassette
+
+
+def test_unknown_version_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        Cassette.from_dict({"version": 99, "interactions": []})
@@ -0,0 +1,153 @@
+"""Tests for per-vehicle change tracking."""
+
+from unittest.mock import MagicMock
+
+from hyundai_kia_connect_api import Vehicle
+
+from custom_components.kia_uvo.changes import (
+    SCHEDULE_FIELD,
+    VehicleChangeTracker,
+    has_changed,
+    watched_fields,
+)
+from custom_components.kia_uvo.coordinator import (
+    HyundaiKiaConnectDataUpdateCoordinator,
+)
+from custom_components.kia_uvo.polling import PollingState
+from custom_components.kia_uvo.scheduler import VehicleRefreshScheduler
+from custom_components.kia_uvo.sensor import (
+    SENSOR_DESCRIPTIONS,
+    HyundaiKiaConnectSensor,
+    PollingIntervalSensor,
+)
+
+
+def test_first_snapshot_reports_unknown() -> None:
+    tracker = VehicleChangeTracker()
+    assert tracker.update({"car1": Vehicle(id="car1")}) == {"car1": None}
+    assert has_changed(None, watched_fields("odometer"))
+
+
+def test_unchanged_poll_reports_nothing() -> None:
+    tracker = VehicleChangeTracker()
+    vehicle = Vehicle(id="car1")
+    vehicle.odometer = (1000, "km")
+    tracker.update({"car1": vehicle})
+    changes = tracker.update({"car1": vehicle})
+    assert changes == {"car1": frozenset()}
+    assert not has_changed(changes["car1"], watched_fields("odometer"))
+    assert not has_changed(changes["car1"], None)
+
+
+def test_changed_field_wakes_only_its_entities() -> None:
+    tracker = VehicleChangeTracker()
+    vehicle = Vehicle(id="car1")
+    vehicle.odometer = (1000, "km")
+    tracker.update({"car1": vehicle})
+    vehicle.odometer = (1010, "km")
+    changed = tracker.update({"car1": vehicle})["car1"]
+    assert "odometer" in changed
+    assert has_changed(changed, watched_fields("odometer"))
+    assert not has_changed(changed, watched_fields("_air_temperature"))
+    assert has_changed(changed, None)
+
+
+def test_unit_change_wakes_the_value_entity() -> None:
+    tracker = VehicleChangeTracker()
+    vehicle = Vehicle(id="car1")
+    vehicle.odometer = (1000, "km")
+    tracker.update({"car1": vehicle})
+    vehicle.odometer = (1000, "mi")
+    changed = tracker.update({"car1": vehicle})["car1"]
+    assert changed == frozenset({"odometer_unit"})
+    assert has_changed(changed, watched_fields("odometer"))
+
+
+def test_noisy_fields_only_wake_explicit_watchers() -> None:
+    tracker = VehicleChangeTracker()
+    vehicle = Vehicle(id="car1")
+    vehicle.data = {"a": 1}
+    tracker.update({"car1": vehicle})
+    vehicle.data = {"a": 2}
+    changed = tracker.update({"car1": vehicle})["car1"]
+    assert not has_changed(changed, None)
+    assert has_changed(changed, frozenset({"data"}))
+
+
+def test_removed_vehicle_is_forgotten() -> None:
+    tracker = VehicleChangeTracker()
+    tracker.update({"car1": Vehicle(id="car1")})
+    tracker.update({})
+    assert tracker.update({"car1": Vehicle(id="car1")}) == {"car1": None}
+
+
+def test_in_place_change_of_raw_data_is_detected() -> None:
+    tracker = VehicleChangeTracker()
+    vehicle = Vehicle(id="car1")
+    vehicle.data = {"status": {"doorLock": True}}
+    tracker.update({"car1": vehicle})
+    vehicle.data["status"] = {"doorLock": False}
+    changed = tracker.update({"car1": vehicle})["car1"]
+    assert changed == frozenset({"data"})
+    assert has_changed(changed, frozenset({"data", "name"}))
+    assert tracker.update({"car1": vehicle})["car1"] == frozenset()
+
+
+def test_schedule_change_wakes_only_schedule_watchers() -> None:
+    tracker = VehicleChangeTracker()
+    vehicle = Vehicle(id="car1")
+    tracker.update({"car1": vehicle}, {"car1": (1800, PollingState.NORMAL)})
+    changed = tracker.update({"car1": vehicle}, {"car1": (7200, PollingState.IDLE)})
+    assert changed == {"car1": frozenset({SCHEDULE_FIELD})}
+    assert has_changed(changed["car1"], frozenset({SCHEDULE_FIELD}))
+    assert not has_changed(changed["car1"], None)
+
+
+def test_polling_interval_sensor_follows_normal_to_idle() -> None:
+    vehicle = Vehicle(id="car1")
+    coordinator = MagicMock()
+    coordinator.last_update_success = True
+    coordinator.vehicle_manager.vehicles = {"car1": vehicle}
+    coordinator.scheduler = VehicleRefreshScheduler(1800, 86400)
+    coordinator.polling_states = {"car1": PollingState.NORMAL}
+    tracker = VehicleChangeTracker()
+
+    def update_listeners() -> None:
+        coordinator.changed_fields = tracker.update(
+            coordinator.vehicle_manager.vehicles,
+            HyundaiKiaConnectDataUpdateCoordinator._polling_schedules(coordinator),
+        )
+        sensor._handle_coordinator_update()
+
+    sensor = PollingIntervalSensor(coordinator, vehicle)
+    sensor.async_write_ha_state = MagicMock()
+    update_listeners()
+    assert sensor.native_value == 30
+    sensor.async_write_ha_state.reset_mock()
+
+    # The vehicle parks: no vehicle field moves, only its polling schedule.
+    coordinator.polling_states["car1"] = PollingState.IDLE
+    coordinator.scheduler.set_intervals("car1", 7200, 86400)
+    update_listeners()
+    sensor.async_write_ha_state.assert_called_once()
+    assert sensor.native_value == 120
+    assert sensor.extra_state_attributes == {"polling_state": "idle"}
+
+    sensor.async_write_ha_state.reset_mock()
+    update_listeners()
+    sensor.async_write_ha_state.assert_not_called()
+
+
+def test_tire_pressure_unit_change_wakes_tire_sensors() -> None:
+    tracker = VehicleChangeTracker()
+    vehicle = Vehicle(id="car1")
+    vehicle.tire_pressure_unit = 1
+    tracker.update({"car1": vehicle})
+    vehicle.tire_pressure_unit = 0
+    changed = tracker.update({"car1": vehicle})["car1"]
+    assert changed == frozenset({"tire_pressure_unit"})
+
+    for description in SENSOR_DESCRIPTIONS:
+        if description.key.startswith("tire_pressure_"):
+            sensor = HyundaiKiaConnectSensor(MagicMock(), description, vehicle)
+            assert has_changed(changed, sensor._watched_fields), description.key
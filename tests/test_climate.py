@@ -0,0 +1,44 @@
+"""Tests that climate entity calls go through the coordinator's commands."""
+
+from unittest.mock import AsyncMock, MagicMock, call, patch
+
+from homeassistant.components.climate import HVACMode
+from hyundai_kia_connect_api import Vehicle
+
+from custom_components.kia_uvo import climate
+
+
+def _entity() -> climate.HyundaiKiaCarClimateControlSwitch:
+    vehicle = Vehicle(id="car1", name="test", model="test")
+    vehicle.air_control_is_on = True
+    vehicle.air_temperature = (20, "C")
+    coordinator = MagicMock()
+    coordinator.async_start_climate = AsyncMock()
+    coordinator.async_stop_climate = AsyncMock()
+    entity = climate.HyundaiKiaCarClimateControlSwitch(coordinator, vehicle)
+    entity.async_write_ha_state = MagicMock()
+    return entity
+
+
+async def test_hvac_mode_sends_climate_commands() -> None:
+    entity = _entity()
+    await entity.async_set_hvac_mode(HVACMode.HEAT)
+    entity.coordinator.async_start_climate.assert_awaited_once_with(
+        "car1", entity.climate_config
+    )
+    await entity.async_set_hvac_mode(HVACMode.OFF)
+    entity.coordinator.async_stop_climate.assert_awaited_once_with("car1")
+
+
+async def test_temperature_change_restarts_climate_through_commands() -> None:
+    entity = _entity()
+    manager = MagicMock()
+    manager.attach_mock(entity.coordinator.async_stop_climate, "stop")
+    manager.attach_mock(entity.coordinator.async_start_climate, "start")
+    with patch.object(climate, "CLIMATE_RESTART_DELAY", 0):
+        await entity.async_set_temperature(temperature=22)
+    assert manager.mock_calls == [
+        call.stop("car1"),
+        call.start("car1", entity.climate_config),
+    ]
+    assert entity.climate_config.set_temp == 22
@@ -0,0 +1,143 @@
+"""Tests for single-flight coalescing of on-demand refreshes."""
+
+import asyncio
+
+import pytest
+
+from custom_components.kia_uvo.coalesce import (
+    RefreshCoalescer,
+    RefreshKind,
+    RefreshRequest,
+)
+
+
+class _Backend:
+    """Records refreshes and holds each one until released."""
+
+    def __init__(self) -> None:
+        self.runs: list[RefreshRequest] = []
+        self.release = asyncio.Event()
+        self.error: Exception | None = None
+
+    async def run(self, request: RefreshRequest) -> None:
+        self.runs.append(request)
+        await self.release.wait()
+        if self.error is not None:
+            raise self.error
+
+
+def _coalescer(backend: _Backend) -> RefreshCoalescer:
+    return RefreshCoalescer(backend.run, asyncio.create_task)
+
+
+def test_covers_and_merge() -> None:
+    all_forced = RefreshRequest(RefreshKind.FORCED)
+    one_cached = RefreshRequest(RefreshKind.CACHED, frozenset({"car1"}))
+    two_forced = RefreshRequest(RefreshKind.FORCED, frozenset({"car1", "car2"}))
+
+    assert all_forced.covers(one_cached)
+    assert two_forced.covers(one_cached)
+    assert not one_cached.covers(two_forced)
+    assert not two_forced.covers(RefreshRequest(RefreshKind.CACHED))
+    assert one_cached.merge(
+        RefreshRequest(RefreshKind.FORCED, frozenset({"car2"}))
+    ) == RefreshRequest(RefreshKind.FORCED, frozenset({"car1", "car2"}))
+    assert one_cached.merge(all_forced) == all_forced
+
+
+async def test_covered_requests_join_the_inflight_refresh() -> None:
+    backend = _Backend()
+    coalescer = _coalescer(backend)
+    first = asyncio.create_task(coalescer.async_request(RefreshKind.FORCED))
+    await asyncio.sleep(0)
+    others = [
+        asyncio.create_task(coalescer.async_request(RefreshKind.CACHED)),
+        asyncio.create_task(coalescer.async_request(RefreshKind.FORCED, ["car1"])),
+    ]
+    await asyncio.sleep(0)
+    backend.release.set()
+    await asyncio.gather(first, *others)
+
+    assert backend.runs == [RefreshRequest(RefreshKind.FORCED)]
+    assert (coalescer.runs, coalescer.joined) == (1, 2)
+
+
+async def test_forced_request_upgrades_the_pending_refresh() -> None:
+    backend = _Backend()
+    coalescer = _coalescer(backend)
+    first = asyncio.create_task(coalescer.async_request(RefreshKind.CACHED, ["car1"]))
+    await asyncio.sleep(0)
+    queued = [
+        asyncio.create_task(coalescer.async_request(RefreshKind.CACHED)),
+        asyncio.create_task(coalescer.async_request(RefreshKind.FORCED, ["car2"])),
+        asyncio.create_task(coalescer.async_request(RefreshKind.CACHED, ["car3"])),
+    ]
+    await asyncio.sleep(0)
+    backend.release.set()
+    await asyncio.gather(first, *queued)
+
+    assert backend.runs == [
+        RefreshRequest(RefreshKind.CACHED, frozenset({"car1"})),
+        RefreshRequest(RefreshKind.FORCED),
+    ]
+    assert coalescer.as_dict() == {
+        "runs": 2,
+        "joined": 2,
+        "in_flight": False,
+        "pending": False,
+    }
+
+
+async def test_joined_callers_get_the_error() -> None:
+    backend = _Backend()
+    backend.error = RuntimeError("backend down")
+    coalescer = _coalescer(backend)
+    first = asyncio.create_task(coalescer.async_request(RefreshKind.FORCED))
+    await asyncio.sleep(0)
+    joined = asyncio.create_task(coalescer.async_request(RefreshKind.CACHED))
+    await asyncio.sleep(0)
+    backend.release.set()
+
+    for task in (first, joined):
+        with pytest.raises(RuntimeError, match="backend down"):
+            await task
+    backend.error = None
+    await coalescer.async_request(RefreshKind.CACHED)
+    assert len(backend.runs) == 2
+
+
+async def test_cancelled_caller_leaves_the_merged_refresh_running() -> None:
+    backend = _Backend()
+    coalescer = _coalescer(backend)
+    first = asyncio.create_task(coalescer.async_request(RefreshKind.CACHED, ["car1"]))
+    await asyncio.sleep(0)
+    creator = asyncio.create_task(coalescer.async_request(RefreshKind.FORCED))
+    merged = asyncio.create_task(coalescer.async_request(RefreshKind.CACHED))
+    await asyncio.sleep(0)
+
+    creator.cancel()
+    first.cancel()
+    await asyncio.sleep(0)
+    assert creator.cancelled() and first.cancelled()
+    backend.release.set()
+    await merged
+
+    assert backend.runs == [
+        RefreshRequest(RefreshKind.CACHED, frozenset({"car1"})),
+        RefreshRequest(RefreshKind.FORCED),
+    ]
+
+
+async def test_shutdown_cancels_waiting_callers() -> None:
+    backend = _Backend()
+    coalescer = _coalescer(backend)
+    first = asyncio.create_task(coalescer.async_request(RefreshKind.CACHED))
+    await asyncio.sleep(0)
+    queued = asyncio.create_task(coalescer.async_request(RefreshKind.FORCED))
+    await asyncio.sleep(0)
+
+    await coalescer.async_shutdown()
+    for task in (first, queued):
+        with pytest.raises(asyncio.CancelledError):
+            await task
+    assert backend.runs == [RefreshRequest(RefreshKind.CACHED)]
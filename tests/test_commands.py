@@ -0,0 +1,117 @@
+"""Tests for the per-vehicle command queue."""
+
+import asyncio
+
+from hyundai_kia_connect_api import WindowRequestOptions
+from hyundai_kia_connect_api.const import WINDOW_STATE
+
+from custom_components.kia_uvo.commands import (
+    VehicleCommand,
+    VehicleCommandQueue,
+    merge_window_options,
+)
+
+
+class _Recorder:
+    """Runs commands by recording them, optionally blocking the first."""
+
+    def __init__(self) -> None:
+        self.sent: list[tuple[str, object]] = []
+        self.release = asyncio.Event()
+
+    async def run(self, command: VehicleCommand) -> None:
+        if not self.sent:
+            self.sent.append((command.label, command.payload))
+            await self.release.wait()
+            return
+        self.sent.append((command.label, command.payload))
+
+
+def _queue(recorder: _Recorder) -> VehicleCommandQueue:
+    return VehicleCommandQueue("car1", recorder.run, asyncio.create_task)
+
+
+def _command(label: str, **kwargs) -> VehicleCommand:
+    return VehicleCommand(label=label, send=lambda _: None, **kwargs)
+
+
+async def test_commands_queue_behind_in_flight_one() -> None:
+    recorder = _Recorder()
+    queue = _queue(recorder)
+    first = asyncio.create_task(queue.async_submit(_command("lock", key="lock")))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(queue.async_submit(_command("climate")))
+    await asyncio.sleep(0)
+    assert queue.in_flight.label == "lock"
+    assert [c.label for c in queue.pending] == ["climate"]
+
+    recorder.release.set()
+    await asyncio.gather(first, second)
+    assert [label for label, _ in recorder.sent] == ["lock", "climate"]
+
+
+async def test_later_value_supersedes_queued_one() -> None:
+    recorder = _Recorder()
+    queue = _queue(recorder)
+    busy = asyncio.create_task(queue.async_submit(_command("busy")))
+    await asyncio.sleep(0)
+    first = asyncio.create_task(
+        queue.async_submit(_command("limits", key="charge_limits", payload=80))
+    )
+    second = asyncio.create_task(
+        queue.async_submit(_command("limits", key="charge_limits", payload=90))
+    )
+    await asyncio.sleep(0)
+    assert [c.payload for c in queue.pending] == [90]
+
+    recorder.release.set()
+    await asyncio.gather(busy, first, second)
+    assert recorder.sent[1:] == [("limits", 90)]
+
+
+async def test_stop_cancels_queued_start() -> None:
+    recorder = _Recorder()
+    queue = _queue(recorder)
+    busy = asyncio.create_task(queue.async_submit(_command("busy")))
+    await asyncio.sleep(0)
+    start = asyncio.create_task(
+        queue.async_submit(_command("start climate", key="climate_start"))
+    )
+    await asyncio.sleep(0)
+    stop = asyncio.create_task(
+        queue.async_submit(
+            _command("stop climate", cancels=frozenset({"climate_start"}))
+        )
+    )
+    await asyncio.sleep(0)
+    await asyncio.wait_for(start, timeout=1)
+    assert [c.label for c in queue.pending] == ["stop climate"]
+
+    recorder.release.set()
+    await asyncio.gather(busy, stop)
+    assert [label for label, _ in recorder.sent] == ["busy", "stop climate"]
+
+
+def test_window_requests_merge() -> None:
+    merged = merge_window_options(
+        WindowRequestOptions(front_left=WINDOW_STATE.OPEN),
+        WindowRequestOptions(
+            front_left=WINDOW_STATE.CLOSED, back_right=WINDOW_STATE.OPEN
+        ),
+    )
+    assert merged.front_left == WINDOW_STATE.CLOSED
+    assert merged.back_right == WINDOW_STATE.OPEN
+    assert merged.front_right is None
+
+
+async def test_failure_reaches_every_folded_caller() -> None:
+    async def fail(command: VehicleCommand) -> None:
+        raise RuntimeError("boom")
+
+    queue = VehicleCommandQueue("car1", fail, asyncio.create_task)
+    results = await asyncio.gather(
+        queue.async_submit(_command("a", key="k")),
+        queue.async_submit(_command("b", key="k")),
+        return_exceptions=True,
+    )
+    assert all(isinstance(result, RuntimeError) for result in results)
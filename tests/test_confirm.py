@@ -0,0 +1,67 @@
+"""Tests for async action confirmation."""
+
+from hyundai_kia_connect_api.const import ORDER_STATUS
+
+from custom_components.kia_uvo.confirm import async_confirm_action
+
+
+class _FakeTime:
+    """Clock and sleep that advance virtual time instantly."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def clock(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _probe(*statuses: ORDER_STATUS):
+    remaining = list(statuses)
+
+    async def probe() -> ORDER_STATUS:
+        return remaining.pop(0)
+
+    return probe
+
+
+async def test_backs_off_until_final_state() -> None:
+    fake = _FakeTime()
+    result = await async_confirm_action(
+        _probe(ORDER_STATUS.PENDING, ORDER_STATUS.PENDING, ORDER_STATUS.SUCCESS),
+        60,
+        clock=fake.clock,
+        sleep=fake.sleep,
+    )
+    assert result.status is ORDER_STATUS.SUCCESS
+    assert result.probes == 3
+    assert fake.sleeps == [2.0, 4.0, 8.0]
+    assert result.latency == 14.0
+
+
+async def test_delay_is_capped() -> None:
+    fake = _FakeTime()
+    await async_confirm_action(
+        _probe(*[ORDER_STATUS.PENDING] * 5, ORDER_STATUS.FAILED),
+        300,
+        clock=fake.clock,
+        sleep=fake.sleep,
+    )
+    assert fake.sleeps == [2.0, 4.0, 8.0, 15.0, 15.0, 15.0]
+
+
+async def test_deadline_returns_timeout() -> None:
+    fake = _FakeTime()
+    result = await async_confirm_action(
+        _probe(*[ORDER_STATUS.PENDING] * 10),
+        20,
+        clock=fake.clock,
+        sleep=fake.sleep,
+    )
+    assert result.status is ORDER_STATUS.TIMEOUT
+    assert fake.sleeps == [2.0, 4.0, 8.0, 6.0]
+    assert result.latency == 20.0
@@ -0,0 +1,61 @@
+"""Tests for the date-keyed daily driving stats index."""
+
+import datetime as dt
+from types import SimpleNamespace
+
+from hyundai_kia_connect_api.Vehicle import DailyDrivingStats
+
+from custom_components.kia_uvo.daily_stats import DailyStatsIndex, DailyStatsIndexes
+
+DAY = dt.date(2026, 3, 1)
+
+
+def _stats(day: dt.date, distance: float) -> DailyDrivingStats:
+    return DailyDrivingStats(
+        date=dt.datetime.combine(day, dt.time()),
+        total_consumed=1000,
+        engine_consumption=800,
+        climate_consumption=100,
+        onboard_electronics_consumption=50,
+        battery_care_consumption=30,
+        regenerated_energy=200,
+        distance=distance,
+    )
+
+
+def test_index_keys_days_and_looks_up_today() -> None:
+    index = DailyStatsIndex()
+    index.update([_stats(DAY, 12.5), _stats(DAY - dt.timedelta(days=1), 3.0)])
+    assert len(index) == 2
+    assert index.days["2026-03-01"]["distance"] == 12.5
+    today = index.today(DAY)
+    assert today["today_date"] == "2026-03-01"
+    assert today["distance"] == 12.5
+    assert index.today(DAY) is today
+
+
+def test_today_rolls_over_to_zeros() -> None:
+    index = DailyStatsIndex()
+    index.update([_stats(DAY, 12.5)])
+    tomorrow = index.today(DAY + dt.timedelta(days=1))
+    assert tomorrow["today_date"] == "2026-03-02"
+    assert tomorrow["total_consumed"] == 0
+    assert tomorrow["distance"] == 0
+
+
+def test_indexes_rebuild_only_changed_vehicles() -> None:
+    vehicle = SimpleNamespace(id="v1", daily_stats=[_stats(DAY, 1.0)])
+    indexes = DailyStatsIndexes()
+    index = indexes.get(vehicle)
+    days = index.days
+
+    vehicle.daily_stats = [_stats(DAY, 2.0)]
+    indexes.update({"v1": vehicle}, {"v1": frozenset({"odometer"})})
+    assert index.days is days
+
+    indexes.update({"v1": vehicle}, {"v1": frozenset({"daily_stats"})})
+    assert index.days["2026-03-01"]["distance"] == 2.0
+    assert indexes.get(vehicle) is index
+
+    indexes.update({}, {})
+    assert indexes.get(vehicle) is not index
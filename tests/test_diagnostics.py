@@ -9,15 +9,19 @@ from __future__ import annotations
 import asyncio
 import datetime
 import threading
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from hyundai_kia_connect_api.Token import Token
 from hyundai_kia_connect_api.Vehicle import Vehicle
 
 from custom_components.kia_uvo import diagnostics as diagnostics_mod
+from custom_components.kia_uvo.breaker import CircuitBreaker
+from custom_components.kia_uvo.coalesce import RefreshCoalescer
 from custom_components.kia_uvo.const import DOMAIN
 from custom_components.kia_uvo.diagnostics import async_get_config_entry_diagnostics
+from custom_components.kia_uvo.executor import LibraryExecutor
+from custom_components.kia_uvo.metrics import ApiMetrics
 from custom_components.kia_uvo.redact import REDACTED
 
 
@@ -28,6 +32,11 @@ def _make_coordinator(token: Token | None = None) -> MagicMock:
     vm.token = token
     coordinator = MagicMock()
     coordinator.vehicle_manager = vm
+    coordinator.last_action_results = {}
+    coordinator.api_metrics = ApiMetrics()
+    coordinator.executor = LibraryExecutor(1, "test")
+    coordinator.breaker = CircuitBreaker()
+    coordinator.refreshes = RefreshCoalescer(AsyncMock(), MagicMock())
     return coordinator
 
 
@@ -6,7 +6,9 @@ from hyundai_kia_connect_api import Vehicle
 from hyundai_kia_connect_api.const import ENGINE_TYPES
 
 from custom_components.kia_uvo import sensor as sensor_platform
+from custom_components.kia_uvo.capabilities import CapabilityIndex
 from custom_components.kia_uvo.const import DOMAIN
+from custom_components.kia_uvo.factories import EntityFactories
 
 
 async def _charging_power_entity(engine_type: ENGINE_TYPES | None, value: float | None):
@@ -16,6 +18,8 @@ async def _charging_power_entity(engine_type: ENGINE_TYPES | None, value: float
 
     coordinator = MagicMock()
     coordinator.vehicle_manager.vehicles = {"v1": vehicle}
+    coordinator.capabilities = CapabilityIndex()
+    coordinator.entity_factories = EntityFactories()
     hass = MagicMock()
     config_entry = MagicMock()
     config_entry.unique_id = "uid"
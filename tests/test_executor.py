@@ -0,0 +1,65 @@
+"""Tests for the integration's own executor for library calls."""
+
+import asyncio
+import threading
+
+import pytest
+
+from custom_components.kia_uvo.executor import LibraryExecutor
+
+
+async def test_runs_jobs_on_named_threads() -> None:
+    executor = LibraryExecutor(2, "kia_uvo_test")
+    try:
+        name = await executor.async_add_job(
+            asyncio.get_running_loop(), lambda: threading.current_thread().name
+        )
+    finally:
+        executor.shutdown()
+    assert name.startswith("kia_uvo_test")
+    assert executor.as_dict() == {
+        "threads": 2,
+        "busy": 0,
+        "queued": 0,
+        "peak_busy": 1,
+        "peak_queued": 1,
+    }
+
+
+async def test_counts_queued_and_busy_calls() -> None:
+    loop = asyncio.get_running_loop()
+    executor = LibraryExecutor(1, "kia_uvo_test")
+    release = threading.Event()
+    started = threading.Event()
+
+    def blocking() -> str:
+        started.set()
+        release.wait(5)
+        return "done"
+
+    try:
+        first = executor.async_add_job(loop, blocking)
+        second = executor.async_add_job(loop, blocking)
+        await loop.run_in_executor(None, started.wait, 5)
+        assert (executor.busy, executor.queued) == (1, 1)
+        release.set()
+        assert await asyncio.gather(first, second) == ["done", "done"]
+    finally:
+        release.set()
+        executor.shutdown()
+    assert (executor.busy, executor.queued) == (0, 0)
+    assert executor.peak_busy == 1
+
+
+async def test_errors_propagate_and_free_the_thread() -> None:
+    executor = LibraryExecutor(1, "kia_uvo_test")
+
+    def fail() -> None:
+        raise ValueError("backend down")
+
+    try:
+        with pytest.raises(ValueError, match="backend down"):
+            await executor.async_add_job(asyncio.get_running_loop(), fail)
+    finally:
+        executor.shutdown()
+    assert executor.busy == 0
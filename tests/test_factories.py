@@ -0,0 +1,59 @@
+"""Tests for adding vehicle entities after setup."""
+
+from types import SimpleNamespace
+
+from custom_components.kia_uvo.factories import EntityFactories
+
+
+def _vehicle(vehicle_id: str, **fields) -> SimpleNamespace:
+    return SimpleNamespace(id=vehicle_id, **fields)
+
+
+def _build(vehicle: SimpleNamespace) -> list[SimpleNamespace]:
+    keys = ["lock"]
+    if vehicle.charge_limit is not None:
+        keys.append("charge_limit")
+    return [SimpleNamespace(unique_id=f"{vehicle.id}_{key}") for key in keys]
+
+
+def _ids(added: list[list[SimpleNamespace]]) -> list[list[str]]:
+    return [[entity.unique_id for entity in batch] for batch in added]
+
+
+def test_register_adds_entities_for_current_vehicles() -> None:
+    added = []
+    factories = EntityFactories()
+    factories.register(_build, added.append, [_vehicle("v1", charge_limit=None)])
+    assert _ids(added) == [["v1_lock"]]
+
+
+def test_new_fields_and_vehicles_add_only_new_entities() -> None:
+    added = []
+    v1 = _vehicle("v1", charge_limit=None)
+    factories = EntityFactories()
+    factories.register(_build, added.append, [v1])
+
+    assert factories.add_new({"v1": v1}, set()) == 0
+
+    v1.charge_limit = 80
+    assert factories.add_new({"v1": v1}, {"v1"}) == 1
+    assert _ids(added)[-1] == ["v1_charge_limit"]
+    assert factories.add_new({"v1": v1}, {"v1"}) == 0
+
+    v2 = _vehicle("v2", charge_limit=None)
+    assert factories.add_new({"v1": v1, "v2": v2}, set()) == 1
+    assert _ids(added)[-1] == ["v2_lock"]
+
+
+def test_update_before_add_and_unregister() -> None:
+    calls = []
+    factories = EntityFactories()
+    unregister = factories.register(
+        _build,
+        lambda entities, update: calls.append(update),
+        [_vehicle("v1", charge_limit=None)],
+        update_before_add=True,
+    )
+    assert calls == [True]
+    unregister()
+    assert factories.add_new({"v2": _vehicle("v2", charge_limit=1)}, set()) == 0
@@ -0,0 +1,100 @@
+"""Tests for the HTTP connection pool shared across config entries."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from custom_components.kia_uvo.http_pool import (
+    HTTP_POOL_KEY,
+    HttpPool,
+    SharedHTTPAdapter,
+    async_close_http_pool,
+    async_get_http_pool,
+    count_requests,
+)
+
+
+class _PinnedAdapter(HTTPAdapter):
+    """Like the US APIs' TLS adapters."""
+
+
+def test_attach_shares_one_adapter_between_accounts() -> None:
+    pool = HttpPool()
+    first = SimpleNamespace(session=requests.Session())
+    second = SimpleNamespace(sessions=requests.Session())
+
+    assert pool.attach(first) == 1
+    assert pool.attach(second) == 1
+
+    url = "https://api.example.com/tods/api/v2/login"
+    assert first.session.get_adapter(url) is pool.adapter
+    assert second.sessions.get_adapter(url) is pool.adapter
+    assert pool.sessions == 2
+
+
+def test_attach_keeps_region_specific_adapters() -> None:
+    pool = HttpPool()
+    session = requests.Session()
+    pinned = _PinnedAdapter()
+    session.mount("https://", pinned)
+
+    assert pool.attach(SimpleNamespace(session=session)) == 0
+    assert session.get_adapter("https://api.example.com/") is pinned
+
+
+def _ok(adapter, request, **kwargs) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response.url = request.url
+    response.request = request
+    return response
+
+
+def test_counts_requests_of_wrapped_calls_on_every_attached_session() -> None:
+    pool = HttpPool()
+    pooled, pinned = requests.Session(), requests.Session()
+    pinned.mount("https://", _PinnedAdapter())
+    pool.attach(SimpleNamespace(session=pooled, sessions=pinned))
+    counted = []
+
+    def login() -> None:
+        pooled.get("https://api.example.com/login")
+        pinned.post("https://api.example.com/token")
+
+    with patch.object(HTTPAdapter, "send", _ok):
+        login()
+        count_requests(login, lambda: counted.append(1))()
+        login()
+
+    assert len(counted) == 2
+
+
+def test_attach_ignores_apis_without_sessions() -> None:
+    assert HttpPool().attach(SimpleNamespace(session=None)) == 0
+
+
+def test_closing_a_session_leaves_the_pool_open() -> None:
+    pool = HttpPool()
+    session = requests.Session()
+    pool.attach(SimpleNamespace(session=session))
+    with patch.object(pool.adapter.poolmanager, "clear") as clear:
+        session.close()
+        clear.assert_not_called()
+        pool.close()
+        clear.assert_called_once()
+
+
+def test_pool_is_created_once_and_dropped_on_close() -> None:
+    hass = MagicMock()
+    hass.data = {}
+
+    pool = async_get_http_pool(hass)
+    assert isinstance(pool.adapter, SharedHTTPAdapter)
+    assert async_get_http_pool(hass) is pool
+
+    async_close_http_pool(hass)
+    assert HTTP_POOL_KEY not in hass.data
+    async_close_http_pool(hass)
+    assert async_get_http_pool(hass) is not pool
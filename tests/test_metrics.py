@@ -0,0 +1,58 @@
+"""Tests for library call metrics."""
+
+import pytest
+
+from custom_components.kia_uvo.metrics import ApiMetrics, percentile
+
+
+class _Clock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_percentile_nearest_rank() -> None:
+    samples = [float(n) for n in range(1, 101)]
+    assert percentile(samples, 50) == 50.0
+    assert percentile(samples, 95) == 95.0
+    assert percentile(samples, 99) == 99.0
+    assert percentile([3.0], 99) == 3.0
+    assert percentile([], 50) is None
+
+
+async def test_timed_call_splits_queue_wait_from_latency() -> None:
+    clock = _Clock()
+    metrics = ApiMetrics(clock)
+
+    async def add_executor_job(job):
+        clock.now += 0.5  # waiting for a thread
+        return job()
+
+    def library_call(value):
+        clock.now += 2.0  # backend round trip
+        return value
+
+    assert await metrics.async_timed("update", add_executor_job, library_call, 7) == 7
+    stats = metrics.operations["update"]
+    assert stats.latency(50) == 2.0
+    assert stats.queue_wait(50) == 0.5
+    assert stats.successes == 1
+
+
+async def test_errors_counted_by_type_and_reraised() -> None:
+    metrics = ApiMetrics(_Clock())
+
+    async def add_executor_job(job):
+        return job()
+
+    def failing_call():
+        raise TimeoutError
+
+    with pytest.raises(TimeoutError):
+        await metrics.async_timed("lock", add_executor_job, failing_call)
+    assert metrics.total.errors == {"TimeoutError": 1}
+    assert metrics.as_dict()["operations"]["lock"]["calls"] == 1
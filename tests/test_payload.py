@@ -0,0 +1,30 @@
+"""Tests for raw vehicle payloads served on demand."""
+
+import datetime as dt
+from types import SimpleNamespace
+
+from custom_components.kia_uvo.payload import payload_digest, vehicle_payload
+
+
+def test_digest_is_stable_and_content_based() -> None:
+    assert payload_digest({"a": 1, "b": [1, 2]}) == payload_digest(
+        {"b": [1, 2], "a": 1}
+    )
+    assert payload_digest({"a": 1}) != payload_digest({"a": 2})
+    assert len(payload_digest({"a": 1})) == 16
+    assert payload_digest(None) is None
+
+
+def test_vehicle_payload() -> None:
+    updated_at = dt.datetime(2026, 1, 1, 12, 0, tzinfo=dt.UTC)
+    vehicle = SimpleNamespace(
+        name="EV6", data={"odometer": 1200}, last_updated_at=updated_at
+    )
+    assert vehicle_payload(vehicle) == {
+        "vehicle_name": "EV6",
+        "digest": payload_digest({"odometer": 1200}),
+        "updated_at": "2026-01-01T12:00:00+00:00",
+        "vehicle_data": {"odometer": 1200},
+    }
+    vehicle.last_updated_at = None
+    assert vehicle_payload(vehicle)["updated_at"] is None
@@ -0,0 +1,90 @@
+"""Tests for the state-adaptive polling policy."""
+
+import datetime as dt
+
+from hyundai_kia_connect_api import Vehicle
+
+from custom_components.kia_uvo.polling import PollingPolicy, PollingState
+
+NOW = dt.datetime(2026, 1, 1, 12, 0, tzinfo=dt.UTC)
+
+POLICY = PollingPolicy(
+    scan_interval=1800,
+    force_refresh_interval=86400,
+    active_interval=300,
+    idle_interval=7200,
+)
+
+
+def _vehicle(age: dt.timedelta | None = dt.timedelta(minutes=5)) -> Vehicle:
+    vehicle = Vehicle(id="car1")
+    if age is not None:
+        vehicle.last_updated_at = NOW - age
+    return vehicle
+
+
+def test_charging_vehicle_is_active() -> None:
+    vehicle = _vehicle(age=dt.timedelta(hours=5))
+    vehicle.ev_battery_is_charging = True
+    assert POLICY.state(vehicle, NOW) is PollingState.ACTIVE
+    assert POLICY.intervals(PollingState.ACTIVE) == (300, 86400)
+
+
+def test_climate_or_engine_is_active() -> None:
+    vehicle = _vehicle()
+    vehicle.air_control_is_on = True
+    assert POLICY.state(vehicle, NOW) is PollingState.ACTIVE
+    vehicle.air_control_is_on = False
+    vehicle.engine_is_running = True
+    assert POLICY.state(vehicle, NOW) is PollingState.ACTIVE
+
+
+def test_recently_reported_vehicle_is_normal() -> None:
+    assert POLICY.state(_vehicle(), NOW) is PollingState.NORMAL
+    assert POLICY.state(_vehicle(age=None), NOW) is PollingState.NORMAL
+    assert POLICY.intervals(PollingState.NORMAL) == (1800, 86400)
+
+
+def test_parked_vehicle_backs_off() -> None:
+    assert POLICY.state(_vehicle(age=dt.timedelta(hours=2)), NOW) is PollingState.IDLE
+    assert POLICY.intervals(PollingState.IDLE) == (7200, 86400)
+
+
+def test_idle_stretches_short_force_interval() -> None:
+    policy = PollingPolicy(
+        scan_interval=1800,
+        force_refresh_interval=5400,
+        active_interval=300,
+        idle_interval=7200,
+    )
+    assert policy.intervals(PollingState.IDLE) == (7200, 7200)
+
+
+def test_scan_interval_is_clamped_to_bounds() -> None:
+    policy = PollingPolicy(
+        scan_interval=60,
+        force_refresh_interval=86400,
+        active_interval=300,
+        idle_interval=7200,
+    )
+    assert policy.intervals(PollingState.NORMAL) == (300, 86400)
+
+
+def test_default_options_never_poll_faster_than_scan_interval() -> None:
+    policy = PollingPolicy.from_options(
+        scan_interval=10800,
+        force_refresh_interval=86400,
+        active_interval=0,
+        idle_interval=7200,
+    )
+    assert {policy.intervals(state)[0] for state in PollingState} == {10800}
+
+
+def test_configured_active_interval_tightens_polling() -> None:
+    policy = PollingPolicy.from_options(
+        scan_interval=1800,
+        force_refresh_interval=86400,
+        active_interval=300,
+        idle_interval=7200,
+    )
+    assert policy == POLICY
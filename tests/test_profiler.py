@@ -0,0 +1,35 @@
+"""Tests for the refresh-cycle profiler."""
+
+import asyncio
+
+from custom_components.kia_uvo.profiler import RefreshProfiler, profile_summary
+
+
+def _busy(n: int) -> int:
+    return sum(range(n))
+
+
+async def test_session_resolves_after_target_cycles() -> None:
+    profiler = RefreshProfiler(2, asyncio.get_running_loop().create_future())
+    profiler.start()
+    try:
+        profiler.cycle_done()
+        assert not profiler.done.done()
+        profiler.cycle_done()
+        assert profiler.done.done()
+    finally:
+        profiler.stop()
+
+
+async def test_executor_calls_are_merged_into_summary() -> None:
+    loop = asyncio.get_running_loop()
+    profiler = RefreshProfiler(1, loop.create_future())
+    profiler.start()
+    try:
+        assert await loop.run_in_executor(None, profiler.wrap(_busy), 1000) == 499500
+    finally:
+        stats = profiler.stop()
+
+    summary = profile_summary(stats, top=500)
+    assert any(row["function"].endswith("(_busy)") for row in summary)
+    assert len(profile_summary(stats, top=3)) == 3
@@ -56,6 +56,18 @@ def test_redacts_credential_keys() -> None:
     assert redact({"secret": "x"}) == {"secret": REDACTED}
 
 
+def test_redacts_pauth() -> None:
+    assert redact({"pAuth": "x"}) == {"pAuth": REDACTED}
+
+
+def test_extra_keys_and_kept_placeholders() -> None:
+    payload = {"vehicleId": "vehicle-1", "vehicleKey": "x", "pAuth": "vehicle-1"}
+    assert redact(payload) == {**payload, "pAuth": REDACTED}
+    assert redact(
+        payload, extra=("vehicleid", "vehiclekey"), keep=frozenset({"vehicle-1"})
+    ) == {"vehicleId": "vehicle-1", "vehicleKey": REDACTED, "pAuth": "vehicle-1"}
+
+
 def test_redacts_vin_exact_only() -> None:
     # the actual Vehicle field is `VIN` (normalized: vin) -> redacted
     assert redact({"VIN": "WVW123"}) == {"VIN": REDACTED}
@@ -99,3 +111,24 @@ def test_scalars_untouched() -> None:
     assert redact("string") == "string"
     assert redact(42) == 42
     assert redact(None) is None
+
+
+def test_keep_structure_redacts_inside_sensitive_containers() -> None:
+    payload = {
+        "token": {"accessToken": "a", "tokenType": "Bearer", "expireIn": 86400},
+        "coord": {"lat": 52.1, "lon": 4.3, "type": 0},
+        "vin": "KNA123",
+        "odometer": 1234,
+    }
+    assert redact(payload, keep_structure=True) == {
+        "token": {"accessToken": REDACTED, "tokenType": REDACTED, "expireIn": 86400},
+        "coord": {"lat": 0.0, "lon": 0.0, "type": 0},
+        "vin": REDACTED,
+        "odometer": 1234,
+    }
+    assert redact(payload)["token"] == REDACTED
+
+
+def test_redacts_login_names() -> None:
+    assert redact({"loginId": "me@example.com"}) == {"loginId": REDACTED}
+    assert redact({"username": "me"}) == {"username": REDACTED}
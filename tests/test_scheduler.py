@@ -0,0 +1,118 @@
+"""Tests for per-vehicle refresh scheduling.
+
+Uses real Vehicle() instances; the scheduler is plain Python with no HA
+runtime, so the tests drive it with explicit timestamps.
+"""
+
+import datetime as dt
+
+from hyundai_kia_connect_api import Vehicle
+
+from custom_components.kia_uvo.scheduler import (
+    MAX_JITTER,
+    MIN_UPDATE_INTERVAL,
+    RETRY_INTERVAL,
+    VehicleRefreshScheduler,
+)
+
+NOW = dt.datetime(2026, 1, 1, 12, 0, tzinfo=dt.UTC)
+
+
+def _scheduler() -> VehicleRefreshScheduler:
+    scheduler = VehicleRefreshScheduler(scan_interval=1800, force_refresh_interval=7200)
+    scheduler.sync(["car1", "car2"])
+    return scheduler
+
+
+def test_new_vehicles_are_due_immediately() -> None:
+    assert sorted(_scheduler().due(NOW)) == ["car1", "car2"]
+
+
+def test_only_due_vehicle_is_returned() -> None:
+    scheduler = _scheduler()
+    scheduler.mark_refreshed("car1", NOW)
+    scheduler.set_intervals("car2", scan_interval=300, force_refresh_interval=7200)
+    scheduler.mark_refreshed("car2", NOW)
+
+    later = NOW + dt.timedelta(seconds=301)
+    assert scheduler.due(later) == ["car2"]
+    assert scheduler.next_update_interval(NOW) == dt.timedelta(seconds=300)
+
+
+def test_force_interval_shorter_than_scan_wakes_earlier() -> None:
+    scheduler = _scheduler()
+    scheduler.set_intervals("car1", scan_interval=1800, force_refresh_interval=600)
+    scheduler.mark_refreshed("car1", NOW)
+    assert scheduler.get("car1").next_refresh == NOW + dt.timedelta(seconds=600)
+
+
+def test_force_due_follows_vehicle_data_age() -> None:
+    scheduler = _scheduler()
+    vehicle = Vehicle(id="car1")
+    assert scheduler.is_force_due(vehicle, NOW) is False  # never reported
+
+    vehicle.last_updated_at = NOW - dt.timedelta(hours=1)
+    assert scheduler.is_force_due(vehicle, NOW) is False
+
+    # The library never moves last_updated_at backwards; use a fresh vehicle.
+    vehicle = Vehicle(id="car1")
+    vehicle.last_updated_at = NOW - dt.timedelta(hours=3)
+    assert scheduler.is_force_due(vehicle, NOW) is True
+
+
+def test_failed_vehicle_retries_without_spinning() -> None:
+    scheduler = _scheduler()
+    scheduler.mark_refreshed("car2", NOW)
+    scheduler.mark_failed("car1", NOW)
+    assert scheduler.due(NOW) == []
+    assert scheduler.due(NOW + RETRY_INTERVAL) == ["car1"]
+
+
+def test_overdue_vehicle_floors_update_interval() -> None:
+    assert _scheduler().next_update_interval(NOW) == MIN_UPDATE_INTERVAL
+
+
+def test_sync_drops_removed_vehicles() -> None:
+    scheduler = _scheduler()
+    scheduler.sync(["car1"])
+    assert scheduler.due(NOW) == ["car1"]
+
+
+def test_due_returns_one_wave_most_overdue_first() -> None:
+    scheduler = VehicleRefreshScheduler(scan_interval=1800, force_refresh_interval=7200)
+    scheduler.sync(["car1", "car2", "car3"])
+    scheduler.defer("car1", NOW - dt.timedelta(minutes=1))
+    scheduler.defer("car2", NOW - dt.timedelta(minutes=5))
+    scheduler.defer("car3", NOW - dt.timedelta(minutes=3))
+    assert scheduler.due(NOW, limit=2) == ["car2", "car3"]
+    assert scheduler.due(NOW) == ["car2", "car3", "car1"]
+
+
+def test_jitter_is_stable_per_entry_and_vehicle() -> None:
+    def next_refreshes(seed: str) -> list[dt.datetime]:
+        scheduler = VehicleRefreshScheduler(
+            scan_interval=1800, force_refresh_interval=7200, jitter_seed=seed
+        )
+        cars = [f"car{i}" for i in range(20)]
+        scheduler.sync(cars)
+        for car in cars:
+            scheduler.mark_refreshed(car, NOW)
+        return [scheduler.get(car).next_refresh for car in cars]
+
+    first = next_refreshes("entry1")
+    assert first == next_refreshes("entry1")
+    assert first != next_refreshes("entry2")
+    assert len(set(first)) > 1
+    for next_refresh in first:
+        delay = next_refresh - NOW
+        assert dt.timedelta(seconds=1800) <= delay < dt.timedelta(seconds=1980)
+
+
+def test_jitter_is_capped() -> None:
+    scheduler = VehicleRefreshScheduler(
+        scan_interval=86400, force_refresh_interval=86400, jitter_seed="entry1"
+    )
+    for car in (f"car{i}" for i in range(20)):
+        scheduler.mark_refreshed(car, NOW)
+        delay = scheduler.get(car).next_refresh - NOW
+        assert delay <= dt.timedelta(seconds=86400) + MAX_JITTER
@@ -0,0 +1,89 @@
+"""Tests for the persisted vehicle-state snapshot."""
+
+import datetime as dt
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from hyundai_kia_connect_api import Vehicle
+from hyundai_kia_connect_api.const import ENGINE_TYPES
+from hyundai_kia_connect_api.Vehicle import DayTripInfo, TripInfo
+
+from custom_components.kia_uvo.coordinator import (
+    HyundaiKiaConnectDataUpdateCoordinator,
+)
+from custom_components.kia_uvo.entity import HyundaiKiaConnectEntity
+from custom_components.kia_uvo.snapshot import (
+    decode_value,
+    snapshot_saved_at,
+    vehicles_from_dict,
+    vehicles_to_dict,
+)
+
+SAVED_AT = dt.datetime(2026, 1, 1, 9, 0, tzinfo=dt.UTC)
+
+
+def _vehicle() -> Vehicle:
+    vehicle = Vehicle(id="car1", name="EV6", engine_type=ENGINE_TYPES.EV)
+    vehicle.timezone = dt.timezone(dt.timedelta(hours=2))
+    vehicle.is_locked = True
+    vehicle.data = {"status": {"odometer": 1234}}
+    vehicle._last_updated_at = dt.datetime(2026, 1, 1, 8, 30, tzinfo=dt.UTC)
+    vehicle.ev_first_departure_time = dt.time(7, 15)
+    vehicle._day_trip_info = DayTripInfo(
+        yyyymmdd="20260101",
+        summary=TripInfo(drive_time=20, distance=12.5),
+        trip_list=[TripInfo(hhmmss="081500", distance=12.5)],
+    )
+    return vehicle
+
+
+def test_vehicle_round_trips_through_json() -> None:
+    stored = json.loads(json.dumps(vehicles_to_dict({"car1": _vehicle()}, SAVED_AT)))
+    restored = vehicles_from_dict(stored)["car1"]
+    assert snapshot_saved_at(stored) == SAVED_AT
+
+    assert restored == _vehicle()
+    assert restored.engine_type is ENGINE_TYPES.EV
+    assert restored.last_updated_at == dt.datetime(2026, 1, 1, 8, 30, tzinfo=dt.UTC)
+    assert restored.timezone.utcoffset(None) == dt.timedelta(hours=2)
+
+
+def test_missing_or_unreadable_snapshot_restores_nothing() -> None:
+    assert vehicles_from_dict(None) == {}
+    assert vehicles_from_dict({"vehicles": {"car1": {"__type": "bogus"}}}) == {}
+
+
+def test_only_library_classes_are_rebuilt() -> None:
+    with pytest.raises(ValueError):
+        decode_value({"__type": "dataclass", "class": "os:PathLike", "fields": {}})
+
+
+async def _warm_start(saved_at: dt.datetime) -> HyundaiKiaConnectEntity:
+    """A coordinator restored from a snapshot whose first refresh failed."""
+    coordinator = MagicMock()
+    coordinator._snapshot_store.async_load = AsyncMock(
+        return_value=vehicles_to_dict({"car1": _vehicle()}, saved_at)
+    )
+    assert await HyundaiKiaConnectDataUpdateCoordinator.async_restore_snapshot(
+        coordinator
+    )
+    coordinator.last_update_success = False
+    coordinator.restored_state_is_fresh = lambda: (
+        HyundaiKiaConnectDataUpdateCoordinator.restored_state_is_fresh(coordinator)
+    )
+    return HyundaiKiaConnectEntity(
+        coordinator, coordinator.vehicle_manager.vehicles["car1"]
+    )
+
+
+async def test_warm_start_stays_available_after_a_failed_refresh() -> None:
+    entity = await _warm_start(dt.datetime.now(dt.UTC) - dt.timedelta(hours=1))
+    assert entity.available
+    entity.coordinator.restored_at = None  # cleared by the first success
+    assert not entity.available
+
+
+async def test_stale_snapshot_does_not_keep_entities_available() -> None:
+    entity = await _warm_start(dt.datetime.now(dt.UTC) - dt.timedelta(days=2))
+    assert not entity.available
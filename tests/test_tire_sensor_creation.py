@@ -19,7 +19,9 @@ from hyundai_kia_connect_api import Vehicle
 from hyundai_kia_connect_api.KiaUvoApiAU import KiaUvoApiAU
 
 from custom_components.kia_uvo import sensor as sensor_platform
+from custom_components.kia_uvo.capabilities import CapabilityIndex
 from custom_components.kia_uvo.const import DOMAIN
+from custom_components.kia_uvo.factories import EntityFactories
 
 
 def _ccs2_state(pressure_unit: int, tire_pressure: int) -> dict:
@@ -64,6 +66,8 @@ async def _created_tire_keys(vehicle: Vehicle) -> list[str]:
     """Run the real async_setup_entry and return created tire sensor keys."""
     coordinator = MagicMock()
     coordinator.vehicle_manager.vehicles = {"v1": vehicle}
+    coordinator.capabilities = CapabilityIndex()
+    coordinator.entity_factories = EntityFactories()
     hass = MagicMock()
     config_entry = MagicMock()
     config_entry.unique_id = "uid"
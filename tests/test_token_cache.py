@@ -0,0 +1,34 @@
+"""Tests for the in-loop token freshness check."""
+
+import datetime as dt
+
+from hyundai_kia_connect_api import Token
+
+from custom_components.kia_uvo.coordinator import token_is_fresh
+
+NOW = dt.datetime(2026, 1, 1, 12, 0, tzinfo=dt.UTC)
+
+
+def test_missing_token_is_not_fresh() -> None:
+    assert not token_is_fresh(None, NOW)
+    assert not token_is_fresh(Token(valid_until=None), NOW)
+
+
+def test_token_far_from_expiry_is_fresh() -> None:
+    assert token_is_fresh(Token(valid_until=NOW + dt.timedelta(hours=2)), NOW)
+
+
+def test_token_within_margin_is_not_fresh() -> None:
+    assert not token_is_fresh(Token(valid_until=NOW + dt.timedelta(minutes=2)), NOW)
+    assert not token_is_fresh(Token(valid_until=NOW - dt.timedelta(minutes=1)), NOW)
+
+
+def test_naive_expiry_is_treated_as_utc() -> None:
+    valid_until = (NOW + dt.timedelta(hours=2)).replace(tzinfo=None)
+    assert token_is_fresh(Token(valid_until=valid_until), NOW)
+
+
+def test_ccs_expiry_is_also_checked() -> None:
+    token = Token(valid_until=NOW + dt.timedelta(hours=2))
+    token.ccs_token_valid_until = NOW + dt.timedelta(minutes=1)
+    assert not token_is_fresh(token, NOW)